@@ -1,29 +1,119 @@
 """Task Management API main module."""
 
-from app.src.core.config.config import IS_DEVELOPMENT
-from app.src.infrastructure.database.config import create_db_and_tables
+import math
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
+from app.src.core.config.config import (
+    EVENT_BUS_DRAIN_TIMEOUT_SECONDS,
+    IS_DEVELOPMENT,
+    OUTBOX_DISPATCHER_ENABLED,
+    OUTBOX_ENABLED,
+    REQUEST_TIMEOUT_HEADER_ENABLED,
+)
+from app.src.core.mediator.exceptions import (
+    CircuitOpenException,
+    DeadlineExceededException,
+)
+from app.src.core.metrics import PROMETHEUS_CONTENT_TYPE, metrics_registry
+from app.src.infrastructure.database.config import (
+    create_db_and_tables,
+    dispose_engines,
+)
+from app.src.infrastructure.dependencies import get_container
 from app.src.presentation.api.tasks import router as tasks_router
-from fastapi import FastAPI
+from app.src.presentation.middleware import (
+    DeadlineMiddleware,
+    MetricsMiddleware,
+    QueryStatsMiddleware,
+)
+from fastapi import FastAPI, Request, status
+from fastapi.responses import JSONResponse, PlainTextResponse
+
+
+@asynccontextmanager
+async def lifespan(_app: FastAPI) -> AsyncIterator[None]:
+    """Prepare shared resources on startup and release them on shutdown."""
+    # Create database tables on startup
+    await create_db_and_tables()
+    # Build the mediator and handler graph once for the application lifetime
+    container = get_container()
+    mediator = container.mediator
+    # Consumers for notifications queued with Mediator.publish_nowait, and
+    # for domain events when the outbox is disabled
+    notification_bus = mediator.notification_bus
+    if notification_bus is not None:
+        notification_bus.start()
+    # Deliver domain events stored in the outbox in the background
+    dispatch_outbox = OUTBOX_ENABLED and OUTBOX_DISPATCHER_ENABLED
+    if dispatch_outbox:
+        container.outbox_dispatcher.start()
+    yield
+    if dispatch_outbox:
+        await container.outbox_dispatcher.stop()
+    # Flush buffered writes while the bus still takes their events
+    await container.infrastructure.shutdown()
+    if notification_bus is not None:
+        await notification_bus.stop(timeout=EVENT_BUS_DRAIN_TIMEOUT_SECONDS)
+    await dispose_engines()
 
-# Create database tables on startup
-create_db_and_tables()
 
 app = FastAPI(
     title="Task Management API",
     description="API for managing tasks with FastAPI, SQLModel, and Pydantic",
     version="0.1.0",
+    lifespan=lifespan,
 )
 
+# Per-route HTTP timings, exposed at /metrics
+app.add_middleware(MetricsMiddleware)
+# Per-request SQL statement counts, slow-query and N+1 logging
+app.add_middleware(QueryStatsMiddleware)
+# Client deadlines from X-Request-Timeout-Ms
+if REQUEST_TIMEOUT_HEADER_ENABLED:
+    app.add_middleware(DeadlineMiddleware)
+
 # Include routers
 app.include_router(tasks_router)
 
 
+@app.exception_handler(CircuitOpenException)
+async def circuit_open_handler(
+    _request: Request, exception: CircuitOpenException
+) -> JSONResponse:
+    """Report requests failed fast by an open circuit as 503 Service Unavailable."""
+    return JSONResponse(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        content={"detail": "Service temporarily unavailable"},
+        headers={"Retry-After": str(max(1, math.ceil(exception.retry_after)))},
+    )
+
+
+@app.exception_handler(DeadlineExceededException)
+async def deadline_exceeded_handler(
+    _request: Request, _exception: DeadlineExceededException
+) -> JSONResponse:
+    """Report requests that ran past their deadline as 504 Gateway Timeout."""
+    return JSONResponse(
+        status_code=status.HTTP_504_GATEWAY_TIMEOUT,
+        content={"detail": "Request timed out"},
+    )
+
+
 @app.get("/")
 async def root():
     """Health check endpoint for the API."""
     return {"message": "Welcome to the Task Management API"}
 
 
+@app.get("/metrics", include_in_schema=False)
+async def metrics() -> PlainTextResponse:
+    """Metrics of this worker process in the Prometheus text format."""
+    return PlainTextResponse(
+        metrics_registry.render(), media_type=PROMETHEUS_CONTENT_TYPE
+    )
+
+
 if __name__ == "__main__":
     import uvicorn
 
@@ -0,0 +1,65 @@
+from typing import List, Optional
+
+from pydantic import ValidationError
+
+from app.src.application.tasks.commands.task_bulk_create import (
+    TaskBulkCreateCommand,
+    TaskBulkCreateItemError,
+    TaskBulkCreateResult,
+)
+from app.src.core.mediator import IRequestHandler
+from app.src.domain.aggregates.entities.task import Task, TaskBase
+from app.src.domain.aggregates.events import TaskCreatedEvent
+from app.src.domain.repositories.abstractions import ITaskRepository
+
+
+class TaskBulkCreateCommandHandler(
+    IRequestHandler[TaskBulkCreateCommand, TaskBulkCreateResult]
+):
+    """Handler for bulk task creation commands."""
+
+    def __init__(self, task_repository: ITaskRepository):
+        """Initialize handler with repository dependency."""
+        self._task_repository = task_repository
+
+    async def handle(self, request: TaskBulkCreateCommand) -> TaskBulkCreateResult:
+        """Handle the bulk task creation command.
+
+        Args:
+            request (TaskBulkCreateCommand): The command containing the items.
+
+        Returns:
+            TaskBulkCreateResult: The IDs of the created tasks, aligned with the
+                submitted items, and the validation errors of rejected items.
+        """
+        ids: List[Optional[str]] = [None] * len(request.items)
+        errors: List[TaskBulkCreateItemError] = []
+        new_tasks: List[Task] = []
+        positions: List[int] = []
+
+        # Validate each item against the task constraints; invalid items are
+        # reported and skipped instead of failing the whole batch.
+        for index, item in enumerate(request.items):
+            try:
+                task_data = TaskBase.model_validate(item)
+            except ValidationError as e:
+                errors.append(
+                    TaskBulkCreateItemError(
+                        index=index,
+                        errors=e.errors(include_url=False, include_context=False),
+                    )
+                )
+                continue
+            new_tasks.append(Task(**task_data.model_dump()))
+            positions.append(index)
+
+        # Save all valid tasks and their events with one multi-row insert per
+        # table and one commit
+        events = [
+            TaskCreatedEvent(task_id=task.id, title=task.title) for task in new_tasks
+        ]
+        saved_tasks = await self._task_repository.create_many(new_tasks, events)
+        for index, task in zip(positions, saved_tasks):
+            ids[index] = str(task.id)
+
+        return TaskBulkCreateResult(ids=ids, errors=errors)
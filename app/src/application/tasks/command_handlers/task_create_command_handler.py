@@ -1,17 +1,10 @@
 from app.src.application.tasks.commands.task_create import TaskCreateCommand
 from app.src.core.mediator import IRequestHandler
 from app.src.domain.aggregates.entities.task import Task
+from app.src.domain.aggregates.events import TaskCreatedEvent
 from app.src.domain.repositories.abstractions import ITaskRepository
 
 
-class TaskCreatedEvent:
-    """Event for task creation."""
-
-    def __init__(self, task_id: str, title: str):
-        self.task_id = task_id
-        self.title = title
-
-
 class TaskCreateCommandHandler(IRequestHandler[TaskCreateCommand, str]):
     """Handler for task creation commands."""
 
@@ -36,10 +29,11 @@ class TaskCreateCommandHandler(IRequestHandler[TaskCreateCommand, str]):
             completed=request.completed or False,
         )
 
-        # Save using repository pattern
-        saved_task = await self._task_repository.create(new_task)
-
-        # In a real application, you would also publish a TaskCreatedEvent here
-        # domain_events.publish(TaskCreatedEvent(saved_task.id, saved_task.title))
+        # Save using repository pattern; the event is stored in the outbox in
+        # the same transaction (or queued after the commit when the outbox is
+        # disabled) and published in the background
+        saved_task = await self._task_repository.create(
+            new_task, [TaskCreatedEvent(task_id=new_task.id, title=new_task.title)]
+        )
 
-        return saved_task.id
+        return str(saved_task.id)
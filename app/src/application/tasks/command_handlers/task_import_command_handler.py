@@ -0,0 +1,190 @@
+import csv
+from typing import Any, AsyncIterable, AsyncIterator, Dict, List, Optional
+
+from pydantic import ValidationError
+
+from app.src.application.tasks.commands.task_import import (
+    TaskImportCommand,
+    TaskImportLineError,
+    TaskImportResult,
+)
+from app.src.core.config.config import (
+    IMPORT_MAX_LINE_BYTES,
+    IMPORT_MAX_REPORTED_ERRORS,
+)
+from app.src.core.mediator import IRequestHandler
+from app.src.core.mediator.logger import logger
+from app.src.domain.aggregates.entities.task import Task, TaskBase
+from app.src.domain.aggregates.events import TaskCreatedEvent
+from app.src.domain.repositories.abstractions import ITaskRepository
+
+
+class TaskImportCommandHandler(IRequestHandler[TaskImportCommand, TaskImportResult]):
+    """Handler for streaming task imports."""
+
+    def __init__(
+        self,
+        task_repository: ITaskRepository,
+        max_reported_errors: int = IMPORT_MAX_REPORTED_ERRORS,
+        max_line_bytes: int = IMPORT_MAX_LINE_BYTES,
+    ):
+        """Initialize handler with repository dependency."""
+        self._task_repository = task_repository
+        self._max_reported_errors = max_reported_errors
+        self._max_line_bytes = max_line_bytes
+
+    async def handle(self, request: TaskImportCommand) -> TaskImportResult:
+        """Handle the task import command.
+
+        Lines are parsed and validated against ``TaskBase`` as they arrive and
+        loaded in batches of ``batch_size``. Invalid lines, and lines longer
+        than ``max_line_bytes``, are reported and skipped; each batch is
+        committed on its own.
+
+        Args:
+            request (TaskImportCommand): The command with the byte stream.
+
+        Returns:
+            TaskImportResult: Line, import and failure counts and line errors.
+        """
+        result = TaskImportResult(lines=0, imported=0, failed=0)
+        batch: List[Task] = []
+
+        async for number, item in _parse(
+            request.source, request.format, self._max_line_bytes
+        ):
+            result.lines += 1
+            if item is None:
+                self._record_error(
+                    result,
+                    number,
+                    [
+                        {
+                            "type": "line_too_long",
+                            "loc": [],
+                            "msg": f"Line exceeds {self._max_line_bytes} bytes",
+                        }
+                    ],
+                )
+                continue
+            try:
+                if isinstance(item, str):
+                    task_data = TaskBase.model_validate_json(item)
+                else:
+                    task_data = TaskBase.model_validate(item)
+            except ValidationError as e:
+                self._record_error(
+                    result, number, e.errors(include_url=False, include_context=False)
+                )
+                continue
+            batch.append(Task(**task_data.model_dump()))
+
+            if len(batch) >= request.batch_size:
+                result.imported += await self._copy(batch)
+                batch.clear()
+                logger.info(
+                    "Task import progress",
+                    lines=result.lines,
+                    imported=result.imported,
+                    failed=result.failed,
+                )
+
+        if batch:
+            result.imported += await self._copy(batch)
+
+        logger.info(
+            "Task import finished",
+            lines=result.lines,
+            imported=result.imported,
+            failed=result.failed,
+        )
+        return result
+
+    async def _copy(self, batch: List[Task]) -> int:
+        """Load a batch with a ``TaskCreatedEvent`` per task."""
+        events = [TaskCreatedEvent(task_id=task.id, title=task.title) for task in batch]
+        return await self._task_repository.copy_many(batch, events)
+
+    def _record_error(
+        self, result: TaskImportResult, line: int, errors: List[Any]
+    ) -> None:
+        """Count a failed line, keeping its details up to the reporting cap."""
+        result.failed += 1
+        if len(result.errors) < self._max_reported_errors:
+            result.errors.append(TaskImportLineError(line=line, errors=errors))
+        else:
+            result.errors_truncated = True
+
+
+async def _iter_lines(
+    chunks: AsyncIterable[bytes], max_line_bytes: int
+) -> AsyncIterator[Optional[str]]:
+    """Split a stream of byte chunks into decoded lines.
+
+    Only the bytes of the current line are kept, and each chunk is scanned
+    once. A line longer than ``max_line_bytes`` is skipped up to its end
+    without being buffered and yielded as ``None``.
+    """
+    pending = bytearray()
+    overlong = False
+    async for chunk in chunks:
+        view = memoryview(chunk)
+        start = 0
+        end = chunk.find(b"\n")
+        while end >= 0:
+            if overlong or len(pending) + end - start > max_line_bytes:
+                yield None
+            else:
+                pending += view[start:end]
+                yield _decode_line(pending)
+            pending.clear()
+            overlong = False
+            start = end + 1
+            end = chunk.find(b"\n", start)
+        if overlong:
+            continue
+        if len(pending) + len(chunk) - start > max_line_bytes:
+            overlong = True
+            pending.clear()
+        else:
+            pending += view[start:]
+    if overlong:
+        yield None
+    elif pending:
+        yield _decode_line(pending)
+
+
+def _decode_line(line: bytearray) -> str:
+    """Decode a line without its line break."""
+    return line.rstrip(b"\r").decode("utf-8", errors="replace")
+
+
+async def _parse(
+    chunks: AsyncIterable[bytes], format: str, max_line_bytes: int
+) -> AsyncIterator[tuple[int, Any]]:
+    """Yield (line number, item) pairs for every non-blank data line.
+
+    NDJSON items are the raw JSON text, validated directly by Pydantic; CSV
+    items are dicts keyed by the header row, with empty values omitted so
+    field defaults apply. The item of a line that is too long is ``None``.
+    """
+    header: Optional[List[str]] = None
+    number = 0
+    async for line in _iter_lines(chunks, max_line_bytes):
+        number += 1
+        if line is None:
+            yield number, None
+            continue
+        if not line.strip():
+            continue
+        if format == "ndjson":
+            yield number, line
+            continue
+        values = next(csv.reader([line]))
+        if header is None:
+            header = [name.strip() for name in values]
+            continue
+        row: Dict[str, Any] = {
+            name: value for name, value in zip(header, values) if value != ""
+        }
+        yield number, row
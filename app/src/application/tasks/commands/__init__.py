@@ -1,3 +1,5 @@
 """Task commands module."""
 
+from .task_bulk_create import *
 from .task_create import *
+from .task_import import *
@@ -0,0 +1,37 @@
+"""Bulk task creation command."""
+
+from typing import Any, Dict, List, Optional
+
+from pydantic import BaseModel, Field
+
+from app.src.core.config.config import BULK_CREATE_MAX_ITEMS
+from app.src.core.mediator.abstractions import IRequest
+from app.src.core.mediator.validated import ValidatedModel
+
+
+class TaskBulkCreateItemError(BaseModel):
+    """Validation errors for a single item of a bulk creation."""
+
+    index: int
+    errors: List[Dict[str, Any]]
+
+
+class TaskBulkCreateResult(BaseModel):
+    """Outcome of a bulk creation.
+
+    ``ids`` is aligned with the submitted items: it holds the new task ID for
+    each created item and ``None`` for each item listed in ``errors``.
+    """
+
+    ids: List[Optional[str]]
+    errors: List[TaskBulkCreateItemError] = []
+
+
+class TaskBulkCreateCommand(ValidatedModel, IRequest[TaskBulkCreateResult]):
+    """Command for creating many tasks in a single transaction.
+
+    Items are validated individually so that invalid items are reported
+    without rejecting the rest of the batch.
+    """
+
+    items: List[Dict[str, Any]] = Field(min_length=1, max_length=BULK_CREATE_MAX_ITEMS)
@@ -2,12 +2,11 @@
 
 from typing import Optional
 
-from pydantic import BaseModel
-
 from app.src.core.mediator.abstractions import IRequest
+from app.src.core.mediator.validated import ValidatedModel
 
 
-class TaskCreateCommand(BaseModel, IRequest[str]):
+class TaskCreateCommand(ValidatedModel, IRequest[str]):
     """Command for creating a task."""
 
     title: str
@@ -0,0 +1,44 @@
+"""Streaming task import command."""
+
+from typing import Any, List, Literal
+
+from pydantic import BaseModel, Field
+
+from app.src.core.config.config import IMPORT_BATCH_SIZE
+from app.src.core.mediator.abstractions import IRequest
+from app.src.core.mediator.validated import ValidatedModel
+
+
+class TaskImportLineError(BaseModel):
+    """Validation errors for a single line of an import."""
+
+    line: int
+    errors: List[Any]
+
+
+class TaskImportResult(BaseModel):
+    """Outcome of an import.
+
+    ``errors`` holds at most the configured number of line errors;
+    ``errors_truncated`` tells whether more lines failed than are listed.
+    """
+
+    lines: int
+    imported: int
+    failed: int
+    errors: List[TaskImportLineError] = []
+    errors_truncated: bool = False
+
+
+class TaskImportCommand(ValidatedModel, IRequest[TaskImportResult]):
+    """Command for importing tasks from an NDJSON or CSV byte stream.
+
+    ``source`` is an async iterable of raw byte chunks (e.g. an HTTP request
+    body). It is consumed incrementally and never buffered as a whole. CSV
+    input needs a header row naming task fields; quoted values must not
+    contain line breaks.
+    """
+
+    source: Any = Field(exclude=True)
+    format: Literal["ndjson", "csv"] = "ndjson"
+    batch_size: int = Field(default=IMPORT_BATCH_SIZE, ge=1, le=50_000)
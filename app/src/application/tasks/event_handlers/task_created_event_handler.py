@@ -0,0 +1,19 @@
+from app.src.core.mediator import INotificationHandler
+from app.src.core.mediator.logger import logger
+from app.src.domain.aggregates.events import TaskCreatedEvent
+
+
+class TaskCreatedEventHandler(INotificationHandler[TaskCreatedEvent]):
+    """Handler recording task creations in the structured log."""
+
+    async def handle(self, notification: TaskCreatedEvent) -> None:
+        """Handle the task created event.
+
+        Args:
+            notification (TaskCreatedEvent): The event of the created task.
+        """
+        logger.info(
+            "Task created",
+            task_id=str(notification.task_id),
+            title=notification.title,
+        )
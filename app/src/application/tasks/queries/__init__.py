@@ -0,0 +1,8 @@
+"""Task queries module."""
+
+from .task_count import *
+from .task_export import *
+from .task_filter import *
+from .task_get import *
+from .task_list import *
+from .task_search import *
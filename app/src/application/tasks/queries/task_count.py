@@ -0,0 +1,20 @@
+"""Task counting query."""
+
+from pydantic import BaseModel
+
+from app.src.application.tasks.queries.task_filter import TaskFilterParams
+from app.src.core.mediator.abstractions import ICacheableRequest
+
+
+class TaskCount(BaseModel):
+    """Number of tasks matching a filter."""
+
+    count: int
+
+
+class TaskCountQuery(TaskFilterParams, ICacheableRequest[TaskCount]):
+    """Query for counting tasks matching the given criteria.
+
+    Counts back dashboards that poll the same filters repeatedly, so they are
+    cached briefly and may lag behind writes by up to the cache TTL.
+    """
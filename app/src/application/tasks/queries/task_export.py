@@ -0,0 +1,21 @@
+"""Task export query."""
+
+from typing import AsyncIterator, Literal
+
+from pydantic import Field
+
+from app.src.application.tasks.queries.task_filter import TaskFilterParams
+from app.src.core.mediator.abstractions import IRequest
+from app.src.domain.aggregates.entities.task import Task
+
+
+class TaskExportQuery(TaskFilterParams, IRequest[AsyncIterator[Task]]):
+    """Query streaming every task matching the criteria, oldest first.
+
+    The response is an async iterator that must be consumed while the
+    request's database session is open; ``format`` tells the presentation
+    layer how to serialize it.
+    """
+
+    format: Literal["ndjson", "csv"] = "ndjson"
+    batch_size: int = Field(default=1000, ge=1, le=10000)
@@ -0,0 +1,46 @@
+"""Filter parameters shared by task queries."""
+
+from datetime import datetime
+from typing import Optional
+
+from pydantic import Field, model_validator
+
+from app.src.core.mediator.validated import ValidatedModel
+from app.src.domain.aggregates.value_objects.task_filter import TaskFilter
+
+
+class TaskFilterParams(ValidatedModel):
+    """Optional task criteria accepted by listing and counting queries."""
+
+    completed: Optional[bool] = None
+    min_priority: Optional[int] = Field(default=None, ge=1, le=5)
+    max_priority: Optional[int] = Field(default=None, ge=1, le=5)
+    created_after: Optional[datetime] = None
+    created_before: Optional[datetime] = None
+
+    @model_validator(mode="after")
+    def _check_ranges(self) -> "TaskFilterParams":
+        """Reject empty priority ranges and creation windows."""
+        if (
+            self.min_priority is not None
+            and self.max_priority is not None
+            and self.min_priority > self.max_priority
+        ):
+            raise ValueError("min_priority must not exceed max_priority")
+        if (
+            self.created_after is not None
+            and self.created_before is not None
+            and self.created_after >= self.created_before
+        ):
+            raise ValueError("created_after must be earlier than created_before")
+        return self
+
+    def to_filter(self) -> TaskFilter:
+        """Build the domain filter from these parameters."""
+        return TaskFilter(
+            completed=self.completed,
+            min_priority=self.min_priority,
+            max_priority=self.max_priority,
+            created_after=self.created_after,
+            created_before=self.created_before,
+        )
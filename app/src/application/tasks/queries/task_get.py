@@ -0,0 +1,14 @@
+"""Task lookup query."""
+
+import uuid
+from typing import Optional
+
+from app.src.core.mediator.abstractions import IRequest
+from app.src.core.mediator.validated import ValidatedModel
+from app.src.domain.aggregates.entities.task import TaskRead
+
+
+class TaskGetQuery(ValidatedModel, IRequest[Optional[TaskRead]]):
+    """Query for a single task by its ID."""
+
+    task_id: uuid.UUID
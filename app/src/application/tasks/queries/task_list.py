@@ -0,0 +1,43 @@
+"""Task listing query."""
+
+import uuid
+from datetime import datetime
+from typing import List, Optional
+
+from pydantic import BaseModel, Field, field_validator
+
+from app.src.application.tasks.queries.task_filter import TaskFilterParams
+from app.src.core.mediator.abstractions import IRequest
+from app.src.core.utils import decode_cursor
+from app.src.domain.aggregates.entities.task import TaskRead
+
+
+class TaskPage(BaseModel):
+    """A page of tasks with the cursor for the next page."""
+
+    items: List[TaskRead]
+    next_cursor: Optional[str] = None
+
+
+class TaskListQuery(TaskFilterParams, IRequest[TaskPage]):
+    """Query for listing tasks ordered by creation time.
+
+    Pass the ``next_cursor`` of a page as ``cursor`` to fetch the next one,
+    keeping the same filter criteria.
+    """
+
+    limit: int = Field(default=50, ge=1, le=200)
+    cursor: Optional[str] = None
+
+    @field_validator("cursor")
+    @classmethod
+    def _check_cursor(cls, value: Optional[str]) -> Optional[str]:
+        """Reject cursors that were not produced by a previous page."""
+        if value is None:
+            return value
+        values = decode_cursor(value)
+        if len(values) != 2:
+            raise ValueError("Invalid cursor")
+        datetime.fromisoformat(values[0])
+        uuid.UUID(values[1])
+        return value
@@ -0,0 +1,28 @@
+"""Task search query."""
+
+from typing import List
+
+from pydantic import BaseModel, Field
+
+from app.src.core.mediator.abstractions import IRequest
+from app.src.core.mediator.validated import ValidatedModel
+from app.src.domain.aggregates.entities.task import TaskRead
+
+
+class TaskSearchHit(TaskRead):
+    """A task matching a search, with its relevance score."""
+
+    score: float
+
+
+class TaskSearchResults(BaseModel):
+    """Search results ordered by relevance, best match first."""
+
+    items: List[TaskSearchHit]
+
+
+class TaskSearchQuery(ValidatedModel, IRequest[TaskSearchResults]):
+    """Query for searching tasks by title."""
+
+    q: str = Field(min_length=1, max_length=200)
+    limit: int = Field(default=20, ge=1, le=100)
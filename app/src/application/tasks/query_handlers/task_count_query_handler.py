@@ -0,0 +1,23 @@
+from app.src.application.tasks.queries.task_count import TaskCount, TaskCountQuery
+from app.src.core.mediator import IRequestHandler
+from app.src.domain.repositories.abstractions import ITaskRepository
+
+
+class TaskCountQueryHandler(IRequestHandler[TaskCountQuery, TaskCount]):
+    """Handler for task counting queries."""
+
+    def __init__(self, task_repository: ITaskRepository):
+        """Initialize handler with repository dependency."""
+        self._task_repository = task_repository
+
+    async def handle(self, request: TaskCountQuery) -> TaskCount:
+        """Handle the task counting query.
+
+        Args:
+            request (TaskCountQuery): The query with filter criteria.
+
+        Returns:
+            TaskCount: The number of matching tasks.
+        """
+        count = await self._task_repository.count(request.to_filter())
+        return TaskCount(count=count)
@@ -0,0 +1,25 @@
+from typing import AsyncIterator
+
+from app.src.application.tasks.queries.task_export import TaskExportQuery
+from app.src.core.mediator import IRequestHandler
+from app.src.domain.aggregates.entities.task import Task
+from app.src.domain.repositories.abstractions import ITaskRepository
+
+
+class TaskExportQueryHandler(IRequestHandler[TaskExportQuery, AsyncIterator[Task]]):
+    """Handler for task export queries."""
+
+    def __init__(self, task_repository: ITaskRepository):
+        """Initialize handler with repository dependency."""
+        self._task_repository = task_repository
+
+    async def handle(self, request: TaskExportQuery) -> AsyncIterator[Task]:
+        """Handle the task export query.
+
+        Args:
+            request (TaskExportQuery): The query with filter criteria.
+
+        Returns:
+            AsyncIterator[Task]: The matching tasks, read lazily in batches.
+        """
+        return self._task_repository.stream(request.to_filter(), request.batch_size)
@@ -0,0 +1,28 @@
+from typing import Optional
+
+from app.src.application.tasks.queries.task_get import TaskGetQuery
+from app.src.core.mediator import IRequestHandler
+from app.src.domain.aggregates.entities.task import TaskRead
+from app.src.domain.repositories.abstractions import ITaskRepository
+
+
+class TaskGetQueryHandler(IRequestHandler[TaskGetQuery, Optional[TaskRead]]):
+    """Handler for task lookup queries."""
+
+    def __init__(self, task_repository: ITaskRepository):
+        """Initialize handler with repository dependency."""
+        self._task_repository = task_repository
+
+    async def handle(self, request: TaskGetQuery) -> Optional[TaskRead]:
+        """Handle the task lookup query.
+
+        Args:
+            request (TaskGetQuery): The query with the task ID.
+
+        Returns:
+            Optional[TaskRead]: The task, or None if it does not exist.
+        """
+        task = await self._task_repository.get_by_id(request.task_id)
+        if task is None:
+            return None
+        return TaskRead.model_validate(task, from_attributes=True)
@@ -0,0 +1,46 @@
+import uuid
+from datetime import datetime
+from typing import Optional, Tuple
+
+from app.src.application.tasks.queries.task_list import TaskListQuery, TaskPage
+from app.src.core.mediator import IRequestHandler
+from app.src.core.utils import decode_cursor, encode_cursor
+from app.src.domain.aggregates.entities.task import TaskRead
+from app.src.domain.repositories.abstractions import ITaskRepository
+
+
+class TaskListQueryHandler(IRequestHandler[TaskListQuery, TaskPage]):
+    """Handler for task listing queries."""
+
+    def __init__(self, task_repository: ITaskRepository):
+        """Initialize handler with repository dependency."""
+        self._task_repository = task_repository
+
+    async def handle(self, request: TaskListQuery) -> TaskPage:
+        """Handle the task listing query.
+
+        Args:
+            request (TaskListQuery): The query with filters, page size and cursor.
+
+        Returns:
+            TaskPage: The tasks of the page and the cursor of the next page.
+        """
+        after: Optional[Tuple[datetime, uuid.UUID]] = None
+        if request.cursor is not None:
+            created_at, task_id = decode_cursor(request.cursor)
+            after = (datetime.fromisoformat(created_at), uuid.UUID(task_id))
+
+        # Fetch one extra row to learn whether another page exists
+        tasks = await self._task_repository.get_page(
+            request.limit + 1, after, request.to_filter()
+        )
+        next_cursor = None
+        if len(tasks) > request.limit:
+            tasks = tasks[: request.limit]
+            last = tasks[-1]
+            next_cursor = encode_cursor(last.created_at.isoformat(), str(last.id))
+
+        return TaskPage(
+            items=[TaskRead.model_validate(task, from_attributes=True) for task in tasks],
+            next_cursor=next_cursor,
+        )
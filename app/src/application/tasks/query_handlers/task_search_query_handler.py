@@ -0,0 +1,32 @@
+from app.src.application.tasks.queries.task_search import (
+    TaskSearchHit,
+    TaskSearchQuery,
+    TaskSearchResults,
+)
+from app.src.core.mediator import IRequestHandler
+from app.src.domain.repositories.abstractions import ITaskRepository
+
+
+class TaskSearchQueryHandler(IRequestHandler[TaskSearchQuery, TaskSearchResults]):
+    """Handler for task search queries."""
+
+    def __init__(self, task_repository: ITaskRepository):
+        """Initialize handler with repository dependency."""
+        self._task_repository = task_repository
+
+    async def handle(self, request: TaskSearchQuery) -> TaskSearchResults:
+        """Handle the task search query.
+
+        Args:
+            request (TaskSearchQuery): The query with search text and limit.
+
+        Returns:
+            TaskSearchResults: Matching tasks ranked by relevance.
+        """
+        matches = await self._task_repository.search(request.q.strip(), request.limit)
+        return TaskSearchResults(
+            items=[
+                TaskSearchHit.model_validate({**task.model_dump(), "score": score})
+                for task, score in matches
+            ]
+        )
@@ -24,3 +24,99 @@ IS_PRODUCTION: bool = ENVIRONMENT == "production"
 API_HOST: str = os.getenv("API_HOST", "0.0.0.0")
 API_PORT: int = int(os.getenv("API_PORT", "8000"))
 API_RELOAD: bool = os.getenv("API_RELOAD", "true").lower() == "true"
+
+# Bulk operations
+BULK_CREATE_MAX_ITEMS: int = int(os.getenv("BULK_CREATE_MAX_ITEMS", "5000"))
+
+# Group commit for concurrent task creation (per worker process)
+TASK_WRITE_COALESCING_ENABLED: bool = (
+    os.getenv("TASK_WRITE_COALESCING_ENABLED", "false").lower() == "true"
+)
+TASK_WRITE_COALESCING_MAX_BATCH: int = int(
+    os.getenv("TASK_WRITE_COALESCING_MAX_BATCH", "100")
+)
+TASK_WRITE_COALESCING_WINDOW_MS: float = float(
+    os.getenv("TASK_WRITE_COALESCING_WINDOW_MS", "2")
+)
+
+# Transactional outbox delivery (one dispatcher per worker process). Without
+# the outbox, domain events go through the in-process bus after the commit.
+OUTBOX_ENABLED: bool = os.getenv("OUTBOX_ENABLED", "true").lower() == "true"
+OUTBOX_DISPATCHER_ENABLED: bool = (
+    os.getenv("OUTBOX_DISPATCHER_ENABLED", "true").lower() == "true"
+)
+OUTBOX_BATCH_SIZE: int = int(os.getenv("OUTBOX_BATCH_SIZE", "100"))
+OUTBOX_POLL_INTERVAL_SECONDS: float = float(
+    os.getenv("OUTBOX_POLL_INTERVAL_SECONDS", "1")
+)
+OUTBOX_MAX_ATTEMPTS: int = int(os.getenv("OUTBOX_MAX_ATTEMPTS", "10"))
+
+# In-process background delivery for Mediator.publish_nowait (and for domain
+# events when the outbox is disabled)
+EVENT_BUS_WORKERS: int = int(os.getenv("EVENT_BUS_WORKERS", "4"))
+EVENT_BUS_MAX_QUEUE_SIZE: int = int(os.getenv("EVENT_BUS_MAX_QUEUE_SIZE", "1000"))
+EVENT_BUS_OVERFLOW_POLICY: str = os.getenv("EVENT_BUS_OVERFLOW_POLICY", "block")
+EVENT_BUS_DRAIN_TIMEOUT_SECONDS: float = float(
+    os.getenv("EVENT_BUS_DRAIN_TIMEOUT_SECONDS", "10")
+)
+
+# Read-through cache for task lookups (per worker process)
+TASK_CACHE_ENABLED: bool = os.getenv("TASK_CACHE_ENABLED", "false").lower() == "true"
+TASK_CACHE_MAX_SIZE: int = int(os.getenv("TASK_CACHE_MAX_SIZE", "10000"))
+TASK_CACHE_TTL_SECONDS: float = float(os.getenv("TASK_CACHE_TTL_SECONDS", "30"))
+
+# Response cache for cacheable mediator queries (per worker process)
+QUERY_CACHE_MAX_SIZE: int = int(os.getenv("QUERY_CACHE_MAX_SIZE", "1024"))
+QUERY_CACHE_TTL_SECONDS: float = float(os.getenv("QUERY_CACHE_TTL_SECONDS", "5"))
+
+# Fail requests fast while the database is down (per request type and worker)
+CIRCUIT_BREAKER_ENABLED: bool = (
+    os.getenv("CIRCUIT_BREAKER_ENABLED", "true").lower() == "true"
+)
+CIRCUIT_BREAKER_FAILURE_THRESHOLD: int = int(
+    os.getenv("CIRCUIT_BREAKER_FAILURE_THRESHOLD", "5")
+)
+CIRCUIT_BREAKER_RESET_TIMEOUT_SECONDS: float = float(
+    os.getenv("CIRCUIT_BREAKER_RESET_TIMEOUT_SECONDS", "30")
+)
+
+# Retry transient database errors, within a budget of RETRY_BUDGET_RATIO
+# retries per request (plus RETRY_BUDGET_MIN_PER_SECOND at low traffic)
+RETRY_ENABLED: bool = os.getenv("RETRY_ENABLED", "false").lower() == "true"
+RETRY_MAX_ATTEMPTS: int = int(os.getenv("RETRY_MAX_ATTEMPTS", "3"))
+RETRY_DELAY_SECONDS: float = float(os.getenv("RETRY_DELAY_SECONDS", "0.1"))
+RETRY_BUDGET_RATIO: float = float(os.getenv("RETRY_BUDGET_RATIO", "0.1"))
+RETRY_BUDGET_MIN_PER_SECOND: float = float(
+    os.getenv("RETRY_BUDGET_MIN_PER_SECOND", "1")
+)
+
+# Time budget of a mediator request, also applied as the PostgreSQL
+# statement_timeout of its transactions (0 disables it). Clients may shorten
+# it with an X-Request-Timeout-Ms header
+REQUEST_TIMEOUT_SECONDS: float = float(os.getenv("REQUEST_TIMEOUT_SECONDS", "30"))
+REQUEST_TIMEOUT_HEADER_ENABLED: bool = (
+    os.getenv("REQUEST_TIMEOUT_HEADER_ENABLED", "true").lower() == "true"
+)
+
+# Streaming task import
+IMPORT_BATCH_SIZE: int = int(os.getenv("IMPORT_BATCH_SIZE", "1000"))
+IMPORT_MAX_REPORTED_ERRORS: int = int(os.getenv("IMPORT_MAX_REPORTED_ERRORS", "1000"))
+# Longer lines are reported as errors instead of being buffered
+IMPORT_MAX_LINE_BYTES: int = int(os.getenv("IMPORT_MAX_LINE_BYTES", "1048576"))
+
+# SQL instrumentation
+SQL_SLOW_QUERY_MS: float = float(os.getenv("SQL_SLOW_QUERY_MS", "200"))
+SQL_N_PLUS_ONE_THRESHOLD: int = int(os.getenv("SQL_N_PLUS_ONE_THRESHOLD", "10"))
+# Adds X-DB-Query-Count / X-DB-Time-Ms to responses
+SQL_DEBUG_HEADERS: bool = (
+    os.getenv("SQL_DEBUG_HEADERS", str(IS_DEVELOPMENT)).lower() == "true"
+)
+
+# Logging: records below LOG_LEVEL are discarded; LOG_SAMPLE_RATES keeps a
+# fraction of records per event name or level, e.g. "Handling request=0.01"
+LOG_LEVEL: str = os.getenv("LOG_LEVEL", "info").strip().lower()
+LOG_SAMPLE_RATES: str = os.getenv("LOG_SAMPLE_RATES", "")
+# Write records from a background thread instead of the calling coroutine
+LOG_ASYNC: bool = os.getenv("LOG_ASYNC", "true").lower() == "true"
+LOG_QUEUE_SIZE: int = int(os.getenv("LOG_QUEUE_SIZE", "10000"))
+LOG_BATCH_SIZE: int = int(os.getenv("LOG_BATCH_SIZE", "256"))
@@ -2,8 +2,11 @@
 
 from .abstractions import *
 from .behaviors import *
+from .bus import *
+from .deadline import *
 from .decorators import *
 from .exceptions import *
 from .logger import *
 from .mediator import *
+from .validated import *
 from .validation import *
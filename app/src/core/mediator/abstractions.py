@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Generic, TypeVar
+from typing import ClassVar, Generic, Optional, TypeVar
 
 # Generic type variable for request types.
 T = TypeVar('T')
@@ -27,6 +27,27 @@ class IRequest(Generic[R], ABC):
     """
 
 
+class ICacheableRequest(IRequest[R]):
+    """
+    Marker for idempotent requests whose responses may be cached.
+
+    Requests of a cacheable type with equal content are answered from the
+    cache by ``CachingBehavior`` instead of reaching their handler. Responses
+    are shared between callers and must be treated as immutable.
+
+    Attributes:
+        cache_ttl: Seconds a response stays cached; ``None`` uses the
+            behavior's default.
+
+    Usage:
+        class CountUsersQuery(BaseModel, ICacheableRequest[int]):
+            cache_ttl: ClassVar[Optional[float]] = 5.0
+            active: bool
+    """
+
+    cache_ttl: ClassVar[Optional[float]] = None
+
+
 class IRequestHandler(Generic[T, R], ABC):
     """
     Abstract base class for handling requests in a mediator pattern.
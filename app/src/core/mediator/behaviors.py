@@ -1,18 +1,46 @@
+import asyncio
 import random
 from abc import ABC, abstractmethod
 from asyncio import sleep
-from typing import Any, Callable, Type, cast
+from functools import partial
+from time import monotonic, perf_counter
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Hashable,
+    Iterable,
+    Mapping,
+    Optional,
+    Tuple,
+    Type,
+    cast,
+)
 
 from pydantic import BaseModel, ValidationError
 
-from app.src.core.mediator.abstractions import IRequest
+from app.src.core.mediator.abstractions import ICacheableRequest, IRequest
+from app.src.core.metrics.registry import (
+    CounterChild,
+    GaugeChild,
+    HistogramChild,
+    MetricsRegistry,
+    metrics_registry,
+)
+from app.src.core.mediator.deadline import deadline_scope, remaining_time
 from app.src.core.mediator.exceptions import (
+    CircuitOpenException,
+    DeadlineExceededException,
     ExceptionHandlerRegistry,
     ValidationException,
 )
 from app.src.core.mediator.logger import logger
 from app.src.core.mediator.mediator import Mediator
+from app.src.core.mediator.validated import is_validated
 from app.src.core.mediator.validation import validator_registry
+from app.src.core.utils.cache import TTLCache
+from app.src.core.utils.resilience import CircuitBreaker, CircuitState, RetryBudget
 
 
 class IPipelineBehavior(ABC):
@@ -26,11 +54,15 @@ class IPipelineBehavior(ABC):
     This interface defines the contract that all pipeline behaviors must implement
     to participate in the request processing pipeline.
 
+    Behaviors apply to every request type by default. Set ``request_types`` (or
+    override ``applies_to``) to restrict a behavior to specific request types;
+    the pipeline then skips it entirely for everything else.
+
     Example:
         class LoggingBehavior(IPipelineBehavior):
-                print(f"Processing request: {type(request).__name__}")
+                logger.info("Processing request", request_type=type(request).__name__)
                 response = await next_handler(request)
-                print(f"Completed processing: {type(request).__name__}")
+                logger.info("Completed request", request_type=type(request).__name__)
                 return response
     """
 
@@ -47,14 +79,23 @@ class IPipelineBehavior(ABC):
             Any: The response from processing the request.
         """
 
+    request_types: Optional[Tuple[Type[Any], ...]] = None
+
+    def applies_to(self, request_type: Type[Any]) -> bool:
+        """Whether this behavior participates in pipelines for ``request_type``."""
+        if self.request_types is None:
+            return True
+        return issubclass(request_type, self.request_types)
+
 
 class LoggingBehavior(IPipelineBehavior):
     """Pipeline behavior for logging requests."""
 
     async def handle(self, request: Any, next_handler: Callable[..., Any]) -> Any:
-        logger.info(f"Handling request {type(request).__name__}")
+        request_type = type(request).__name__
+        logger.info("Handling request", request_type=request_type)
         response = await next_handler()
-        logger.info(f"Finished handling {type(request).__name__}")
+        logger.info("Finished handling request", request_type=request_type)
         return response
 
 
@@ -62,63 +103,208 @@ class ValidationBehavior(IPipelineBehavior):
     """Pipeline behavior for validating requests."""
 
     async def handle(self, request: Any, next_handler: Callable[..., Any]) -> Any:
-        print(f"[VALIDATION] Validating {type(request).__name__}")
+        logger.debug("Validating request", request_type=type(request).__name__)
         if not request.is_valid():
             raise ValueError("Request is not valid")
         return await next_handler()
 
 
 class PydanticValidationBehavior(IPipelineBehavior):
-    """Pipeline behavior for Pydantic model validation."""
+    """Pipeline behavior for Pydantic model validation.
+
+    Revalidates Pydantic requests that may hold unvalidated state: plain
+    ``BaseModel`` requests, and ``ValidatedModel`` requests built with
+    ``model_construct`` or changed since validation. ``ValidatedModel``
+    requests that are unchanged since validation pass through without work.
+    Requests of ``strict_types`` are always revalidated, in strict mode.
+    """
+
+    def __init__(self, strict_types: Iterable[Type[BaseModel]] = ()) -> None:
+        self._strict_types = tuple(strict_types)
 
     async def handle(self, request: Any, next_handler: Callable[..., Any]) -> Any:
         if isinstance(request, BaseModel):
-            try:
-                # Re-validate Pydantic model (in case it was constructed unsafely)
-                request.__class__.model_validate(request.model_dump())
-            except ValidationError as e:
-                error_dict = {str(i): error for i, error in enumerate(e.errors())}
-                logger.error(f"Validation error: {error_dict}")
-                raise ValidationException(errors=error_dict) from e
+            strict = isinstance(request, self._strict_types)
+            if strict or not is_validated(request):
+                self._revalidate(request, strict)
         return await next_handler()
 
+    @staticmethod
+    def _revalidate(request: BaseModel, strict: bool) -> None:
+        try:
+            # Unvalidated state may not serialize cleanly; validation reports it
+            data = request.model_dump(warnings=False)
+            request.__class__.model_validate(data, strict=strict)
+        except ValidationError as e:
+            error_dict = {str(i): error for i, error in enumerate(e.errors())}
+            logger.error(f"Validation error: {error_dict}")
+            raise ValidationException(errors=error_dict) from e
+
+
+class _PipelineStep:
+    """One precompiled link of a pipeline chain.
+
+    Calling the step runs its behavior with a continuation bound to the next
+    step, so a compiled chain can be reused for every request of a type.
+    """
+
+    __slots__ = ("_behavior", "_next")
+
+    def __init__(
+        self, behavior: IPipelineBehavior, next_step: Callable[[Any], Awaitable[Any]]
+    ) -> None:
+        self._behavior = behavior
+        self._next = next_step
+
+    def __call__(self, request: Any) -> Awaitable[Any]:
+        return self._behavior.handle(request, partial(self._next, request))
+
 
 class MediatorWithPipeline(Mediator):
-    """Mediator with pipeline behavior support."""
+    """Mediator with pipeline behavior support.
+
+    The behavior chain for each request type is compiled on first use and
+    cached; the cache is invalidated whenever behaviors or handlers change.
+    Behaviors that do not apply to a request type are left out of its chain.
+    """
 
     def __init__(self):
         super().__init__()
         self._pipeline: list[IPipelineBehavior] = []
+        self._compiled: Dict[Type[Any], Callable[[Any], Awaitable[Any]]] = {}
 
     def add_behavior(self, behavior: IPipelineBehavior) -> None:
         """Add a behavior to the pipeline."""
+        self._ensure_not_frozen()
         self._pipeline.append(behavior)
+        self._compiled.clear()
+
+    def register_request_handler(self, request_type: Type[Any], handler: Any) -> None:
+        """Register a request handler."""
+        super().register_request_handler(request_type, handler)
+        self._compiled.clear()
+
+    def freeze(self) -> None:
+        """Seal the dispatch tables and precompile every registered pipeline."""
+        super().freeze()
+        for request_type in self._request_handlers:
+            self._compiled[request_type] = self._compile(request_type)
 
     async def send(self, request: IRequest[Any]) -> Any:
         """Send a request through the pipeline."""
-        handler = self._request_handlers.get(type(request))
+        request_type = type(request)
+        pipeline = self._compiled.get(request_type)
+        if pipeline is None:
+            pipeline = self._compiled[request_type] = self._compile(request_type)
+        return await pipeline(request)
+
+    def _compile(self, request_type: Type[Any]) -> Callable[[Any], Awaitable[Any]]:
+        """Build the behavior chain for a request type."""
+        handler = self._request_handlers.get(request_type)
         if not handler:
-            raise ValueError(f"No handler registered for {type(request)}")
-
-        async def invoke_handler():
-            return await handler.handle(request)
+            raise ValueError(f"No handler registered for {request_type}")
 
-        # Apply middleware stack
-        pipeline = invoke_handler
+        pipeline: Callable[[Any], Awaitable[Any]] = handler.handle
         for behavior in reversed(self._pipeline):
-            pipeline = self._wrap_behavior(behavior, request, pipeline)
+            if behavior.applies_to(request_type):
+                pipeline = _PipelineStep(behavior, pipeline)
+        return pipeline
+
+
+class MetricsBehavior(IPipelineBehavior):
+    """Pipeline behavior recording latency and outcome metrics per request type.
+
+    Records, labelled by request type name:
 
-        return await pipeline()
+    - ``mediator_request_duration_seconds``: histogram of handling time
+    - ``mediator_requests_in_flight``: gauge of requests being handled
+    - ``mediator_requests_total``: counter by ``outcome`` (success or error)
+
+    The metric children of each request type are resolved once and cached,
+    so the hot path is a dict lookup, a few attribute updates and two clock
+    reads. Place it first to measure the whole pipeline.
+    """
+
+    def __init__(self, registry: MetricsRegistry = metrics_registry) -> None:
+        self._duration = registry.histogram(
+            "mediator_request_duration_seconds",
+            "Time spent handling mediator requests.",
+            ("request_type",),
+        )
+        self._in_flight = registry.gauge(
+            "mediator_requests_in_flight",
+            "Mediator requests currently being handled.",
+            ("request_type",),
+        )
+        self._requests = registry.counter(
+            "mediator_requests_total",
+            "Mediator requests handled, by outcome.",
+            ("request_type", "outcome"),
+        )
+        self._children: Dict[
+            Type[Any], Tuple[HistogramChild, GaugeChild, CounterChild, CounterChild]
+        ] = {}
+
+    async def handle(self, request: Any, next_handler: Callable[..., Any]) -> Any:
+        children = self._children.get(type(request))
+        if children is None:
+            children = self._bind(type(request))
+        duration, in_flight, succeeded, failed = children
 
-    def _wrap_behavior(
-        self, behavior: IPipelineBehavior, request: Any, next_handler: Callable[[], Any]
-    ) -> Callable[[], Any]:
-        """Wrap a behavior in the pipeline."""
-        return lambda: behavior.handle(request, next_handler)
+        in_flight.inc()
+        start = perf_counter()
+        try:
+            response = await next_handler()
+        except Exception:
+            failed.inc()
+            raise
+        else:
+            succeeded.inc()
+            return response
+        finally:
+            duration.observe(perf_counter() - start)
+            in_flight.dec()
+
+    def _bind(
+        self, request_type: Type[Any]
+    ) -> Tuple[HistogramChild, GaugeChild, CounterChild, CounterChild]:
+        """Resolve and cache the metric children of a request type."""
+        name = request_type.__name__
+        children = (
+            self._duration.labels(name),
+            self._in_flight.labels(name),
+            self._requests.labels(name, "success"),
+            self._requests.labels(name, "error"),
+        )
+        self._children[request_type] = children
+        return children
 
 
 class RetryBehavior(IPipelineBehavior):
-    """Pipeline behavior for retrying failed requests."""
+    """Pipeline behavior retrying requests that fail with a transient error.
+
+    Only exceptions in ``retryable_exceptions``, including subclasses, are
+    retried; anything else propagates at once. A request is attempted at most
+    ``retries`` times, or as many times as ``retries_by_type`` gives for its
+    type, looked up through the type's MRO, sleeping ``delay`` seconds before
+    the first retry and ``backoff_factor`` times longer before each further
+    one. Types allowed a single attempt, such as commands that are not
+    idempotent, are left out of the pipeline entirely.
+
+    Each retry is paid for from a ``RetryBudget`` that every request tops up
+    by a fraction of a retry. When a backend fails across the board the budget
+    runs out and requests fail on their first error, instead of multiplying
+    the load on the backend by ``retries`` while it is weakest. Retries are
+    counted in ``mediator_retries_total`` by request type and outcome
+    (``retried``, ``exhausted`` or ``budget_exhausted``), and
+    ``mediator_retry_budget_tokens`` reports the retries available.
+
+    A retry runs the rest of the pipeline again in the same request, and so
+    with the same database session. ``rollback`` is awaited before each retry
+    to reset that state, e.g. to roll back the failed transaction; if it
+    fails, the original error is raised. No retry is attempted when the
+    request deadline would pass before it.
+    """
 
     def __init__(
         self,
@@ -126,33 +312,300 @@ class RetryBehavior(IPipelineBehavior):
         delay: float = 0.5,
         backoff_factor: float = 2.0,
         jitter: bool = True,
+        retryable_exceptions: Tuple[Type[BaseException], ...] = (RuntimeError,),
+        budget: Optional[RetryBudget] = None,
+        rollback: Optional[Callable[[], Awaitable[None]]] = None,
+        retries_by_type: Optional[Mapping[Type[Any], int]] = None,
+        registry: MetricsRegistry = metrics_registry,
     ) -> None:
+        self.retries_by_type = dict(retries_by_type or {})
+        if retries < 1 or any(n < 1 for n in self.retries_by_type.values()):
+            raise ValueError("retries must be at least 1")
         self.retries = retries
         self.delay = delay
         self.backoff_factor = backoff_factor
         self.jitter = jitter
+        self.retryable_exceptions = retryable_exceptions
+        self.budget = budget if budget is not None else RetryBudget()
+        self.rollback = rollback
+        self._attempts: Dict[Type[Any], int] = {}
+        self._retries = registry.counter(
+            "mediator_retries_total",
+            "Mediator request retries, by outcome.",
+            ("request_type", "outcome"),
+        )
+        registry.gauge(
+            "mediator_retry_budget_tokens", "Retries available in the retry budget."
+        ).labels().set_function(self.budget.tokens)
+
+    def retries_for(self, request_type: Type[Any]) -> int:
+        """The number of attempts allowed for ``request_type``."""
+        try:
+            return self._attempts[request_type]
+        except KeyError:
+            pass
+        attempts = self.retries
+        for base in request_type.__mro__:
+            if base in self.retries_by_type:
+                attempts = self.retries_by_type[base]
+                break
+        self._attempts[request_type] = attempts
+        return attempts
+
+    def applies_to(self, request_type: Type[Any]) -> bool:
+        return super().applies_to(request_type) and self.retries_for(request_type) > 1
 
     async def handle(self, request: Any, next_handler: Callable[..., Any]) -> Any:
+        self.budget.deposit()
+        retries = self.retries_for(type(request))
         current_delay = self.delay
-        for attempt in range(1, self.retries + 1):
+        for attempt in range(1, retries + 1):
             try:
                 return await next_handler()
-            except RuntimeError as e:
-                logger.warning(f"[Retry] Attempt {attempt} failed: {e}")
-                if attempt == self.retries:
+            except self.retryable_exceptions as e:
+                request_type = type(request).__name__
+                if attempt == retries:
+                    self._retries.labels(request_type, "exhausted").inc()
                     logger.error(
-                        f"[Retry] Max retries reached for {type(request).__name__}"
+                        "Retries exhausted",
+                        request_type=request_type,
+                        attempts=attempt,
+                        error=repr(e),
                     )
-                    raise  # re-raise after max retries
+                    raise
                 sleep_time: float = current_delay
                 if self.jitter:
                     sleep_time += random.uniform(0, 0.1)
+                remaining = remaining_time()
+                if remaining is not None and remaining <= sleep_time:
+                    # The retry could not finish before the deadline
+                    raise
+                if not self.budget.try_withdraw():
+                    self._retries.labels(request_type, "budget_exhausted").inc()
+                    logger.warning(
+                        "Retry budget exhausted",
+                        request_type=request_type,
+                        attempts=attempt,
+                        error=repr(e),
+                    )
+                    raise
+                if self.rollback is not None:
+                    try:
+                        await self.rollback()
+                    except Exception:
+                        logger.warning(
+                            "Rollback before retry failed",
+                            request_type=request_type,
+                            exc_info=True,
+                        )
+                        raise e
+                self._retries.labels(request_type, "retried").inc()
+                logger.warning(
+                    "Retrying request",
+                    request_type=request_type,
+                    attempt=attempt,
+                    error=repr(e),
+                )
                 await sleep(sleep_time)
                 current_delay *= self.backoff_factor
 
 
+class CircuitBreakerBehavior(IPipelineBehavior):
+    """Pipeline behavior failing requests fast while their backend is down.
+
+    Each request type has its own ``CircuitBreaker``. Failures are exceptions
+    in ``failure_exceptions``, including subclasses, and exceptions for which
+    ``failure_predicate`` returns true, e.g. errors recognized by an error
+    code; any other exception means the backend answered and counts as a
+    success. After ``failure_threshold`` consecutive failures the circuit
+    opens and requests of that type raise ``CircuitOpenException`` without
+    reaching the handler, until ``reset_timeout`` seconds later a trial
+    request is let through.
+
+    Place it outside ``RetryBehavior`` so that a request counts once however
+    many attempts it made, and outside ``DeadlineBehavior`` with
+    ``DeadlineExceededException`` among the failures: a request cancelled
+    inside the breaker has no outcome, so a backend that hangs would
+    otherwise never open the circuit. Records, labelled by request type name:
+
+    - ``mediator_circuit_state``: 0 closed, 1 half-open, 2 open
+    - ``mediator_circuit_transitions_total``: state changes, by new ``state``
+    - ``mediator_circuit_rejected_total``: requests failed fast
+    """
+
+    _STATE_VALUES = {
+        CircuitState.CLOSED: 0.0,
+        CircuitState.HALF_OPEN: 1.0,
+        CircuitState.OPEN: 2.0,
+    }
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0,
+        half_open_max_calls: int = 1,
+        failure_exceptions: Tuple[Type[BaseException], ...] = (Exception,),
+        failure_predicate: Optional[Callable[[Exception], bool]] = None,
+        registry: MetricsRegistry = metrics_registry,
+    ) -> None:
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.half_open_max_calls = half_open_max_calls
+        self.failure_exceptions = failure_exceptions
+        self.failure_predicate = failure_predicate
+        self._state = registry.gauge(
+            "mediator_circuit_state",
+            "Circuit breaker state (0 closed, 1 half-open, 2 open).",
+            ("request_type",),
+        )
+        self._transitions = registry.counter(
+            "mediator_circuit_transitions_total",
+            "Circuit breaker state changes, by new state.",
+            ("request_type", "state"),
+        )
+        self._rejected = registry.counter(
+            "mediator_circuit_rejected_total",
+            "Requests failed fast by an open circuit breaker.",
+            ("request_type",),
+        )
+        self._breakers: Dict[Type[Any], Tuple[CircuitBreaker, CounterChild]] = {}
+
+    def breaker(self, request_type: Type[Any]) -> CircuitBreaker:
+        """The circuit breaker of ``request_type``."""
+        bound = self._breakers.get(request_type)
+        if bound is None:
+            bound = self._bind(request_type)
+        return bound[0]
+
+    async def handle(self, request: Any, next_handler: Callable[..., Any]) -> Any:
+        bound = self._breakers.get(type(request))
+        if bound is None:
+            bound = self._bind(type(request))
+        breaker, rejected = bound
+
+        if not breaker.allow():
+            rejected.inc()
+            raise CircuitOpenException(type(request).__name__, breaker.retry_after())
+        try:
+            response = await next_handler()
+        except self.failure_exceptions:
+            breaker.record_failure()
+            raise
+        except Exception as e:
+            if self.failure_predicate is not None and self.failure_predicate(e):
+                breaker.record_failure()
+            else:
+                breaker.record_success()
+            raise
+        except BaseException:
+            # Cancelled: no verdict on the backend
+            breaker.release()
+            raise
+        breaker.record_success()
+        return response
+
+    def _bind(self, request_type: Type[Any]) -> Tuple[CircuitBreaker, CounterChild]:
+        """Create and cache the circuit breaker of a request type."""
+        name = request_type.__name__
+
+        def on_state_change(state: CircuitState) -> None:
+            self._transitions.labels(name, state.value).inc()
+            log = logger.warning if state is CircuitState.OPEN else logger.info
+            log("Circuit state changed", request_type=name, state=state.value)
+
+        breaker = CircuitBreaker(
+            failure_threshold=self.failure_threshold,
+            reset_timeout=self.reset_timeout,
+            half_open_max_calls=self.half_open_max_calls,
+            on_state_change=on_state_change,
+        )
+        self._state.labels(name).set_function(
+            lambda: self._STATE_VALUES[breaker.state]
+        )
+        bound = (breaker, self._rejected.labels(name))
+        self._breakers[request_type] = bound
+        return bound
+
+
+class DeadlineBehavior(IPipelineBehavior):
+    """Pipeline behavior bounding how long a request may run.
+
+    A request gets the time budget of its type from ``timeouts``, looked up
+    through the type's MRO, or ``default_timeout``; a budget of ``None``
+    leaves the type unbounded. The budget is applied as a ``deadline_scope``,
+    so an earlier deadline set by the caller, e.g. from a client header,
+    still wins. When the deadline passes the rest of the pipeline is
+    cancelled and ``DeadlineExceededException`` is raised; so is it for a
+    request that fails after its deadline, e.g. with a statement cancelled by
+    the database's statement timeout. Expired requests are counted in
+    ``mediator_deadline_exceeded_total`` by request type.
+
+    Place it outside ``RetryBehavior`` so that retries share the budget, and
+    inside ``CircuitBreakerBehavior`` so that expired requests reach the
+    breaker as failures rather than as cancellations.
+    """
+
+    def __init__(
+        self,
+        default_timeout: Optional[float] = None,
+        timeouts: Optional[Mapping[Type[Any], Optional[float]]] = None,
+        registry: MetricsRegistry = metrics_registry,
+    ) -> None:
+        self.default_timeout = default_timeout
+        self.timeouts = dict(timeouts or {})
+        self._exceeded = registry.counter(
+            "mediator_deadline_exceeded_total",
+            "Mediator requests that ran past their deadline.",
+            ("request_type",),
+        )
+        self._budgets: Dict[Type[Any], Optional[float]] = {}
+
+    def timeout_for(self, request_type: Type[Any]) -> Optional[float]:
+        """The time budget of ``request_type``, in seconds."""
+        try:
+            return self._budgets[request_type]
+        except KeyError:
+            pass
+        budget = self.default_timeout
+        for base in request_type.__mro__:
+            if base in self.timeouts:
+                budget = self.timeouts[base]
+                break
+        self._budgets[request_type] = budget
+        return budget
+
+    async def handle(self, request: Any, next_handler: Callable[..., Any]) -> Any:
+        with deadline_scope(self.timeout_for(type(request))) as deadline:
+            if deadline is None:
+                return await next_handler()
+            remaining = deadline - monotonic()
+            if remaining <= 0:
+                raise self._exceeded_error(request)
+            timeout = asyncio.timeout(remaining)
+            try:
+                async with timeout:
+                    return await next_handler()
+            except Exception as e:
+                if not timeout.expired() and monotonic() < deadline:
+                    raise
+                raise self._exceeded_error(request) from e
+
+    def _exceeded_error(self, request: Any) -> DeadlineExceededException:
+        """Count and log an expired request and build its exception."""
+        request_type = type(request).__name__
+        self._exceeded.labels(request_type).inc()
+        logger.warning("Deadline exceeded", request_type=request_type)
+        return DeadlineExceededException(request_type)
+
+
 class ExceptionHandlingBehavior(IPipelineBehavior):
-    """Pipeline behavior for handling exceptions."""
+    """Pipeline behavior for handling exceptions.
+
+    Exceptions are mapped to handlers through the registry, including
+    subclasses of registered types. Handled exceptions are logged at debug
+    level so that an error storm does not turn into a logging storm;
+    unhandled ones are logged as warnings and re-raised.
+    """
 
     def __init__(self, registry: ExceptionHandlerRegistry):
         self.registry = registry
@@ -161,10 +614,19 @@ class ExceptionHandlingBehavior(IPipelineBehavior):
         try:
             return await next_handler()
         except Exception as e:
-            print(f"[ExceptionHandler] Caught exception: {e}")
             handler = self.registry.get_handler(e)
             if handler:
+                logger.debug(
+                    "Request failed, handled",
+                    request_type=type(request).__name__,
+                    error=repr(e),
+                )
                 return handler.handle(e, request)
+            logger.warning(
+                "Request failed",
+                request_type=type(request).__name__,
+                error=repr(e),
+            )
             raise
 
 
@@ -180,9 +642,62 @@ class FluentValidationBehavior(IPipelineBehavior):
         request_type = cast(Type[Any], type(request))
         validator = validator_registry.get(request_type)
         if validator:
-            errors = validator.validate(request)
+            errors = validator.compile()(request)
             if errors:
                 error_dict = {str(i): error for i, error in enumerate(errors)}
                 logger.error(f"Validation error: {error_dict}")
                 raise ValidationException(errors=error_dict)
         return await next_handler()
+
+
+class CachingBehavior(IPipelineBehavior):
+    """Pipeline behavior caching responses of cacheable requests.
+
+    Applies to ``ICacheableRequest`` types only. Requests are keyed on their
+    type and canonical JSON content, responses are kept in a bounded TTL
+    cache, and concurrent identical misses share a single handler call.
+    """
+
+    request_types = (ICacheableRequest,)
+
+    def __init__(self, max_size: int = 1024, ttl: float = 30.0) -> None:
+        self.cache: TTLCache[Any] = TTLCache(max_size=max_size, ttl=ttl)
+        self._in_flight: Dict[Hashable, "asyncio.Future[Any]"] = {}
+
+    async def handle(self, request: Any, next_handler: Callable[..., Any]) -> Any:
+        if not isinstance(request, BaseModel):
+            return await next_handler()
+
+        key = (type(request), request.model_dump_json())
+        cached = self.cache.get(key)
+        if cached is not None:
+            return cached
+
+        pending = self._in_flight.get(key)
+        if pending is not None:
+            # Another caller is computing the same response; share its result
+            try:
+                return await asyncio.shield(pending)
+            except asyncio.CancelledError:
+                if not pending.cancelled():
+                    raise  # This caller was cancelled
+                return await next_handler()  # The computing caller was cancelled
+
+        future: "asyncio.Future[Any]" = asyncio.get_running_loop().create_future()
+        self._in_flight[key] = future
+        try:
+            response = await next_handler()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as e:
+            future.set_exception(e)
+            future.exception()  # Mark retrieved when no caller is waiting
+            raise
+        finally:
+            del self._in_flight[key]
+
+        if response is not None:
+            self.cache.set(key, response, getattr(request, "cache_ttl", None))
+        future.set_result(response)
+        return response
@@ -0,0 +1,193 @@
+import asyncio
+from collections import deque
+from enum import Enum
+from typing import Any, Awaitable, Callable, Deque, Dict, List, Optional
+
+from .abstractions import INotification
+from .logger import logger
+
+
+class OverflowPolicy(str, Enum):
+    """What ``NotificationBus.publish`` does when the queue is full."""
+
+    # Wait for space; publishers slow down to the pace of the consumers
+    # (``publish_nowait`` cannot wait and drops instead)
+    BLOCK = "block"
+    # Discard the notification and count it
+    DROP = "drop"
+    # Keep it in an unbounded overflow buffer that is fed back into the queue
+    # as consumers catch up; memory grows instead of publishers waiting
+    SPILL = "spill"
+
+
+class NotificationBus:
+    """
+    In-process background delivery of notifications.
+
+    Notifications are put on a bounded ``asyncio.Queue`` and delivered by a
+    pool of consumer tasks, so publishers do not wait for handlers. Delivery
+    is best effort: queued notifications are lost if the process dies, and a
+    failing delivery is logged and counted, not retried.
+
+    Call ``start`` once an event loop is running and ``stop`` on shutdown;
+    ``stop`` stops accepting notifications and waits for the queued ones to
+    be delivered.
+    """
+
+    def __init__(
+        self,
+        deliver: Callable[[INotification], Awaitable[Any]],
+        workers: int = 4,
+        max_queue_size: int = 1000,
+        overflow_policy: OverflowPolicy = OverflowPolicy.BLOCK,
+    ) -> None:
+        """Initialize the bus.
+
+        Args:
+            deliver (Callable[[INotification], Awaitable[Any]]): Delivers one
+                notification to its handlers, e.g. ``Mediator.publish``.
+            workers (int): Number of consumer tasks.
+            max_queue_size (int): Capacity of the queue.
+            overflow_policy (OverflowPolicy): Behavior when the queue is full.
+        """
+        if workers < 1:
+            raise ValueError("workers must be at least 1")
+        if max_queue_size < 1:
+            raise ValueError("max_queue_size must be at least 1")
+        self._deliver = deliver
+        self._worker_count = workers
+        self._overflow_policy = overflow_policy
+        self._queue: "asyncio.Queue[INotification]" = asyncio.Queue(max_queue_size)
+        self._overflow: Deque[INotification] = deque()
+        self._workers: List["asyncio.Task[None]"] = []
+        self._accepting = False
+        self._published = 0
+        self._delivered = 0
+        self._failed = 0
+        self._dropped = 0
+        self._spilled = 0
+        self._high_water = 0
+
+    @property
+    def is_running(self) -> bool:
+        """Whether the bus accepts notifications."""
+        return self._accepting
+
+    def start(self) -> None:
+        """Start the consumer tasks."""
+        if self._workers:
+            return
+        loop = asyncio.get_running_loop()
+        self._workers = [
+            loop.create_task(self._consume(), name=f"notification-bus-{number}")
+            for number in range(self._worker_count)
+        ]
+        self._accepting = True
+
+    async def stop(self, timeout: Optional[float] = None) -> None:
+        """Stop accepting notifications and drain the queue.
+
+        Args:
+            timeout (Optional[float]): Seconds to wait for queued notifications
+                to be delivered; undelivered ones are discarded afterwards.
+        """
+        self._accepting = False
+        if not self._workers:
+            return
+        try:
+            await asyncio.wait_for(self._queue.join(), timeout)
+        except asyncio.TimeoutError:
+            logger.warning(
+                "Notification bus stopped before draining",
+                undelivered=self._queue.qsize() + len(self._overflow),
+            )
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+
+    async def publish(self, notification: INotification) -> bool:
+        """Queue a notification for delivery.
+
+        Returns:
+            bool: ``False`` if the notification was dropped because the queue
+            was full, ``True`` otherwise.
+
+        Raises:
+            RuntimeError: If the bus is not running.
+        """
+        if self._overflow_policy is not OverflowPolicy.BLOCK:
+            return self.publish_nowait(notification)
+        if not self._accepting:
+            raise RuntimeError("Notification bus is not running")
+        self._published += 1
+        await self._queue.put(notification)
+        self._high_water = max(self._high_water, self._depth())
+        return True
+
+    def publish_nowait(self, notification: INotification) -> bool:
+        """Queue a notification for delivery without waiting.
+
+        Like ``publish``, except that under the ``BLOCK`` policy a full queue
+        drops the notification instead of waiting for space.
+
+        Returns:
+            bool: ``False`` if the notification was dropped because the queue
+            was full, ``True`` otherwise.
+
+        Raises:
+            RuntimeError: If the bus is not running.
+        """
+        if not self._accepting:
+            raise RuntimeError("Notification bus is not running")
+        self._published += 1
+        if self._overflow or self._queue.full():
+            if self._overflow_policy is not OverflowPolicy.SPILL:
+                self._dropped += 1
+                return False
+            # Once spilling, keep appending to the overflow to preserve order
+            self._overflow.append(notification)
+            self._spilled += 1
+        else:
+            self._queue.put_nowait(notification)
+        self._high_water = max(self._high_water, self._depth())
+        return True
+
+    def stats(self) -> Dict[str, Any]:
+        """Return queue depth and delivery counters."""
+        return {
+            "workers": len(self._workers),
+            "queue_depth": self._queue.qsize(),
+            "overflow_depth": len(self._overflow),
+            "max_queue_size": self._queue.maxsize,
+            "high_water": self._high_water,
+            "published": self._published,
+            "delivered": self._delivered,
+            "failed": self._failed,
+            "dropped": self._dropped,
+            "spilled": self._spilled,
+        }
+
+    def _depth(self) -> int:
+        """Notifications waiting for a consumer."""
+        return self._queue.qsize() + len(self._overflow)
+
+    async def _consume(self) -> None:
+        """Deliver notifications from the queue until cancelled."""
+        while True:
+            notification = await self._queue.get()
+            try:
+                await self._deliver(notification)
+                self._delivered += 1
+            except Exception:
+                self._failed += 1
+                logger.exception(
+                    "Notification delivery failed",
+                    notification=type(notification).__name__,
+                )
+            finally:
+                # Refill before marking done so a drain never sees an empty
+                # queue while spilled notifications are still waiting
+                while self._overflow and not self._queue.full():
+                    self._queue.put_nowait(self._overflow.popleft())
+                self._queue.task_done()
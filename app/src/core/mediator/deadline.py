@@ -0,0 +1,58 @@
+"""Request deadlines.
+
+A deadline is a point in time, on the ``time.monotonic`` clock, by which the
+current request should be done. It is bound to the context, so it follows the
+request through the pipeline, into database hooks and into tasks spawned by
+the request. Nested scopes can only shorten it.
+"""
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from time import monotonic
+from typing import Iterator, Optional
+
+_current_deadline: ContextVar[Optional[float]] = ContextVar(
+    "current_deadline", default=None
+)
+
+
+def current_deadline() -> Optional[float]:
+    """The deadline of the current context, or ``None`` when unbounded."""
+    return _current_deadline.get()
+
+
+def remaining_time() -> Optional[float]:
+    """Seconds left before the current deadline (negative once it passed)."""
+    deadline = _current_deadline.get()
+    if deadline is None:
+        return None
+    return deadline - monotonic()
+
+
+@contextmanager
+def deadline_scope(timeout: Optional[float]) -> Iterator[Optional[float]]:
+    """Bound the enclosed code to ``timeout`` seconds from now.
+
+    The enclosing deadline wins when it is earlier, and a ``timeout`` of
+    ``None`` keeps it unchanged. Yields the deadline in effect.
+    """
+    deadline = _current_deadline.get()
+    if timeout is not None:
+        candidate = monotonic() + timeout
+        if deadline is None or candidate < deadline:
+            deadline = candidate
+    token = _current_deadline.set(deadline)
+    try:
+        yield deadline
+    finally:
+        _current_deadline.reset(token)
+
+
+@contextmanager
+def no_deadline() -> Iterator[None]:
+    """Lift the deadline, e.g. for work shared by several requests."""
+    token = _current_deadline.set(None)
+    try:
+        yield
+    finally:
+        _current_deadline.reset(token)
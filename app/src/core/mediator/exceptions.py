@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Any, Callable, Dict, Optional, Type
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type
 
 
 class ValidationException(Exception):
@@ -17,6 +17,40 @@ class BusinessRuleViolationException(Exception):
         super().__init__(message)
 
 
+class CircuitOpenException(Exception):
+    """Exception raised when a request is rejected by an open circuit breaker."""
+
+    def __init__(self, request_type: str, retry_after: float) -> None:
+        super().__init__(
+            f"Circuit open for {request_type}, retry in {retry_after:.1f}s"
+        )
+        self.request_type = request_type
+        self.retry_after = retry_after
+
+
+class DeadlineExceededException(Exception):
+    """Exception raised when a request runs past its deadline."""
+
+    def __init__(self, request_type: str) -> None:
+        super().__init__(f"Deadline exceeded for {request_type}")
+        self.request_type = request_type
+
+
+class NotificationPublishException(Exception):
+    """Exception raised when one or more notification handlers fail."""
+
+    def __init__(
+        self, notification: Any, errors: List[Tuple[Any, Exception]]
+    ) -> None:
+        handler_names = ", ".join(type(handler).__name__ for handler, _ in errors)
+        super().__init__(
+            f"{len(errors)} handler(s) failed for "
+            f"{type(notification).__name__}: {handler_names}"
+        )
+        self.notification = notification
+        self.errors = errors
+
+
 class IExceptionHandler(ABC):
     """Interface for exception handlers."""
 
@@ -25,22 +59,47 @@ class IExceptionHandler(ABC):
         """Handle an exception."""
 
 
+# Marks exception types not resolved yet; None is a cached "no handler"
+_UNRESOLVED: Any = object()
+
+
 class ExceptionHandlerRegistry:
-    """Registry for exception handlers."""
+    """Registry for exception handlers.
+
+    A handler registered for an exception type also handles its subclasses;
+    the handler of the nearest class in the exception's MRO wins. Resolved
+    handlers, and the absence of one, are memoized per concrete exception
+    type, so repeated failures cost one dict lookup. ``register`` clears the
+    memo.
+    """
 
     def __init__(self) -> None:
         """Initialize the registry."""
         self._handlers: dict[Type[Exception], IExceptionHandler] = {}
+        self._resolved: dict[type, Optional[IExceptionHandler]] = {}
 
     def register(
         self, exception_type: Type[Exception], handler: IExceptionHandler
     ) -> None:
         """Register an exception handler."""
         self._handlers[exception_type] = handler
+        self._resolved.clear()
 
     def get_handler(self, exception: Exception) -> Optional[IExceptionHandler]:
-        """Get handler for an exception."""
-        return self._handlers.get(type(exception))
+        """Get the handler for an exception or the nearest of its base classes."""
+        exception_type = type(exception)
+        handler = self._resolved.get(exception_type, _UNRESOLVED)
+        if handler is _UNRESOLVED:
+            handler = self._resolved[exception_type] = self._resolve(exception_type)
+        return handler
+
+    def _resolve(self, exception_type: type) -> Optional[IExceptionHandler]:
+        """Walk the MRO of ``exception_type`` for a registered handler."""
+        for base in exception_type.__mro__:
+            handler = self._handlers.get(base)
+            if handler is not None:
+                return handler
+        return None
 
 
 class ValidationExceptionHandler(IExceptionHandler):
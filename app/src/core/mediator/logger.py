@@ -1,12 +1,294 @@
-"""Structured logging configuration."""
+"""Structured logging configuration.
+
+Records are filtered, sampled and timestamped on the calling thread, then
+handed to a background writer thread that renders them as JSON and writes
+them in batches, so a log call costs the event loop a deque append instead
+of timestamp formatting, JSON encoding and a blocking write. Event values
+are rendered later on the writer thread; log immutable values (strings,
+numbers), not objects that are still being modified.
+"""
+
+import atexit
+import json
+import random
+import sys
+import threading
+import time
+from collections import deque
+from datetime import datetime, timezone
+from typing import Any, Deque, Dict, List, Mapping, Optional, TextIO
 
 import structlog
+from structlog.typing import EventDict, WrappedLogger
+
+from app.src.core.config.config import (
+    LOG_ASYNC,
+    LOG_BATCH_SIZE,
+    LOG_LEVEL,
+    LOG_QUEUE_SIZE,
+    LOG_SAMPLE_RATES,
+)
+from app.src.core.metrics.registry import metrics_registry
+
+# Levels in increasing severity, as accepted by LOG_LEVEL
+LOG_LEVELS = {
+    "debug": 10,
+    "info": 20,
+    "warning": 30,
+    "warn": 30,
+    "error": 40,
+    "critical": 50,
+}
+
+_discarded = metrics_registry.counter(
+    "log_records_discarded_total",
+    "Log records not written, by reason (sampled, queue_full).",
+    ("reason",),
+)
+
+
+class EventSampler:
+    """
+    Processor keeping a random fraction of high-volume log records.
+
+    Rates are keyed by event name or by level; an event name takes precedence
+    over its level, and records matching neither are always kept. A rate of
+    ``0.01`` keeps about one record in a hundred.
+    """
+
+    def __init__(self, rates: Mapping[str, float]):
+        self._event_rates: Dict[str, float] = {}
+        self._level_rates: Dict[str, float] = {}
+        for key, rate in rates.items():
+            if not 0 <= rate <= 1:
+                raise ValueError(f"Sample rate for {key!r} must be between 0 and 1")
+            if key.lower() in LOG_LEVELS:
+                # Records carry the canonical name of "warn"
+                level = "warning" if key.lower() == "warn" else key.lower()
+                self._level_rates[level] = rate
+            else:
+                self._event_rates[key] = rate
+
+    def __call__(
+        self, logger: WrappedLogger, method_name: str, event_dict: EventDict
+    ) -> EventDict:
+        rate = self._event_rates.get(str(event_dict.get("event")))
+        if rate is None:
+            rate = self._level_rates.get(event_dict.get("level", method_name))
+        if rate is not None and random.random() >= rate:
+            _discarded.labels("sampled").inc()
+            raise structlog.DropEvent
+        return event_dict
+
+
+class QueueLogSink:
+    """
+    Writes log records from a background thread.
+
+    ``put`` appends to a deque and wakes the writer only when the deque was
+    empty, so it never blocks and costs no lock in the common case. When
+    ``max_queue_size`` records are waiting new records are dropped and
+    counted, and the writer reports the number of dropped records once it
+    catches up. The writer takes every waiting record (``batch_size`` at a
+    time), renders them and writes each batch with a single write and flush.
+    Without a running writer, e.g. after ``close``, records are written
+    synchronously.
+    """
+
+    def __init__(
+        self,
+        stream: Optional[TextIO] = None,
+        max_queue_size: int = 10_000,
+        batch_size: int = 256,
+    ):
+        self._stream = stream
+        self._render = structlog.processors.JSONRenderer()
+        self._max_queue_size = max_queue_size
+        self._batch_size = batch_size
+        self._pending: Deque[EventDict] = deque()
+        self._wakeup = threading.Event()
+        self._closing = False
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self.dropped = 0
+        self._reported_dropped = 0
+
+    @property
+    def stream(self) -> TextIO:
+        """The output stream; ``sys.stdout`` unless one was given."""
+        return self._stream or sys.stdout
+
+    def depth(self) -> int:
+        """Records waiting for the writer."""
+        return len(self._pending)
+
+    def start(self) -> None:
+        """Start the writer thread."""
+        with self._lock:
+            if self._thread is None:
+                self._closing = False
+                self._thread = threading.Thread(
+                    target=self._run, name="log-writer", daemon=True
+                )
+                self._thread.start()
+
+    def close(self, timeout: float = 5.0) -> None:
+        """Write the waiting records and stop the writer thread."""
+        with self._lock:
+            thread, self._thread = self._thread, None
+        if thread is None:
+            return
+        self._closing = True
+        self._wakeup.set()
+        thread.join(timeout)
+        # Records put while the writer was finishing
+        self._drain()
+
+    def put(self, event_dict: EventDict) -> None:
+        """Queue a record for writing."""
+        if self._thread is None:
+            self._write([event_dict])
+            return
+        pending = self._pending
+        if len(pending) >= self._max_queue_size:
+            self.dropped += 1
+            _discarded.labels("queue_full").inc()
+            return
+        pending.append(event_dict)
+        if len(pending) == 1:
+            self._wakeup.set()
+
+    def _run(self) -> None:
+        """Write waiting records whenever woken, until closed."""
+        while not self._closing:
+            self._wakeup.wait()
+            # Cleared before draining: a record put after the drain found the
+            # deque empty and sets the event again
+            self._wakeup.clear()
+            self._drain()
+
+    def _drain(self) -> None:
+        """Write every waiting record, in batches."""
+        pending = self._pending
+        while pending:
+            batch: List[EventDict] = []
+            while pending and len(batch) < self._batch_size:
+                batch.append(pending.popleft())
+            self._write(batch)
+
+    def _write(self, batch: List[EventDict]) -> None:
+        """Render ``batch`` and write it in one call."""
+        lines = []
+        for event_dict in batch:
+            timestamp = event_dict.get("timestamp")
+            if isinstance(timestamp, float):
+                event_dict["timestamp"] = _format_timestamp(timestamp)
+            try:
+                lines.append(self._render(None, "", event_dict))
+            except Exception as e:
+                lines.append(
+                    json.dumps({"event": "Unrenderable log record", "error": repr(e)})
+                )
+        dropped = self.dropped
+        if dropped != self._reported_dropped:
+            lines.append(
+                json.dumps(
+                    {
+                        "event": "Log records dropped",
+                        "level": "warning",
+                        "dropped": dropped - self._reported_dropped,
+                    }
+                )
+            )
+            self._reported_dropped = dropped
+        if not lines:
+            return
+        stream = self.stream
+        try:
+            stream.write("\n".join(lines) + "\n")
+            stream.flush()
+        except (OSError, ValueError):
+            # The stream is gone, e.g. closed at interpreter shutdown
+            pass
+
+
+class QueueLogger:
+    """Wrapped logger handing every record to a ``QueueLogSink``."""
+
+    def __init__(self, sink: QueueLogSink):
+        self._sink = sink
+
+    def msg(self, event_dict: EventDict) -> None:
+        self._sink.put(event_dict)
+
+    debug = info = warning = warn = error = critical = exception = fatal = msg
+
+
+def add_timestamp(
+    logger: WrappedLogger, method_name: str, event_dict: EventDict
+) -> EventDict:
+    """Stamp the record with the epoch time; ``QueueLogSink`` formats it."""
+    event_dict["timestamp"] = time.time()
+    return event_dict
+
+
+def _format_timestamp(timestamp: float) -> str:
+    """Format an epoch time as ISO 8601 in UTC, e.g. ``2024-01-01T12:00:00.5Z``."""
+    moment = datetime.fromtimestamp(timestamp, timezone.utc).replace(tzinfo=None)
+    return moment.isoformat() + "Z"
+
+
+def hand_off(logger: WrappedLogger, method_name: str, event_dict: EventDict) -> Any:
+    """Final processor passing the unrendered record to ``QueueLogger``."""
+    return (event_dict,), {}
+
+
+def parse_log_level(value: str) -> int:
+    """Resolve a level name such as ``"info"`` or ``"WARNING "``."""
+    level = LOG_LEVELS.get(value.strip().lower())
+    if level is None:
+        raise ValueError(
+            f"Invalid log level {value!r}, expected one of {', '.join(LOG_LEVELS)}"
+        )
+    return level
+
+
+def parse_sample_rates(value: str) -> Dict[str, float]:
+    """Parse ``"debug=0.1,Handling request=0.01"`` into a rate per key."""
+    rates: Dict[str, float] = {}
+    for item in value.split(","):
+        if not item.strip():
+            continue
+        key, separator, rate = item.rpartition("=")
+        if not separator or not key.strip():
+            raise ValueError(f"Invalid sample rate {item!r}, expected name=rate")
+        rates[key.strip()] = float(rate)
+    return rates
+
+
+sampler = EventSampler(parse_sample_rates(LOG_SAMPLE_RATES))
+log_sink = QueueLogSink(max_queue_size=LOG_QUEUE_SIZE, batch_size=LOG_BATCH_SIZE)
 
 structlog.configure(
     processors=[
-        structlog.processors.TimeStamper(fmt="iso"),
-        structlog.processors.JSONRenderer(),
-    ]
+        structlog.processors.add_log_level,
+        sampler,
+        add_timestamp,
+        # Tracebacks must be captured before the exception is gone
+        structlog.processors.format_exc_info,
+        hand_off,
+    ],
+    wrapper_class=structlog.make_filtering_bound_logger(parse_log_level(LOG_LEVEL)),
+    logger_factory=lambda *args: QueueLogger(log_sink),
+    cache_logger_on_first_use=True,
 )
 
+metrics_registry.gauge(
+    "log_queue_depth", "Log records waiting for the writer thread."
+).labels().set_function(log_sink.depth)
+
+if LOG_ASYNC:
+    log_sink.start()
+    atexit.register(log_sink.close)
+
 logger = structlog.get_logger()
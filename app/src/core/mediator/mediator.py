@@ -1,6 +1,46 @@
-from typing import Any, Dict, List, Type
+import asyncio
+from contextlib import nullcontext
+from enum import Enum
+from typing import Any, Dict, List, Optional, Tuple, Type
 
 from .abstractions import INotification, IRequest
+from .bus import NotificationBus
+from .exceptions import NotificationPublishException
+
+
+class PublishStrategy(str, Enum):
+    """How a notification is delivered to its handlers."""
+
+    SEQUENTIAL = "sequential"
+    CONCURRENT = "concurrent"
+
+
+class PublishOptions:
+    """Delivery options for a notification type.
+
+    Attributes:
+        strategy (PublishStrategy): Sequential (in registration order, stop at
+            the first failure) or concurrent fan-out.
+        max_concurrency (Optional[int]): Upper bound on handlers running at
+            once in concurrent mode; ``None`` means unbounded.
+        handler_timeout (Optional[float]): Seconds each handler may run before
+            it is cancelled and reported as failed.
+    """
+
+    def __init__(
+        self,
+        strategy: PublishStrategy = PublishStrategy.SEQUENTIAL,
+        max_concurrency: Optional[int] = None,
+        handler_timeout: Optional[float] = None,
+    ) -> None:
+        if max_concurrency is not None and max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        self.strategy = strategy
+        self.max_concurrency = max_concurrency
+        self.handler_timeout = handler_timeout
+
+
+_DEFAULT_PUBLISH_OPTIONS = PublishOptions()
 
 
 class Mediator:
@@ -10,19 +50,71 @@ class Mediator:
         """Initialize the mediator."""
         self._request_handlers: Dict[Type[Any], Any] = {}
         self._notification_handlers: Dict[Type[Any], List[Any]] = {}
+        self._publish_options: Dict[Type[Any], PublishOptions] = {}
+        self._notification_bus: Optional[NotificationBus] = None
+        self._frozen = False
+
+    @property
+    def is_frozen(self) -> bool:
+        """Whether the dispatch tables are sealed against registration."""
+        return self._frozen
+
+    def freeze(self) -> None:
+        """Seal the dispatch tables.
+
+        A frozen mediator can be shared by every request for the lifetime of
+        the application; further registrations raise ``RuntimeError``.
+        """
+        self._frozen = True
+
+    def _ensure_not_frozen(self) -> None:
+        """Reject registrations once the mediator has been frozen."""
+        if self._frozen:
+            raise RuntimeError("Cannot register handlers on a frozen mediator")
 
     def register_request_handler(self, request_type: Type[Any], handler: Any) -> None:
         """Register a request handler."""
+        self._ensure_not_frozen()
         self._request_handlers[request_type] = handler
 
     def register_notification_handler(
         self, notification_type: Type[Any], handler: Any
     ) -> None:
         """Register a notification handler."""
+        self._ensure_not_frozen()
         if notification_type not in self._notification_handlers:
             self._notification_handlers[notification_type] = []
         self._notification_handlers[notification_type].append(handler)
 
+    def configure_publish(
+        self,
+        notification_type: Type[Any],
+        strategy: PublishStrategy = PublishStrategy.CONCURRENT,
+        max_concurrency: Optional[int] = None,
+        handler_timeout: Optional[float] = None,
+    ) -> None:
+        """Select the delivery strategy for a notification type.
+
+        Notification types that are not configured are published sequentially.
+        """
+        self._ensure_not_frozen()
+        self._publish_options[notification_type] = PublishOptions(
+            strategy, max_concurrency, handler_timeout
+        )
+
+    def use_notification_bus(self, bus: NotificationBus) -> None:
+        """Route ``publish_nowait`` through ``bus``.
+
+        The bus should deliver with this mediator's ``publish``.
+        """
+        self._ensure_not_frozen()
+        self._notification_bus = bus
+
+    @property
+    def notification_bus(self) -> Optional[NotificationBus]:
+        """The bus backing ``publish_nowait``, if configured."""
+        return self._notification_bus
+
     async def send(self, request: IRequest[Any]) -> Any:
         """Send a request and return response."""
         handler = self._request_handlers.get(type(request))
@@ -31,7 +123,94 @@ class Mediator:
         return await handler.handle(request)
 
     async def publish(self, notification: INotification) -> None:
-        """Publish a notification to all handlers."""
+        """Publish a notification to all handlers.
+
+        Raises:
+            NotificationPublishException: In concurrent mode, after every
+                handler has finished, if any of them failed or timed out.
+        """
         handlers = self._notification_handlers.get(type(notification), [])
+        if not handlers:
+            return
+        options = self._publish_options.get(
+            type(notification), _DEFAULT_PUBLISH_OPTIONS
+        )
+        if options.strategy is PublishStrategy.CONCURRENT:
+            await self._publish_concurrently(notification, handlers, options)
+            return
         for handler in handlers:
+            await self._invoke_handler(handler, notification, options.handler_timeout)
+
+    def publish_nowait(self, notification: INotification) -> bool:
+        """Queue a notification for background delivery to all handlers.
+
+        Never waits, neither for the handlers nor for space in the queue;
+        handler failures are logged by the bus. A full queue drops the
+        notification unless the bus spills overflow.
+
+        Returns:
+            bool: ``False`` if the bus dropped the notification.
+
+        Raises:
+            RuntimeError: If no notification bus is configured or running.
+        """
+        if self._notification_bus is None:
+            raise RuntimeError("No notification bus is configured")
+        return self._notification_bus.publish_nowait(notification)
+
+    async def _publish_concurrently(
+        self,
+        notification: INotification,
+        handlers: List[Any],
+        options: PublishOptions,
+    ) -> None:
+        """Run handlers concurrently and report all failures together.
+
+        Only ``Exception`` counts as a handler failure; ``CancelledError`` and
+        other ``BaseException`` propagate as they are.
+        """
+        if len(handlers) == 1:
+            # Nothing to overlap; still report a failure the concurrent way
+            handler = handlers[0]
+            try:
+                await self._invoke_handler(
+                    handler, notification, options.handler_timeout
+                )
+            except Exception as e:
+                raise NotificationPublishException(notification, [(handler, e)]) from e
+            return
+
+        semaphore = (
+            asyncio.Semaphore(options.max_concurrency)
+            if options.max_concurrency is not None
+            else None
+        )
+
+        async def run(handler: Any) -> None:
+            async with semaphore or nullcontext():
+                await self._invoke_handler(
+                    handler, notification, options.handler_timeout
+                )
+
+        results = await asyncio.gather(
+            *(run(handler) for handler in handlers), return_exceptions=True
+        )
+        errors: List[Tuple[Any, Exception]] = []
+        for handler, result in zip(handlers, results):
+            if isinstance(result, Exception):
+                errors.append((handler, result))
+            elif isinstance(result, BaseException):
+                # Cancellation is not a handler failure: let it propagate
+                raise result
+        if errors:
+            raise NotificationPublishException(notification, errors)
+
+    @staticmethod
+    async def _invoke_handler(
+        handler: Any, notification: INotification, timeout: Optional[float]
+    ) -> None:
+        """Invoke one handler, bounded by ``timeout`` seconds when given."""
+        if timeout is None:
             await handler.handle(notification)
+        else:
+            await asyncio.wait_for(handler.handle(notification), timeout)
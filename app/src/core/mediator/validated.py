@@ -0,0 +1,53 @@
+from typing import Any, Mapping, Optional, TypeVar
+
+from pydantic import BaseModel, model_validator
+
+_M = TypeVar("_M", bound="ValidatedModel")
+
+
+class ValidatedModel(BaseModel):
+    """
+    Pydantic model that remembers whether its state passed validation.
+
+    Instances created through validation (the constructor, ``model_validate``,
+    FastAPI request parsing) are marked as validated. ``model_construct``
+    skips validation and leaves the mark unset, and assigning a field or
+    ``model_copy(update=...)`` clears it unless the model validates
+    assignments. Writing to ``__dict__`` directly is not detected.
+
+    The mark lives in a slot rather than a private attribute: private
+    attributes are initialized and read through Python-level hooks, which
+    would cost more per request than the revalidation this avoids.
+
+    ``PydanticValidationBehavior`` uses the mark to skip revalidating requests
+    that have not changed since they were validated.
+    """
+
+    __slots__ = ("_validated",)
+
+    @model_validator(mode="after")
+    def _mark_validated(self: _M) -> _M:
+        object.__setattr__(self, "_validated", True)
+        return self
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        if name in type(self).model_fields and not self.model_config.get(
+            "validate_assignment"
+        ):
+            object.__setattr__(self, "_validated", False)
+
+    def model_copy(
+        self: _M, *, update: Optional[Mapping[str, Any]] = None, deep: bool = False
+    ) -> _M:
+        copied = super().model_copy(update=update, deep=deep)
+        object.__setattr__(copied, "_validated", not update and is_validated(self))
+        return copied
+
+
+def is_validated(instance: Any) -> bool:
+    """Whether ``instance`` is a ``ValidatedModel`` unchanged since validation."""
+    # Unmarked instances (model_construct) have no slot value
+    return isinstance(instance, ValidatedModel) and getattr(
+        instance, "_validated", False
+    )
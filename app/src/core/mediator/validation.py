@@ -1,4 +1,11 @@
-from typing import Any, Callable, Dict, List
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence
+
+ValidationErrors = Sequence[Dict[str, str]]
+CompiledValidator = Callable[[Any], ValidationErrors]
+
+# Returned by compiled validators for valid instances, so the common case
+# allocates nothing; invalid instances get a new list
+NO_ERRORS: ValidationErrors = ()
 
 
 class ValidationErrorDetail:
@@ -16,14 +23,17 @@ class ValidationErrorDetail:
 class Rule:
     """Represents a validation rule."""
 
-    def __init__(self, field: str):
+    def __init__(self, field: str, on_change: Optional[Callable[[], None]] = None):
         self.field = field
-        self._predicate = None
+        self._predicate: Optional[Callable[[Any], bool]] = None
         self._message = "Invalid"
+        self._on_change = on_change
 
     def must(self, predicate: Callable[[Any], bool]) -> "Rule":
         """Set validation predicate."""
         self._predicate = predicate
+        if self._on_change is not None:
+            self._on_change()
         return self
 
     def with_message(self, message: str) -> "Rule":
@@ -42,6 +52,8 @@ class Rule:
             >>> rule.with_message("Invalid input").some_other_method()
         """
         self._message = message
+        if self._on_change is not None:
+            self._on_change()
         return self
 
     def validate(self, instance: Any) -> List[ValidationErrorDetail]:
@@ -55,23 +67,99 @@ class Rule:
 
 
 class Validator:
-    """Validates objects using defined rules."""
+    """Validates objects using defined rules.
+
+    Rules are compiled into a single function on first use (see ``compile``)
+    and recompiled after any rule changes.
+    """
 
     def __init__(self):
         self._rules: list[Rule] = []
+        self._compiled: Optional[CompiledValidator] = None
 
     def rule_for(self, field: str) -> Rule:
         """Create a rule for a field."""
-        rule = Rule(field)
+        rule = Rule(field, on_change=self._invalidate)
         self._rules.append(rule)
+        self._invalidate()
         return rule
 
     def validate(self, instance: Any) -> List[Dict[str, str]]:
         """Validate instance against all rules."""
-        errors: List[ValidationErrorDetail] = []
-        for rule in self._rules:
-            errors.extend(rule.validate(instance))
-        return [e.to_dict() for e in errors]
+        errors = (self._compiled or self.compile())(instance)
+        # Compiled validators return a new list when there are errors
+        return errors if errors else []  # type: ignore[return-value]
+
+    def validate_many(
+        self, instances: Iterable[Any]
+    ) -> Dict[int, List[Dict[str, str]]]:
+        """Validate each instance, e.g. the items of a bulk import.
+
+        Returns:
+            Dict[int, List[Dict[str, str]]]: The errors of each invalid
+            instance by its position; valid instances are left out.
+        """
+        compiled = self._compiled or self.compile()
+        invalid: Dict[int, List[Dict[str, str]]] = {}
+        for index, instance in enumerate(instances):
+            errors = compiled(instance)
+            if errors:
+                invalid[index] = errors  # type: ignore[assignment]
+        return invalid
+
+    def compile(self) -> CompiledValidator:
+        """Compile the rules into one function returning the errors.
+
+        The generated function reads each field once, evaluates every
+        predicate of that field on the value, and returns ``NO_ERRORS``
+        without allocating when all of them pass. Only when a rule fails are
+        the error dicts built, in rule order. Predicates are evaluated
+        grouped by field, in order of each field's first rule.
+        """
+        if self._compiled is None:
+            self._compiled = _compile_rules(
+                [rule for rule in self._rules if rule._predicate is not None]
+            )
+        return self._compiled
+
+    def _invalidate(self) -> None:
+        self._compiled = None
+
+
+def _compile_rules(rules: Sequence[Rule]) -> CompiledValidator:
+    """Generate the validation function for ``rules``."""
+    if not rules:
+        return lambda instance: NO_ERRORS
+
+    namespace: Dict[str, Any] = {"NO_ERRORS": NO_ERRORS}
+    fields: Dict[str, List[int]] = {}
+    for index, rule in enumerate(rules):
+        fields.setdefault(rule.field, []).append(index)
+        namespace[f"predicate_{index}"] = rule._predicate
+
+    lines = ["def validate(instance):"]
+    for number, (field, indexes) in enumerate(fields.items()):
+        namespace[f"field_{number}"] = field
+        lines.append(f"    value_{number} = getattr(instance, field_{number}, None)")
+        for index in indexes:
+            lines.append(f"    ok_{index} = predicate_{index}(value_{number})")
+    results = [f"ok_{index}" for index in range(len(rules))]
+    lines.append(f"    if {' and '.join(results)}:")
+    lines.append("        return NO_ERRORS")
+    # Same shape as ValidationErrorDetail.to_dict, in rule order
+    lines.append("    errors = []")
+    for index, rule in enumerate(rules):
+        namespace[f"error_field_{index}"] = rule.field
+        namespace[f"message_{index}"] = rule._message
+        lines.append(f"    if not ok_{index}:")
+        lines.append(
+            f"        errors.append("
+            f'{{"field": error_field_{index}, "message": message_{index}}})'
+        )
+    lines.append("    return errors")
+
+    exec("\n".join(lines), namespace)  # pylint: disable=exec-used
+    return namespace["validate"]
 
 
 validator_registry: dict[type, Validator] = {}
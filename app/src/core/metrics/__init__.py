@@ -0,0 +1,3 @@
+"""Metrics module."""
+
+from .registry import *
@@ -0,0 +1,290 @@
+"""In-process metrics with Prometheus text exposition.
+
+Metrics are plain Python objects updated on the event loop thread, so
+recording a value is a few attribute updates without locks. Every worker
+process keeps its own registry; with several workers each scrape of
+``/metrics`` reports the worker that served it.
+"""
+
+import math
+from abc import ABC, abstractmethod
+from bisect import bisect_left
+from typing import (
+    Callable,
+    Dict,
+    Generic,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+)
+
+# Seconds; suited to request latencies from sub-millisecond to tens of seconds
+DEFAULT_BUCKETS: Tuple[float, ...] = (
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+_C = TypeVar("_C")
+
+
+class CounterChild:
+    """A monotonically increasing value for one label combination."""
+
+    __slots__ = ("value",)
+
+    def __init__(self) -> None:
+        self.value = 0.0
+
+    def inc(self, amount: float = 1.0) -> None:
+        """Increase the counter by ``amount``."""
+        self.value += amount
+
+
+class GaugeChild:
+    """A value that goes up and down, optionally read from a callback."""
+
+    __slots__ = ("value", "_function")
+
+    def __init__(self) -> None:
+        self.value = 0.0
+        self._function: Optional[Callable[[], float]] = None
+
+    def inc(self, amount: float = 1.0) -> None:
+        """Increase the gauge by ``amount``."""
+        self.value += amount
+
+    def dec(self, amount: float = 1.0) -> None:
+        """Decrease the gauge by ``amount``."""
+        self.value -= amount
+
+    def set(self, value: float) -> None:
+        """Set the gauge to ``value``."""
+        self.value = value
+
+    def set_function(self, function: Callable[[], float]) -> None:
+        """Read the gauge from ``function`` at collection time."""
+        self._function = function
+
+    def get(self) -> float:
+        """Return the current value."""
+        return self._function() if self._function is not None else self.value
+
+
+class HistogramChild:
+    """Bucketed observations for one label combination."""
+
+    __slots__ = ("_bounds", "counts", "sum", "count")
+
+    def __init__(self, bounds: Tuple[float, ...]) -> None:
+        self._bounds = bounds
+        # One slot per finite bound plus the +Inf bucket; not cumulative
+        self.counts = [0] * (len(bounds) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        """Record one observation."""
+        self.counts[bisect_left(self._bounds, value)] += 1
+        self.sum += value
+        self.count += 1
+
+
+class MetricFamily(ABC, Generic[_C]):
+    """A named metric with its children keyed by label values."""
+
+    type_name = "untyped"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str]):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._children: Dict[Tuple[str, ...], _C] = {}
+
+    def labels(self, *values: str) -> _C:
+        """Get or create the child for the given label values, in order."""
+        if len(values) != len(self.labelnames):
+            raise ValueError(
+                f"{self.name} expects labels {self.labelnames}, got {values}"
+            )
+        child = self._children.get(values)
+        if child is None:
+            child = self._children[values] = self._new_child()
+        return child
+
+    @abstractmethod
+    def _new_child(self) -> _C:
+        """Create the child for a new label combination."""
+
+    def collect(self) -> Iterator[str]:
+        """Yield the exposition lines of this family."""
+        yield f"# HELP {self.name} {_escape_help(self.documentation)}"
+        yield f"# TYPE {self.name} {self.type_name}"
+        for values, child in list(self._children.items()):
+            yield from self._samples(_label_pairs(self.labelnames, values), child)
+
+    @abstractmethod
+    def _samples(self, labels: List[str], child: _C) -> Iterator[str]:
+        """Yield the sample lines of one child."""
+
+
+class Counter(MetricFamily[CounterChild]):
+    """A family of counters."""
+
+    type_name = "counter"
+
+    def _new_child(self) -> CounterChild:
+        return CounterChild()
+
+    def _samples(self, labels: List[str], child: CounterChild) -> Iterator[str]:
+        yield f"{self.name}{_format_labels(labels)} {_format_value(child.value)}"
+
+
+class Gauge(MetricFamily[GaugeChild]):
+    """A family of gauges."""
+
+    type_name = "gauge"
+
+    def _new_child(self) -> GaugeChild:
+        return GaugeChild()
+
+    def _samples(self, labels: List[str], child: GaugeChild) -> Iterator[str]:
+        yield f"{self.name}{_format_labels(labels)} {_format_value(child.get())}"
+
+
+class Histogram(MetricFamily[HistogramChild]):
+    """A family of histograms sharing bucket bounds."""
+
+    type_name = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str],
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(bound for bound in buckets if bound != math.inf))
+
+    def _new_child(self) -> HistogramChild:
+        return HistogramChild(self.buckets)
+
+    def _samples(self, labels: List[str], child: HistogramChild) -> Iterator[str]:
+        cumulative = 0
+        for bound, count in zip((*self.buckets, math.inf), child.counts):
+            cumulative += count
+            bucket_labels = _format_labels([*labels, f'le="{_format_value(bound)}"'])
+            yield f"{self.name}_bucket{bucket_labels} {cumulative}"
+        yield f"{self.name}_sum{_format_labels(labels)} {_format_value(child.sum)}"
+        yield f"{self.name}_count{_format_labels(labels)} {child.count}"
+
+
+class MetricsRegistry:
+    """
+    Holds metric families and renders them in the Prometheus text format.
+
+    Families are created on first request and returned as-is afterwards, so
+    components that are built more than once share their metrics.
+    """
+
+    def __init__(self) -> None:
+        self._families: Dict[str, MetricFamily] = {}
+
+    def counter(
+        self, name: str, documentation: str, labelnames: Sequence[str] = ()
+    ) -> Counter:
+        """Get or create a counter family."""
+        return self._get_or_create(Counter, name, documentation, labelnames)
+
+    def gauge(
+        self, name: str, documentation: str, labelnames: Sequence[str] = ()
+    ) -> Gauge:
+        """Get or create a gauge family."""
+        return self._get_or_create(Gauge, name, documentation, labelnames)
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        """Get or create a histogram family."""
+        family = self._families.get(name)
+        if family is None:
+            family = self._families[name] = Histogram(
+                name, documentation, labelnames, buckets
+            )
+        return self._check(family, Histogram, labelnames)
+
+    def render(self) -> str:
+        """Render all families in the Prometheus text exposition format."""
+        lines: List[str] = []
+        for family in list(self._families.values()):
+            lines.extend(family.collect())
+        return "\n".join(lines) + "\n"
+
+    def _get_or_create(self, kind, name, documentation, labelnames):
+        family = self._families.get(name)
+        if family is None:
+            family = self._families[name] = kind(name, documentation, labelnames)
+        return self._check(family, kind, labelnames)
+
+    @staticmethod
+    def _check(family, kind, labelnames):
+        if type(family) is not kind or family.labelnames != tuple(labelnames):
+            raise ValueError(
+                f"Metric {family.name} is already registered as "
+                f"{family.type_name} with labels {family.labelnames}"
+            )
+        return family
+
+
+# Default registry of the process, rendered at /metrics
+metrics_registry = MetricsRegistry()
+
+# Content type of the text exposition format
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def _label_pairs(names: Tuple[str, ...], values: Tuple[str, ...]) -> List[str]:
+    return [f'{name}="{_escape_label(value)}"' for name, value in zip(names, values)]
+
+
+def _format_labels(pairs: List[str]) -> str:
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format_value(value: float) -> str:
+    if value == math.inf:
+        return "+Inf"
+    if value == -math.inf:
+        return "-Inf"
+    if math.isnan(value):
+        return "NaN"
+    if float(value).is_integer() and abs(value) < 1e15:
+        return str(int(value))
+    return repr(float(value))
+
+
+def _escape_label(value: str) -> str:
+    return str(value).replace("\\", r"\\").replace("\n", r"\n").replace('"', r"\"")
+
+
+def _escape_help(text: str) -> str:
+    return text.replace("\\", r"\\").replace("\n", r"\n")
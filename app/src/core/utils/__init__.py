@@ -1,3 +1,5 @@
 """Core utilities module."""
 
+from .cache import *
+from .resilience import *
 from .utils import *
@@ -0,0 +1,92 @@
+"""In-memory caching utilities."""
+
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Generic, Hashable, Optional, Tuple, TypeVar
+
+V = TypeVar("V")
+
+
+class TTLCache(Generic[V]):
+    """
+    Bounded least-recently-used cache whose entries expire after a TTL.
+
+    The cache is not thread-safe; it is meant to be used from a single event
+    loop, where no locking is needed. Entries are evicted least recently used
+    first once ``max_size`` is reached, and lazily dropped on access after
+    ``ttl`` seconds.
+
+    Example:
+        >>> cache: TTLCache[str] = TTLCache(max_size=2, ttl=60)
+        >>> cache.set("a", "x")
+        >>> cache.get("a")
+        'x'
+        >>> cache.stats()["hits"]
+        1
+    """
+
+    def __init__(
+        self,
+        max_size: int = 1024,
+        ttl: float = 60.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if max_size < 1:
+            raise ValueError("max_size must be at least 1")
+        self._max_size = max_size
+        self._ttl = ttl
+        self._clock = clock
+        self._entries: "OrderedDict[Hashable, Tuple[float, V]]" = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable) -> Optional[V]:
+        """Return the cached value for ``key``, or ``None`` on a miss."""
+        entry = self._entries.get(key)
+        if entry is None:
+            self._misses += 1
+            return None
+        expires_at, value = entry
+        if expires_at <= self._clock():
+            del self._entries[key]
+            self._expirations += 1
+            self._misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self._hits += 1
+        return value
+
+    def set(self, key: Hashable, value: V, ttl: Optional[float] = None) -> None:
+        """Store ``value`` under ``key``, evicting the oldest entry if full."""
+        expires_at = self._clock() + (self._ttl if ttl is None else ttl)
+        self._entries[key] = (expires_at, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
+            self._evictions += 1
+
+    def invalidate(self, key: Hashable) -> None:
+        """Drop ``key`` from the cache if present."""
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Return hit, miss, eviction and expiration counters."""
+        lookups = self._hits + self._misses
+        return {
+            "size": len(self._entries),
+            "max_size": self._max_size,
+            "hits": self._hits,
+            "misses": self._misses,
+            "evictions": self._evictions,
+            "expirations": self._expirations,
+            "hit_ratio": self._hits / lookups if lookups else 0.0,
+        }
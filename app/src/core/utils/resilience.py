@@ -0,0 +1,191 @@
+"""Retry budget and circuit breaker primitives."""
+
+import time
+from enum import Enum
+from typing import Callable, Optional
+
+
+class RetryBudget:
+    """
+    Token bucket limiting retries to a fraction of the traffic.
+
+    Every request deposits ``ratio`` tokens and every retry withdraws one, so
+    retries can add at most ``ratio`` extra load on top of the requests
+    themselves, however many attempts each request is allowed. A floor of
+    ``min_retries_per_second`` tokens is refilled over time so that retries
+    still work at low traffic. The bucket starts full and holds at most
+    ``max_tokens``, which bounds the burst of retries after a quiet period.
+
+    The budget is not thread-safe; it is meant to be used from a single event
+    loop, like ``TTLCache``.
+
+    Example:
+        >>> budget = RetryBudget(ratio=0.5, min_retries_per_second=0, max_tokens=1)
+        >>> budget.try_withdraw(), budget.try_withdraw()
+        (True, False)
+        >>> budget.deposit()
+        >>> budget.deposit()
+        >>> budget.try_withdraw()
+        True
+    """
+
+    def __init__(
+        self,
+        ratio: float = 0.1,
+        min_retries_per_second: float = 1.0,
+        max_tokens: float = 100.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if not 0 <= ratio <= 1:
+            raise ValueError("ratio must be between 0 and 1")
+        if max_tokens < 1:
+            raise ValueError("max_tokens must be at least 1")
+        self._ratio = ratio
+        self._refill_rate = min_retries_per_second
+        self._max_tokens = max_tokens
+        self._clock = clock
+        self._tokens = max_tokens
+        self._refilled_at = clock()
+
+    def tokens(self) -> float:
+        """Retries currently available."""
+        self._refill()
+        return self._tokens
+
+    def deposit(self) -> None:
+        """Record a request, earning ``ratio`` of a retry."""
+        self._tokens = min(self._max_tokens, self._tokens + self._ratio)
+
+    def try_withdraw(self) -> bool:
+        """Take the token for one retry; ``False`` when the budget is spent."""
+        self._refill()
+        if self._tokens < 1:
+            return False
+        self._tokens -= 1
+        return True
+
+    def _refill(self) -> None:
+        """Add the time-based floor earned since the last refill."""
+        if not self._refill_rate:
+            return
+        now = self._clock()
+        earned = (now - self._refilled_at) * self._refill_rate
+        self._refilled_at = now
+        self._tokens = min(self._max_tokens, self._tokens + earned)
+
+
+class CircuitState(str, Enum):
+    """States of a ``CircuitBreaker``."""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """
+    Circuit breaker failing calls fast while a dependency is down.
+
+    The circuit starts closed and opens after ``failure_threshold``
+    consecutive failures. While open, ``allow`` refuses every call until
+    ``reset_timeout`` seconds have passed; the circuit is then half-open and
+    admits up to ``half_open_max_calls`` concurrent trial calls. A successful
+    trial closes the circuit, a failed one opens it again for another
+    ``reset_timeout``.
+
+    Callers report the outcome of every admitted call with ``record_success``
+    or ``record_failure``, or ``release`` it when the call ended without an
+    outcome, e.g. when it was cancelled. ``on_state_change`` is called with
+    the new state on every transition. Like ``RetryBudget``, the breaker is
+    not thread-safe.
+
+    Example:
+        >>> breaker = CircuitBreaker(failure_threshold=1, reset_timeout=60)
+        >>> breaker.allow()
+        True
+        >>> breaker.record_failure()
+        >>> breaker.state, breaker.allow()
+        (<CircuitState.OPEN: 'open'>, False)
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0,
+        half_open_max_calls: int = 1,
+        clock: Callable[[], float] = time.monotonic,
+        on_state_change: Optional[Callable[[CircuitState], None]] = None,
+    ) -> None:
+        if failure_threshold < 1:
+            raise ValueError("failure_threshold must be at least 1")
+        if half_open_max_calls < 1:
+            raise ValueError("half_open_max_calls must be at least 1")
+        self._failure_threshold = failure_threshold
+        self._reset_timeout = reset_timeout
+        self._half_open_max_calls = half_open_max_calls
+        self._clock = clock
+        self._on_state_change = on_state_change
+        self._state = CircuitState.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._trial_calls = 0
+
+    @property
+    def state(self) -> CircuitState:
+        """The current state; an open circuit turns half-open once it times out."""
+        if (
+            self._state is CircuitState.OPEN
+            and self._clock() - self._opened_at >= self._reset_timeout
+        ):
+            self._transition(CircuitState.HALF_OPEN)
+        return self._state
+
+    def retry_after(self) -> float:
+        """Seconds until an open circuit admits a trial call."""
+        if self._state is not CircuitState.OPEN:
+            return 0.0
+        return max(0.0, self._opened_at + self._reset_timeout - self._clock())
+
+    def allow(self) -> bool:
+        """Whether a call may proceed; admitted calls must report their outcome."""
+        state = self._state
+        if state is CircuitState.CLOSED:
+            return True
+        if state is CircuitState.OPEN and self.state is CircuitState.OPEN:
+            return False
+        if self._trial_calls >= self._half_open_max_calls:
+            return False
+        self._trial_calls += 1
+        return True
+
+    def record_success(self) -> None:
+        """Report a successful call."""
+        self._failures = 0
+        if self._state is CircuitState.HALF_OPEN:
+            self._transition(CircuitState.CLOSED)
+
+    def record_failure(self) -> None:
+        """Report a failed call."""
+        state = self._state
+        if state is CircuitState.HALF_OPEN:
+            self._open()
+        elif state is CircuitState.CLOSED:
+            self._failures += 1
+            if self._failures >= self._failure_threshold:
+                self._open()
+
+    def release(self) -> None:
+        """Give back the slot of an admitted call that has no outcome."""
+        if self._state is CircuitState.HALF_OPEN and self._trial_calls:
+            self._trial_calls -= 1
+
+    def _open(self) -> None:
+        self._opened_at = self._clock()
+        self._transition(CircuitState.OPEN)
+
+    def _transition(self, state: CircuitState) -> None:
+        self._state = state
+        self._failures = 0
+        self._trial_calls = 0
+        if self._on_state_change is not None:
+            self._on_state_change(state)
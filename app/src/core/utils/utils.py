@@ -1,6 +1,12 @@
 """Utility functions."""
 
+import base64
+import json
+import secrets
+import threading
+import time
 import uuid
+from typing import Iterable, List
 
 
 def generate_uuid():
@@ -22,23 +28,80 @@ def generate_uuid():
     return str(uuid.uuid4())
 
 
-def is_valid_uuid(val: str) -> bool:
+# Last timestamp and counter handed out by generate_uuid7, shared across threads.
+_uuid7_lock = threading.Lock()
+_uuid7_last_ms = 0
+_uuid7_counter = 0
+
+
+def generate_uuid7() -> uuid.UUID:
+    """
+    Generate a time-ordered UUID version 7 (RFC 9562).
+
+    The first 48 bits hold the Unix time in milliseconds, so successive IDs
+    sort in creation order and new rows land at the right edge of a btree
+    index instead of at random positions. The 12 bits after the version are a
+    counter, seeded randomly each millisecond and incremented for IDs created
+    within the same millisecond, which keeps IDs from this process strictly
+    increasing. The remaining 62 bits are random.
+
+    Returns:
+        uuid.UUID: A new version 7 UUID.
+
+    Example:
+        >>> first, second = generate_uuid7(), generate_uuid7()
+        >>> first.version, first < second
+        (7, True)
     """
-    Check if the provided value is a valid UUID version 4.
+    global _uuid7_last_ms, _uuid7_counter
 
-        This function validates whether a given string represents a valid UUID version 4
-        by attempting to parse it and comparing the result with the original input to
-        ensure proper formatting.
+    with _uuid7_lock:
+        timestamp_ms = time.time_ns() // 1_000_000
+        if timestamp_ms > _uuid7_last_ms:
+            _uuid7_last_ms = timestamp_ms
+            _uuid7_counter = secrets.randbits(11)
+        else:
+            # Same millisecond, or the clock went backwards: keep the last
+            # timestamp and count up, borrowing from the next millisecond if
+            # the counter overflows.
+            _uuid7_counter += 1
+            if _uuid7_counter > 0xFFF:
+                _uuid7_last_ms += 1
+                _uuid7_counter = secrets.randbits(11)
+        timestamp_ms, counter = _uuid7_last_ms, _uuid7_counter
+
+    value = (
+        (timestamp_ms & 0xFFFF_FFFF_FFFF) << 80
+        | 0x7 << 76
+        | counter << 64
+        | 0b10 << 62
+        | secrets.randbits(62)
+    )
+    return uuid.UUID(int=value)
+
+
+def is_valid_uuid(val: str, versions: Iterable[int] = (4, 7)) -> bool:
+    """
+    Check if the provided value is a valid UUID of one of the given versions.
+
+        This function validates whether a given string represents a canonical
+        UUID by parsing it, checking its version and comparing the result with
+        the original input to ensure proper formatting. Task IDs are version 7;
+        version 4 IDs remain valid for tasks created before the switch.
 
         Args:
             val (str): The string value to validate as a UUID.
+            versions (Iterable[int]): The accepted UUID versions.
 
         Returns:
-            bool: True if the value is a valid UUID version 4, False otherwise.
+            bool: True if the value is a valid UUID of an accepted version,
+            False otherwise.
 
         Example:
             >>> is_valid_uuid("550e8400-e29b-41d4-a716-446655440000")
             True
+            >>> is_valid_uuid("01890a5d-ac96-774b-bcce-b302099a8057")
+            True
             >>> is_valid_uuid("invalid-uuid")
             False
             >>> is_valid_uuid("550e8400-e29b-41d4-a716-44665544000")  # Missing digit
@@ -46,7 +109,49 @@ def is_valid_uuid(val: str) -> bool:
     """
 
     try:
-        uuid_obj = uuid.UUID(val, version=4)
-    except ValueError:
+        uuid_obj = uuid.UUID(val)
+    except (ValueError, TypeError, AttributeError):
         return False
-    return str(uuid_obj) == val
+    return uuid_obj.version in tuple(versions) and str(uuid_obj) == val
+
+
+def encode_cursor(*values: str) -> str:
+    """
+    Encode keyset pagination values into an opaque cursor token.
+
+    Args:
+        *values (str): The sort-key values of the last item on a page.
+
+    Returns:
+        str: A URL-safe token that can be passed back to fetch the next page.
+
+    Example:
+        >>> token = encode_cursor("2024-01-01T00:00:00+00:00", "f47ac10b")
+        >>> decode_cursor(token)
+        ['2024-01-01T00:00:00+00:00', 'f47ac10b']
+    """
+    payload = json.dumps(list(values), separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(payload).decode().rstrip("=")
+
+
+def decode_cursor(token: str) -> List[str]:
+    """
+    Decode a cursor token produced by ``encode_cursor``.
+
+    Args:
+        token (str): The opaque cursor token.
+
+    Returns:
+        List[str]: The sort-key values encoded in the token.
+
+    Raises:
+        ValueError: If the token is malformed.
+    """
+    try:
+        payload = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4))
+        values = json.loads(payload)
+    except (ValueError, TypeError) as e:
+        raise ValueError("Invalid cursor") from e
+    if not isinstance(values, list) or not all(isinstance(v, str) for v in values):
+        raise ValueError("Invalid cursor")
+    return values
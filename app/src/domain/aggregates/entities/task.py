@@ -1,11 +1,13 @@
 """Task entity models."""
 
+import uuid
 from datetime import datetime, timezone
 from typing import Optional
 
+from sqlalchemy import DateTime, Index, text
 from sqlmodel import Field, SQLModel  # type: ignore[misc]
 
-from app.src.core.utils import generate_uuid  # pylint: disable=import-error
+from app.src.core.utils import generate_uuid7  # pylint: disable=import-error
 
 
 class TaskBase(SQLModel):
@@ -20,9 +22,44 @@ class TaskBase(SQLModel):
 class Task(TaskBase, table=True):
     """Database model for tasks."""
 
-    id: str = Field(default_factory=generate_uuid, primary_key=True, index=True)
-    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    __table_args__ = (
+        # Supports keyset pagination ordered on (created_at, id)
+        Index("ix_task_created_at_id", "created_at", "id"),
+        # Status and priority filters, e.g. counts per (completed, priority)
+        Index("ix_task_completed_priority", "completed", "priority"),
+        # Pending tasks by priority; stays small as completed tasks accumulate
+        Index(
+            "ix_task_pending_priority_created_at",
+            "priority",
+            "created_at",
+            postgresql_where=text("NOT completed"),
+        ),
+        # Trigram index for substring and similarity search on titles
+        Index(
+            "ix_task_title_trgm",
+            "title",
+            postgresql_using="gin",
+            postgresql_ops={"title": "gin_trgm_ops"},
+        ),
+    )
+
+    # Native uuid column; v7 IDs are time-ordered, so inserts append to the
+    # primary key index instead of splitting pages at random positions.
+    id: uuid.UUID = Field(default_factory=generate_uuid7, primary_key=True)
+    created_at: datetime = Field(
+        default_factory=lambda: datetime.now(timezone.utc),
+        sa_type=DateTime(timezone=True),  # type: ignore[call-overload]
+    )
     updated_at: datetime = Field(
         default_factory=lambda: datetime.now(timezone.utc),
+        sa_type=DateTime(timezone=True),  # type: ignore[call-overload]
         sa_column_kwargs={"onupdate": lambda: datetime.now(timezone.utc)},
     )
+
+
+class TaskRead(TaskBase):
+    """Public representation of a task."""
+
+    id: uuid.UUID
+    created_at: datetime
+    updated_at: datetime
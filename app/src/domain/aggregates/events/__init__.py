@@ -0,0 +1,3 @@
+"""Domain events."""
+
+from .task_events import *
@@ -0,0 +1,22 @@
+"""Task domain events."""
+
+import uuid
+
+from pydantic import BaseModel, ConfigDict
+
+from app.src.core.mediator.abstractions import INotification
+
+
+class TaskCreatedEvent(BaseModel, INotification):
+    """Raised when a task has been created.
+
+    Events are stored in the outbox in the same transaction as the task and
+    delivered afterwards, at least once; handlers must tolerate duplicates.
+    With the outbox disabled they are delivered at most once.
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    task_id: uuid.UUID
+    title: str
+
@@ -0,0 +1,22 @@
+"""Task filter value object."""
+
+from datetime import datetime
+from typing import Optional
+
+from pydantic import BaseModel, ConfigDict
+
+
+class TaskFilter(BaseModel):
+    """Criteria for selecting tasks; unset criteria match every task.
+
+    Priority bounds and the creation window are inclusive on the lower end;
+    ``created_before`` is exclusive.
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    completed: Optional[bool] = None
+    min_priority: Optional[int] = None
+    max_priority: Optional[int] = None
+    created_after: Optional[datetime] = None
+    created_before: Optional[datetime] = None
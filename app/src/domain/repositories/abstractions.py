@@ -4,10 +4,14 @@ This module defines repository interfaces following the Repository pattern
 and Dependency Inversion Principle from SOLID.
 """
 
+import uuid
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from datetime import datetime
+from typing import AsyncIterator, List, Optional, Sequence, Tuple
 
+from app.src.core.mediator.abstractions import INotification
 from app.src.domain.aggregates.entities.task import Task
+from app.src.domain.aggregates.value_objects.task_filter import TaskFilter
 
 
 class ITaskRepository(ABC):
@@ -15,16 +19,37 @@ class ITaskRepository(ABC):
     Abstract task repository interface.
 
     Defines the contract for task data access operations,
-    following the Repository pattern from DDD.
+    following the Repository pattern from DDD. Domain events passed to the
+    write methods are stored in the outbox atomically with the change, unless
+    the outbox is disabled; they are then published after the commit.
     """
 
     @abstractmethod
-    async def create(self, task: Task) -> Task:
-        """Create a new task."""
+    async def create(self, task: Task, events: Sequence[INotification] = ()) -> Task:
+        """Create a new task, storing ``events`` in the outbox atomically with it."""
         pass
 
     @abstractmethod
-    async def get_by_id(self, task_id: str) -> Optional[Task]:
+    async def create_many(
+        self, tasks: Sequence[Task], events: Sequence[INotification] = ()
+    ) -> List[Task]:
+        """Create many tasks and store ``events`` in the outbox, in one transaction."""
+        pass
+
+    @abstractmethod
+    async def copy_many(
+        self, tasks: Sequence[Task], events: Sequence[INotification] = ()
+    ) -> int:
+        """Bulk-load tasks and their outbox ``events`` as one atomic batch.
+
+        Returns the number of tasks loaded. Intended for large imports; unlike
+        ``create_many`` it may use a storage-specific bulk path and does not
+        return the tasks.
+        """
+        pass
+
+    @abstractmethod
+    async def get_by_id(self, task_id: uuid.UUID) -> Optional[Task]:
         """Get a task by its ID."""
         pass
 
@@ -33,13 +58,39 @@ class ITaskRepository(ABC):
         """Get all tasks with pagination."""
         pass
 
+    @abstractmethod
+    async def get_page(
+        self,
+        limit: int,
+        after: Optional[Tuple[datetime, uuid.UUID]] = None,
+        filters: Optional[TaskFilter] = None,
+    ) -> List[Task]:
+        """Get up to ``limit`` matching tasks ordered by (created_at, id), after a key."""
+        pass
+
+    @abstractmethod
+    def stream(
+        self, filters: Optional[TaskFilter] = None, batch_size: int = 1000
+    ) -> AsyncIterator[Task]:
+        """Iterate over all matching tasks ordered by (created_at, id).
+
+        Rows are fetched ``batch_size`` at a time, so memory use does not grow
+        with the number of tasks.
+        """
+        pass
+
+    @abstractmethod
+    async def count(self, filters: Optional[TaskFilter] = None) -> int:
+        """Count the tasks matching ``filters``."""
+        pass
+
     @abstractmethod
     async def update(self, task: Task) -> Task:
         """Update an existing task."""
         pass
 
     @abstractmethod
-    async def delete(self, task_id: str) -> bool:
+    async def delete(self, task_id: uuid.UUID) -> bool:
         """Delete a task by its ID."""
         pass
 
@@ -49,11 +100,16 @@ class ITaskRepository(ABC):
         pass
 
     @abstractmethod
-    async def get_completed_tasks(self) -> List[Task]:
-        """Get all completed tasks."""
+    async def search(self, text: str, limit: int = 20) -> List[Tuple[Task, float]]:
+        """Search tasks by title, returning (task, relevance) best match first."""
+        pass
+
+    @abstractmethod
+    async def get_completed_tasks(self, limit: int = 100) -> List[Task]:
+        """Get up to ``limit`` completed tasks, oldest first."""
         pass
 
     @abstractmethod
-    async def get_pending_tasks(self) -> List[Task]:
-        """Get all pending tasks."""
+    async def get_pending_tasks(self, limit: int = 100) -> List[Task]:
+        """Get up to ``limit`` pending tasks, oldest first."""
         pass
@@ -1,10 +1,22 @@
 """Database configuration and setup."""
 
 import os
-from typing import Any, Dict, Generator
+from typing import Any, AsyncGenerator, Dict, Generator, Tuple, Type
 
+from sqlalchemy import exc, inspect
+from sqlalchemy.engine import Connection
 from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlmodel import Session, SQLModel, create_engine
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.src.core.mediator.logger import logger
+from app.src.infrastructure.database.context import session_scope
+from app.src.infrastructure.database.instrumentation import instrument_engine
+from app.src.infrastructure.database.statement_timeout import (
+    StatementTimeoutSession,
+    install_statement_timeouts,
+)
 
 # Database URL - PostgreSQL configuration
 DATABASE_URL = os.getenv(
@@ -16,6 +28,37 @@ DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "20"))
 DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "30"))
 DB_POOL_TIMEOUT = int(os.getenv("DB_POOL_TIMEOUT", "30"))
 DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", "3600"))
+# Log every statement through SQLAlchemy; per-statement timings, slow queries
+# and N+1 patterns are reported by the instrumentation regardless
+DB_ECHO = os.getenv("DB_ECHO", "false").lower() == "true"
+
+# Errors meaning the database is unreachable or overloaded rather than that a
+# statement is wrong: retried by RetryBehavior and counted as failures by
+# CircuitBreakerBehavior. Connection errors raised by asyncpg while connecting
+# reach the caller unwrapped, as OSError.
+TRANSIENT_DATABASE_ERRORS: Tuple[Type[BaseException], ...] = (
+    exc.OperationalError,
+    exc.InterfaceError,
+    exc.TimeoutError,
+    OSError,
+)
+
+# SQLSTATE query_canceled, e.g. a statement that ran past statement_timeout
+QUERY_CANCELED_SQLSTATE = "57014"
+
+
+def is_statement_cancelled(error: BaseException) -> bool:
+    """Whether ``error`` is a statement cancelled by the server.
+
+    asyncpg's ``QueryCanceledError`` reaches callers as a plain ``DBAPIError``,
+    so it is recognized by its SQLSTATE. A cancelled statement means the
+    database was too slow, and ``CircuitBreakerBehavior`` counts it as a
+    failure; it is not retried, since the retry would likely time out too.
+    """
+    return (
+        isinstance(error, exc.DBAPIError)
+        and getattr(error.orig, "sqlstate", None) == QUERY_CANCELED_SQLSTATE
+    )
 
 # Validate that we're using PostgreSQL
 if not DATABASE_URL.startswith("postgresql"):
@@ -24,9 +67,30 @@ if not DATABASE_URL.startswith("postgresql"):
         "Please ensure DATABASE_URL starts with 'postgresql://'"
     )
 
+
+def to_async_database_url(url: str) -> str:
+    """Rewrite a PostgreSQL URL to use the asyncpg driver.
+
+    Args:
+        url (str): A ``postgresql://`` or ``postgresql+<driver>://`` URL.
+
+    Returns:
+        str: The same URL using the ``postgresql+asyncpg`` dialect.
+    """
+    scheme, separator, rest = url.partition("://")
+    if not separator or not scheme.startswith("postgresql"):
+        return url
+    return f"postgresql+asyncpg://{rest}"
+
+
+# Async URL used by the request path (asyncpg driver)
+ASYNC_DATABASE_URL = os.getenv(
+    "ASYNC_DATABASE_URL", to_async_database_url(DATABASE_URL)
+)
+
 # Create PostgreSQL engine with connection pooling
 engine_kwargs: Dict[str, Any] = {
-    "echo": True,
+    "echo": DB_ECHO,
     "pool_size": DB_POOL_SIZE,
     "max_overflow": DB_MAX_OVERFLOW,
     "pool_timeout": DB_POOL_TIMEOUT,
@@ -35,22 +99,85 @@ engine_kwargs: Dict[str, Any] = {
 }
 
 try:
+    # Synchronous engine, used for schema management and scripts
     engine = create_engine(DATABASE_URL, **engine_kwargs)
-    print(f"✅ Successfully configured PostgreSQL connection: {DATABASE_URL}")
+    # Asynchronous engine, used by repositories on the request path
+    async_engine = create_async_engine(ASYNC_DATABASE_URL, **engine_kwargs)
+    instrument_engine(engine)
+    instrument_engine(async_engine.sync_engine)
+    logger.info("Configured PostgreSQL connection", url=repr(engine.url))
 except SQLAlchemyError as e:
-    print(f"❌ Failed to create PostgreSQL engine: {e}")
+    logger.error("Failed to create PostgreSQL engine", error=str(e))
     raise RuntimeError(
         f"Cannot connect to PostgreSQL database. "
         f"Please ensure PostgreSQL is running and accessible at: {DATABASE_URL}"
     ) from e
 
+# Factory for request-scoped async sessions. Objects stay loaded after commit so
+# that handlers can read generated values without an extra round trip.
+async_session_factory = async_sessionmaker(
+    async_engine,
+    class_=AsyncSession,
+    sync_session_class=StatementTimeoutSession,
+    expire_on_commit=False,
+)
+# Statements run on behalf of a request with a deadline time out with it
+install_statement_timeouts(StatementTimeoutSession)
+
+
+# PostgreSQL extensions required by the schema (e.g. trigram indexes)
+REQUIRED_EXTENSIONS = ("pg_trgm",)
+
 
-def create_db_and_tables():
+def _create_all(connection: Connection) -> None:
+    """Create missing tables together with their indexes.
+
+    Existing tables are left alone: indexes added to them later ship as
+    migrations built with ``CREATE INDEX CONCURRENTLY``, since building them
+    here would block writes while the workers start.
+    """
+    inspector = inspect(connection)
+    missing = [
+        table
+        for table in SQLModel.metadata.sorted_tables
+        if not inspector.has_table(table.name)
+    ]
+    if not missing:
+        return
+    for extension in REQUIRED_EXTENSIONS:
+        connection.exec_driver_sql(f"CREATE EXTENSION IF NOT EXISTS {extension}")
+    SQLModel.metadata.create_all(connection, tables=missing)
+
+
+async def create_db_and_tables() -> None:
     """Create database and tables."""
-    SQLModel.metadata.create_all(engine)
+    async with async_engine.begin() as connection:
+        await connection.run_sync(_create_all)
 
 
 def get_session() -> Generator[Session, None, None]:
     """Get database session."""
     with Session(engine) as session:
         yield session
+
+
+async def get_async_session() -> AsyncGenerator[AsyncSession, None]:
+    """Get an asynchronous database session."""
+    async with async_session_factory() as session:
+        yield session
+
+
+async def get_scoped_session() -> AsyncGenerator[AsyncSession, None]:
+    """Get an async session bound to the request context.
+
+    Repositories built once at startup resolve this session through
+    ``get_current_session`` for the lifetime of the request.
+    """
+    async with session_scope(async_session_factory) as session:
+        yield session
+
+
+async def dispose_engines() -> None:
+    """Release all pooled connections held by the engines."""
+    await async_engine.dispose()
+    engine.dispose()
@@ -0,0 +1,55 @@
+"""Request-scoped database session context.
+
+Long-lived repositories and handlers do not hold a session themselves. Each
+request opens one session, publishes it through a context variable for the
+duration of the request, and repositories resolve it lazily on every call.
+"""
+
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from typing import AsyncIterator, Callable, Optional
+
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+_current_session: ContextVar[Optional[AsyncSession]] = ContextVar(
+    "current_session", default=None
+)
+
+
+def get_current_session() -> AsyncSession:
+    """Return the session bound to the current request.
+
+    Raises:
+        RuntimeError: If no session scope is active in the current context.
+    """
+    session = _current_session.get()
+    if session is None:
+        raise RuntimeError(
+            "No database session is bound to the current context. "
+            "Wrap the call in session_scope()."
+        )
+    return session
+
+
+@asynccontextmanager
+async def session_scope(
+    session_factory: Callable[[], AsyncSession],
+) -> AsyncIterator[AsyncSession]:
+    """Open a session and bind it to the current context until exit."""
+    async with session_factory() as session:
+        token = _current_session.set(session)
+        try:
+            yield session
+        finally:
+            _current_session.reset(token)
+
+
+async def rollback_current_session() -> None:
+    """Roll back the transaction of the session bound to the current context.
+
+    Leaves the session usable after a failed flush or a lost connection, e.g.
+    before a request is retried. Does nothing outside a session scope.
+    """
+    session = _current_session.get()
+    if session is not None:
+        await session.rollback()
@@ -0,0 +1,234 @@
+"""SQL statement instrumentation.
+
+Engine event hooks time every statement and attribute it to the innermost
+active ``query_stats_scope`` (an HTTP request, a mediator request, ...) and
+all scopes around it. Statements slower than a threshold are logged with the
+shape of their parameters but not their values, and a scope that runs the
+same statement many times is reported as a possible N+1 query pattern.
+"""
+
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from time import perf_counter
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app.src.core.config.config import SQL_N_PLUS_ONE_THRESHOLD, SQL_SLOW_QUERY_MS
+from app.src.core.mediator.behaviors import IPipelineBehavior
+from app.src.core.mediator.logger import logger
+from app.src.core.metrics.registry import MetricsRegistry, metrics_registry
+
+
+class QueryStats:
+    """Statement count and database time of one scope."""
+
+    __slots__ = ("name", "parent", "count", "duration", "statements")
+
+    def __init__(self, name: str, parent: Optional["QueryStats"] = None) -> None:
+        self.name = name
+        self.parent = parent
+        self.count = 0
+        self.duration = 0.0
+        # Executions per SQL text; parameters are bound, so repeats of the
+        # same statement with different values share an entry
+        self.statements: Counter[str] = Counter()
+
+    def record(self, statement: str, duration: float) -> None:
+        """Add one execution to this scope and every enclosing scope."""
+        stats: Optional[QueryStats] = self
+        while stats is not None:
+            stats.count += 1
+            stats.duration += duration
+            stats.statements[statement] += 1
+            stats = stats.parent
+
+    def repeated_statements(self, threshold: int) -> List[Tuple[str, int]]:
+        """Statements executed at least ``threshold`` times, most frequent first."""
+        return [
+            (statement, count)
+            for statement, count in self.statements.most_common()
+            if count >= threshold
+        ]
+
+
+_current_stats: ContextVar[Optional[QueryStats]] = ContextVar(
+    "current_query_stats", default=None
+)
+
+
+def current_query_stats() -> Optional[QueryStats]:
+    """Return the innermost active query stats scope, if any."""
+    return _current_stats.get()
+
+
+@contextmanager
+def query_stats_scope(
+    name: str, n_plus_one_threshold: int = SQL_N_PLUS_ONE_THRESHOLD
+) -> Iterator[QueryStats]:
+    """Collect the statements executed in the current context until exit.
+
+    Scopes nest: statements also count towards every enclosing scope. On
+    exit, statements executed ``n_plus_one_threshold`` times or more are
+    logged as a possible N+1 pattern, unless an enclosing scope will report
+    them anyway.
+    """
+    parent = _current_stats.get()
+    stats = QueryStats(name, parent)
+    token = _current_stats.set(stats)
+    try:
+        yield stats
+    finally:
+        _current_stats.reset(token)
+        if parent is None and n_plus_one_threshold > 0:
+            for statement, count in stats.repeated_statements(n_plus_one_threshold):
+                logger.warning(
+                    "Possible N+1 query pattern",
+                    scope=name,
+                    executions=count,
+                    statement=_shorten(statement),
+                )
+
+
+# Execution option leaving a statement out of timings, counts and the slow
+# query log, for bookkeeping statements such as SET LOCAL
+SKIP_INSTRUMENTATION = "skip_instrumentation"
+
+
+def instrument_engine(
+    engine: Engine,
+    slow_query_ms: float = SQL_SLOW_QUERY_MS,
+    registry: MetricsRegistry = metrics_registry,
+) -> None:
+    """Time every statement run through ``engine``.
+
+    For an ``AsyncEngine`` pass its ``sync_engine``. Statements executed with
+    the ``SKIP_INSTRUMENTATION`` execution option are not recorded.
+
+    Args:
+        engine (Engine): The engine to instrument.
+        slow_query_ms (float): Statements taking at least this many
+            milliseconds are logged; 0 disables the slow-query log.
+        registry (MetricsRegistry): Receives the statement duration histogram.
+    """
+    slow_query_seconds = slow_query_ms / 1000
+    duration_histogram = registry.histogram(
+        "db_statement_duration_seconds", "Time spent executing SQL statements."
+    ).labels()
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _start_timer(
+        conn: Any,
+        cursor: Any,
+        statement: str,
+        parameters: Any,
+        context: Any,
+        executemany: bool,
+    ) -> None:
+        if _skipped(context):
+            return
+        conn.info.setdefault("query_start_times", []).append(perf_counter())
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _record(
+        conn: Any,
+        cursor: Any,
+        statement: str,
+        parameters: Any,
+        context: Any,
+        executemany: bool,
+    ) -> None:
+        if _skipped(context):
+            return
+        duration = perf_counter() - conn.info["query_start_times"].pop()
+        duration_histogram.observe(duration)
+        stats = _current_stats.get()
+        if stats is not None:
+            stats.record(statement, duration)
+        if slow_query_seconds and duration >= slow_query_seconds:
+            logger.warning(
+                "Slow query",
+                duration_ms=round(duration * 1000, 2),
+                scope=stats.name if stats is not None else None,
+                statement=_shorten(statement),
+                parameters=_parameters_shape(parameters, executemany),
+            )
+
+    @event.listens_for(engine, "handle_error")
+    def _discard_timer(context: Any) -> None:
+        # A failed statement never reaches after_cursor_execute
+        execution_context = context.execution_context
+        if execution_context is not None and _skipped(execution_context):
+            return
+        connection = context.connection
+        if connection is not None:
+            start_times = connection.info.get("query_start_times")
+            if start_times:
+                start_times.pop()
+
+
+def _skipped(context: Any) -> bool:
+    """Whether the statement of an execution context is not instrumented."""
+    return bool(context.execution_options.get(SKIP_INSTRUMENTATION))
+
+
+class QueryInstrumentationBehavior(IPipelineBehavior):
+    """Pipeline behavior attributing SQL statements to mediator requests.
+
+    Opens a query stats scope named after the request type and records
+    ``db_statements_per_request`` and ``db_time_per_request_seconds`` per
+    request type. Streaming responses keep querying after the handler
+    returns; those statements count towards the HTTP request instead.
+    """
+
+    def __init__(self, registry: MetricsRegistry = metrics_registry) -> None:
+        self._statements = registry.histogram(
+            "db_statements_per_request",
+            "SQL statements executed per mediator request.",
+            ("request_type",),
+            buckets=(0, 1, 2, 3, 5, 10, 20, 50, 100),
+        )
+        self._time = registry.histogram(
+            "db_time_per_request_seconds",
+            "Time spent in SQL statements per mediator request.",
+            ("request_type",),
+        )
+        self._children: Dict[type, Tuple[Any, Any]] = {}
+
+    async def handle(self, request: Any, next_handler: Callable[..., Any]) -> Any:
+        request_type = type(request)
+        children = self._children.get(request_type)
+        if children is None:
+            name = request_type.__name__
+            children = self._children[request_type] = (
+                self._statements.labels(name),
+                self._time.labels(name),
+            )
+        statements, time = children
+
+        with query_stats_scope(request_type.__name__) as stats:
+            try:
+                return await next_handler()
+            finally:
+                statements.observe(stats.count)
+                time.observe(stats.duration)
+
+
+def _parameters_shape(parameters: Any, executemany: bool) -> Any:
+    """Describe bound parameters by type, without their values."""
+    if executemany and isinstance(parameters, (list, tuple)):
+        first = _parameters_shape(parameters[0], False) if parameters else None
+        return {"rows": len(parameters), "row": first}
+    if isinstance(parameters, dict):
+        return {key: type(value).__name__ for key, value in parameters.items()}
+    if isinstance(parameters, (list, tuple)):
+        return [type(value).__name__ for value in parameters]
+    return type(parameters).__name__
+
+
+def _shorten(statement: str, limit: int = 500) -> str:
+    """Collapse whitespace and truncate a statement for logging."""
+    text = " ".join(statement.split())
+    return text if len(text) <= limit else text[: limit - 3] + "..."
@@ -0,0 +1,54 @@
+"""PostgreSQL statement timeouts derived from request deadlines.
+
+When a session begins a transaction inside a request with a deadline, the
+time left is set as the transaction's ``statement_timeout``. The server then
+cancels a statement that would outlive the request, so a slow query releases
+its pooled connection when the request gives up instead of holding it until
+the query completes. ``SET LOCAL`` ends with the transaction, so the
+connection returns to the pool with its default timeout.
+
+The timeout is computed once per transaction and bounds each statement, not
+the transaction as a whole; ``DeadlineBehavior`` cancels the request itself.
+"""
+
+import math
+from typing import Any, Type
+
+from sqlalchemy import event
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm import Session as OrmSession
+from sqlmodel import Session
+
+from app.src.core.mediator.deadline import remaining_time
+from app.src.infrastructure.database.instrumentation import SKIP_INSTRUMENTATION
+
+
+class StatementTimeoutSession(Session):
+    """Session class whose transactions get the request deadline as timeout.
+
+    Used as the ``sync_session_class`` of the request-path ``AsyncSession``
+    factory, so the hook applies to those sessions only and not to every
+    SQLModel ``Session`` in the process.
+    """
+
+
+def apply_statement_timeout(
+    session: OrmSession, transaction: Any, connection: Connection
+) -> None:
+    """``after_begin`` hook setting ``statement_timeout`` to the time left."""
+    remaining = remaining_time()
+    if remaining is None:
+        return
+    # At least 1 ms: zero would disable the timeout
+    milliseconds = max(1, math.ceil(remaining * 1000))
+    # Not a statement of the request: keep it out of the query stats
+    connection.exec_driver_sql(
+        f"SET LOCAL statement_timeout = {milliseconds}",
+        execution_options={SKIP_INSTRUMENTATION: True},
+    )
+
+
+def install_statement_timeouts(session_class: Type[OrmSession]) -> None:
+    """Apply request deadlines to transactions of ``session_class`` sessions."""
+    if not event.contains(session_class, "after_begin", apply_statement_timeout):
+        event.listen(session_class, "after_begin", apply_statement_timeout)
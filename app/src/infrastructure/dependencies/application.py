@@ -4,16 +4,78 @@ This module manages application service dependencies organized by bounded contex
 It orchestrates the interaction between domain and infrastructure layers.
 """
 
-from typing import Any, Dict, Type
-
-from sqlmodel import Session
+from typing import Any, Dict, List, Type
 
+from app.src.application.tasks.command_handlers.task_bulk_create_command_handler import (
+    TaskBulkCreateCommandHandler,
+)
 from app.src.application.tasks.command_handlers.task_create_command_handler import (
     TaskCreateCommandHandler,
 )
+from app.src.application.tasks.command_handlers.task_import_command_handler import (
+    TaskImportCommandHandler,
+)
+from app.src.application.tasks.commands.task_bulk_create import TaskBulkCreateCommand
 from app.src.application.tasks.commands.task_create import TaskCreateCommand
+from app.src.application.tasks.commands.task_import import TaskImportCommand
+from app.src.application.tasks.event_handlers.task_created_event_handler import (
+    TaskCreatedEventHandler,
+)
+from app.src.application.tasks.queries.task_count import TaskCountQuery
+from app.src.application.tasks.queries.task_export import TaskExportQuery
+from app.src.application.tasks.queries.task_get import TaskGetQuery
+from app.src.application.tasks.queries.task_list import TaskListQuery
+from app.src.application.tasks.queries.task_search import TaskSearchQuery
+from app.src.application.tasks.query_handlers.task_count_query_handler import (
+    TaskCountQueryHandler,
+)
+from app.src.application.tasks.query_handlers.task_export_query_handler import (
+    TaskExportQueryHandler,
+)
+from app.src.application.tasks.query_handlers.task_get_query_handler import (
+    TaskGetQueryHandler,
+)
+from app.src.application.tasks.query_handlers.task_list_query_handler import (
+    TaskListQueryHandler,
+)
+from app.src.application.tasks.query_handlers.task_search_query_handler import (
+    TaskSearchQueryHandler,
+)
+from app.src.core.config.config import (
+    CIRCUIT_BREAKER_ENABLED,
+    CIRCUIT_BREAKER_FAILURE_THRESHOLD,
+    CIRCUIT_BREAKER_RESET_TIMEOUT_SECONDS,
+    QUERY_CACHE_MAX_SIZE,
+    QUERY_CACHE_TTL_SECONDS,
+    REQUEST_TIMEOUT_SECONDS,
+    RETRY_BUDGET_MIN_PER_SECOND,
+    RETRY_BUDGET_RATIO,
+    RETRY_DELAY_SECONDS,
+    RETRY_ENABLED,
+    RETRY_MAX_ATTEMPTS,
+)
+from app.src.core.mediator.behaviors import (
+    CachingBehavior,
+    CircuitBreakerBehavior,
+    DeadlineBehavior,
+    IPipelineBehavior,
+    MediatorWithPipeline,
+    MetricsBehavior,
+    RetryBehavior,
+)
+from app.src.core.mediator.exceptions import DeadlineExceededException
 from app.src.core.mediator.mediator import Mediator
+from app.src.core.utils.resilience import RetryBudget
+from app.src.domain.aggregates.events import TaskCreatedEvent
+from app.src.infrastructure.database.config import (
+    TRANSIENT_DATABASE_ERRORS,
+    is_statement_cancelled,
+)
+from app.src.infrastructure.database.context import rollback_current_session
 from app.src.infrastructure.dependencies.domain import DomainDependencies
+from app.src.infrastructure.database.instrumentation import (
+    QueryInstrumentationBehavior,
+)
 from app.src.infrastructure.dependencies.infrastructure import (
     InfrastructureDependencies,
 )
@@ -35,23 +97,52 @@ class TaskApplicationServices:
         self._infrastructure_deps = infrastructure_deps
         self._domain_deps = domain_deps
 
-    def create_command_handlers(self, session: Session) -> Dict[Type[Any], Any]:
+    def create_command_handlers(self) -> Dict[Type[Any], Any]:
         """Create command handlers with their dependencies."""
         # Create repository instances
-        task_repository = self._infrastructure_deps.create_task_repository(session)
+        task_repository = self._infrastructure_deps.create_task_repository()
 
         # Create command handlers with their dependencies
-        return {TaskCreateCommand: TaskCreateCommandHandler(task_repository)}
+        return {
+            TaskCreateCommand: TaskCreateCommandHandler(task_repository),
+            TaskBulkCreateCommand: TaskBulkCreateCommandHandler(task_repository),
+            TaskImportCommand: TaskImportCommandHandler(task_repository),
+        }
+
+    def create_query_handlers(self) -> Dict[Type[Any], Any]:
+        """Create query handlers with their dependencies."""
+        task_repository = self._infrastructure_deps.create_task_repository()
+
+        return {
+            TaskListQuery: TaskListQueryHandler(task_repository),
+            TaskCountQuery: TaskCountQueryHandler(task_repository),
+            TaskGetQuery: TaskGetQueryHandler(task_repository),
+            TaskExportQuery: TaskExportQueryHandler(task_repository),
+            TaskSearchQuery: TaskSearchQueryHandler(task_repository),
+        }
 
-    def create_task_mediator(self, session: Session) -> Mediator:
+    def create_event_handlers(self) -> Dict[Type[Any], List[Any]]:
+        """Create domain event handlers, by event type."""
+        return {
+            TaskCreatedEvent: [TaskCreatedEventHandler()],
+        }
+
+    def create_task_mediator(self) -> Mediator:
         """Create a mediator configured with task handlers."""
         mediator = Mediator()
 
-        # Register all task command handlers
-        command_handlers = self.create_command_handlers(session)
-        for command_type, handler in command_handlers.items():
-            mediator.register_request_handler(command_type, handler)
+        # Register all task command and query handlers
+        request_handlers = {
+            **self.create_command_handlers(),
+            **self.create_query_handlers(),
+        }
+        for request_type, handler in request_handlers.items():
+            mediator.register_request_handler(request_type, handler)
+        for event_type, handlers in self.create_event_handlers().items():
+            for handler in handlers:
+                mediator.register_notification_handler(event_type, handler)
 
+        mediator.freeze()
         return mediator
 
 
@@ -79,17 +170,91 @@ class ApplicationDependencies:
         """Get task application services."""
         return self._task_services
 
-    def create_mediator(self, session: Session) -> Mediator:
-        """Create a fully configured mediator with all application services."""
-        mediator = Mediator()
+    def create_pipeline_behaviors(self) -> List[IPipelineBehavior]:
+        """Create the pipeline behaviors, outermost first."""
+        behaviors: List[IPipelineBehavior] = [MetricsBehavior()]
+        if CIRCUIT_BREAKER_ENABLED:
+            # Outside the deadline: a request that hangs or whose statement
+            # the database cancels counts as a failure of the backend
+            behaviors.append(
+                CircuitBreakerBehavior(
+                    failure_threshold=CIRCUIT_BREAKER_FAILURE_THRESHOLD,
+                    reset_timeout=CIRCUIT_BREAKER_RESET_TIMEOUT_SECONDS,
+                    failure_exceptions=(
+                        *TRANSIENT_DATABASE_ERRORS,
+                        DeadlineExceededException,
+                    ),
+                    failure_predicate=is_statement_cancelled,
+                )
+            )
+        if REQUEST_TIMEOUT_SECONDS > 0:
+            behaviors.append(
+                DeadlineBehavior(
+                    default_timeout=REQUEST_TIMEOUT_SECONDS,
+                    # Imports run as long as the upload takes; each batch is
+                    # still bounded by a client deadline, if any
+                    timeouts={TaskImportCommand: None},
+                )
+            )
+        if RETRY_ENABLED:
+            # Inside the circuit breaker: a request counts once, however many
+            # attempts it made, and an open circuit is not retried
+            behaviors.append(
+                RetryBehavior(
+                    retries=RETRY_MAX_ATTEMPTS,
+                    delay=RETRY_DELAY_SECONDS,
+                    retryable_exceptions=TRANSIENT_DATABASE_ERRORS,
+                    budget=RetryBudget(
+                        ratio=RETRY_BUDGET_RATIO,
+                        min_retries_per_second=RETRY_BUDGET_MIN_PER_SECOND,
+                    ),
+                    rollback=rollback_current_session,
+                    # Commands are not idempotent: a failed commit may have
+                    # written the rows, and an import cannot re-read the
+                    # part of its stream that was already consumed
+                    retries_by_type={
+                        TaskCreateCommand: 1,
+                        TaskBulkCreateCommand: 1,
+                        TaskImportCommand: 1,
+                    },
+                )
+            )
+        behaviors += [
+            CachingBehavior(max_size=QUERY_CACHE_MAX_SIZE, ttl=QUERY_CACHE_TTL_SECONDS),
+            # Inside the cache so only handler executions are measured
+            QueryInstrumentationBehavior(),
+        ]
+        return behaviors
+
+    def create_mediator(self) -> Mediator:
+        """Create a fully configured, frozen mediator with all application services.
+
+        Handlers are stateless with respect to the request: they receive the
+        request-scoped session through the repository's session provider, so
+        the returned mediator can be shared for the lifetime of the application.
+        """
+        mediator = MediatorWithPipeline()
+        for behavior in self.create_pipeline_behaviors():
+            mediator.add_behavior(behavior)
+        mediator.use_notification_bus(
+            self._infrastructure_deps.create_notification_bus(mediator.publish)
+        )
 
         # Register handlers from all bounded contexts
-        task_handlers = self._task_services.create_command_handlers(session)
-        for command_type, handler in task_handlers.items():
-            mediator.register_request_handler(command_type, handler)
+        task_handlers = {
+            **self._task_services.create_command_handlers(),
+            **self._task_services.create_query_handlers(),
+        }
+        for request_type, handler in task_handlers.items():
+            mediator.register_request_handler(request_type, handler)
+        event_handlers = self._task_services.create_event_handlers()
+        for event_type, handlers in event_handlers.items():
+            for handler in handlers:
+                mediator.register_notification_handler(event_type, handler)
 
         # Future: Add other bounded contexts here
-        # user_handlers = self._user_services.create_command_handlers(session)
-        # project_handlers = self._project_services.create_command_handlers(session)
+        # user_handlers = self._user_services.create_command_handlers()
+        # project_handlers = self._project_services.create_command_handlers()
 
+        mediator.freeze()
         return mediator
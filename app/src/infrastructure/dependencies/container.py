@@ -6,15 +6,16 @@ It orchestrates all dependencies across different layers and bounded contexts.
 
 from typing import Annotated
 
-from sqlmodel import Session
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 from app.src.core.mediator.mediator import Mediator
-from app.src.infrastructure.database.config import get_session
+from app.src.infrastructure.database.config import get_scoped_session
 from app.src.infrastructure.dependencies.application import ApplicationDependencies
 from app.src.infrastructure.dependencies.domain import DomainDependencies
 from app.src.infrastructure.dependencies.infrastructure import (
     InfrastructureDependencies,
 )
+from app.src.infrastructure.outbox import OutboxDispatcher
 from fastapi import Depends
 
 
@@ -34,6 +35,8 @@ class DIContainer:
             infrastructure_deps=self._infrastructure,
             domain_deps=self._domain,
         )
+        self._mediator: Mediator | None = None
+        self._outbox_dispatcher: OutboxDispatcher | None = None
 
     @property
     def infrastructure(self) -> InfrastructureDependencies:
@@ -50,9 +53,25 @@ class DIContainer:
         """Get application dependencies."""
         return self._application
 
-    def create_mediator(self, session: Session) -> Mediator:
-        """Create a configured mediator with all dependencies."""
-        return self._application.create_mediator(session)
+    @property
+    def mediator(self) -> Mediator:
+        """Get the application-lifetime mediator, building it on first use."""
+        if self._mediator is None:
+            self._mediator = self._application.create_mediator()
+        return self._mediator
+
+    @property
+    def outbox_dispatcher(self) -> OutboxDispatcher:
+        """Get the dispatcher publishing outbox events through the mediator."""
+        if self._outbox_dispatcher is None:
+            self._outbox_dispatcher = self._infrastructure.create_outbox_dispatcher(
+                self.mediator.publish, self._domain.get_event_types()
+            )
+        return self._outbox_dispatcher
+
+    def create_mediator(self) -> Mediator:
+        """Create a new configured mediator with all dependencies."""
+        return self._application.create_mediator()
 
 
 # Module-level DI container instance (Singleton pattern)
@@ -67,8 +86,8 @@ def get_container() -> DIContainer:
     return _container
 
 
-# FastAPI dependency for database session
-SessionDep = Annotated[Session, Depends(get_session)]
+# FastAPI dependency for the request-scoped async database session
+SessionDep = Annotated[AsyncSession, Depends(get_scoped_session)]
 
 # FastAPI dependency for DI container
 ContainerDep = Annotated[DIContainer, Depends(get_container)]
@@ -4,7 +4,12 @@ This module manages domain-specific dependencies including domain services,
 value objects, and domain rules that are independent of infrastructure concerns.
 """
 
-from app.src.core.utils.utils import generate_uuid, is_valid_uuid
+from typing import Tuple, Type
+
+from pydantic import BaseModel
+
+from app.src.core.utils.utils import generate_uuid7, is_valid_uuid
+from app.src.domain.aggregates.events import TaskCreatedEvent
 
 
 class DomainDependencies:
@@ -17,8 +22,9 @@ class DomainDependencies:
 
     def __init__(self):
         """Initialize domain dependencies."""
-        self._uuid_generator = generate_uuid
+        self._uuid_generator = generate_uuid7
         self._uuid_validator = is_valid_uuid
+        self._event_types: Tuple[Type[BaseModel], ...] = (TaskCreatedEvent,)
 
     def get_uuid_generator(self):
         """Get UUID generator function."""
@@ -28,6 +34,10 @@ class DomainDependencies:
         """Get UUID validator function."""
         return self._uuid_validator
 
+    def get_event_types(self) -> Tuple[Type[BaseModel], ...]:
+        """Get the domain event types that may be stored in the outbox."""
+        return self._event_types
+
     # Domain services can be added here as the application grows
     # For example:
     # - Task priority calculation service
@@ -4,12 +4,55 @@ This module manages all infrastructure-related dependencies including
 database connections, external services, and cross-cutting concerns.
 """
 
-from typing import Generator
+from typing import (
+    Any,
+    AsyncGenerator,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    Optional,
+    Type,
+)
 
-from sqlmodel import Session
+from pydantic import BaseModel
+from sqlalchemy import text
+from sqlmodel.ext.asyncio.session import AsyncSession
 
+from app.src.core.config.config import (
+    EVENT_BUS_MAX_QUEUE_SIZE,
+    EVENT_BUS_OVERFLOW_POLICY,
+    EVENT_BUS_WORKERS,
+    OUTBOX_BATCH_SIZE,
+    OUTBOX_ENABLED,
+    OUTBOX_MAX_ATTEMPTS,
+    OUTBOX_POLL_INTERVAL_SECONDS,
+    TASK_CACHE_ENABLED,
+    TASK_CACHE_MAX_SIZE,
+    TASK_CACHE_TTL_SECONDS,
+    TASK_WRITE_COALESCING_ENABLED,
+    TASK_WRITE_COALESCING_MAX_BATCH,
+    TASK_WRITE_COALESCING_WINDOW_MS,
+)
+from app.src.core.mediator.abstractions import INotification
+from app.src.core.mediator.bus import NotificationBus, OverflowPolicy
+from app.src.core.mediator.logger import logger
+from app.src.core.metrics.registry import metrics_registry
+from app.src.core.utils.cache import TTLCache
 from app.src.domain.repositories.abstractions import ITaskRepository
-from app.src.infrastructure.database.config import engine, get_session
+from app.src.infrastructure.database.config import (
+    async_engine,
+    async_session_factory,
+    get_async_session,
+)
+from app.src.infrastructure.database.context import session_scope
+from app.src.infrastructure.outbox import OutboxDispatcher
+from app.src.infrastructure.repositories.cached_task_repository import (
+    CachedTaskRepository,
+)
+from app.src.infrastructure.repositories.coalescing_task_repository import (
+    CoalescingTaskRepository,
+)
 from app.src.infrastructure.repositories.task_repository import SQLModelTaskRepository
 
 
@@ -21,29 +64,147 @@ class InfrastructureDependencies:
     message brokers, external APIs, etc.
     """
 
-    def __init__(self):
-        """Initialize infrastructure dependencies."""
-        self._engine = engine
+    def __init__(
+        self,
+        task_cache_enabled: bool = TASK_CACHE_ENABLED,
+        task_cache_max_size: int = TASK_CACHE_MAX_SIZE,
+        task_cache_ttl: float = TASK_CACHE_TTL_SECONDS,
+        write_coalescing_enabled: bool = TASK_WRITE_COALESCING_ENABLED,
+        write_coalescing_max_batch: int = TASK_WRITE_COALESCING_MAX_BATCH,
+        write_coalescing_window_ms: float = TASK_WRITE_COALESCING_WINDOW_MS,
+        outbox_enabled: bool = OUTBOX_ENABLED,
+    ):
+        """Initialize infrastructure dependencies.
 
-    def get_database_session(self) -> Generator[Session, None, None]:
-        """Get database session generator."""
-        return get_session()
+        Args:
+            task_cache_enabled (bool): Serve task lookups by ID from an
+                in-memory read-through cache.
+            task_cache_max_size (int): Maximum number of cached tasks.
+            task_cache_ttl (float): Seconds a cached task stays valid.
+            write_coalescing_enabled (bool): Merge concurrent task creations
+                into shared INSERTs and commits.
+            write_coalescing_max_batch (int): Most creations merged into one
+                commit.
+            write_coalescing_window_ms (float): Milliseconds a creation waits
+                for others to join its commit.
+            outbox_enabled (bool): Store domain events in the outbox; when
+                disabled they are queued on the notification bus after commit.
+        """
+        self._engine = async_engine
+        self._notification_bus: Optional[NotificationBus] = None
+        self._task_repository: ITaskRepository = SQLModelTaskRepository(
+            publish_event=None if outbox_enabled else self._publish_event
+        )
+        self._write_coalescer: Optional[CoalescingTaskRepository] = None
+        if write_coalescing_enabled:
+            self._write_coalescer = CoalescingTaskRepository(
+                self._task_repository,
+                async_session_factory,
+                max_batch_size=write_coalescing_max_batch,
+                max_delay=write_coalescing_window_ms / 1000,
+            )
+            self._task_repository = self._write_coalescer
+        self._task_cache: Optional[TTLCache[Dict[str, Any]]] = None
+        if task_cache_enabled:
+            self._task_cache = TTLCache(task_cache_max_size, task_cache_ttl)
+            self._task_repository = CachedTaskRepository(
+                self._task_repository, self._task_cache
+            )
 
-    def create_task_repository(self, session: Session) -> ITaskRepository:
-        """Create a task repository instance."""
-        return SQLModelTaskRepository(session)
+    def get_database_session(self) -> AsyncGenerator[AsyncSession, None]:
+        """Get async database session generator."""
+        return get_async_session()
+
+    def create_task_repository(self) -> ITaskRepository:
+        """Get the application-lifetime task repository.
+
+        The repository resolves the request-scoped session on each call,
+        so a single instance is shared by all requests.
+        """
+        return self._task_repository
+
+    @property
+    def task_cache(self) -> Optional[TTLCache[Dict[str, Any]]]:
+        """Get the task lookup cache, if enabled."""
+        return self._task_cache
+
+    def create_notification_bus(
+        self, publish: Callable[[INotification], Awaitable[None]]
+    ) -> NotificationBus:
+        """Create an in-process bus delivering notifications through ``publish``.
+
+        Each notification is delivered inside its own session scope, so
+        handlers can use repositories as request handlers do.
+        """
+
+        async def deliver(notification: INotification) -> None:
+            async with session_scope(async_session_factory):
+                await publish(notification)
+
+        bus = NotificationBus(
+            deliver,
+            workers=EVENT_BUS_WORKERS,
+            max_queue_size=EVENT_BUS_MAX_QUEUE_SIZE,
+            overflow_policy=OverflowPolicy(EVENT_BUS_OVERFLOW_POLICY),
+        )
+        depth = metrics_registry.gauge(
+            "notification_bus_depth",
+            "Notifications waiting for delivery, by buffer.",
+            ("buffer",),
+        )
+        depth.labels("queue").set_function(lambda: bus.stats()["queue_depth"])
+        depth.labels("overflow").set_function(lambda: bus.stats()["overflow_depth"])
+        self._notification_bus = bus
+        return bus
+
+    def _publish_event(self, event: INotification) -> None:
+        """Queue a committed domain event on the notification bus.
+
+        The change is already committed, so a missing, stopped or full bus
+        loses the event with a warning instead of failing the write.
+        """
+        bus = self._notification_bus
+        if bus is None or not bus.is_running or not bus.publish_nowait(event):
+            logger.warning(
+                "Domain event not published", event_type=type(event).__name__
+            )
+
+    def create_outbox_dispatcher(
+        self,
+        publish: Callable[[INotification], Awaitable[None]],
+        event_types: Iterable[Type[BaseModel]],
+    ) -> OutboxDispatcher:
+        """Create a dispatcher delivering outbox messages through ``publish``."""
+        return OutboxDispatcher(
+            async_session_factory,
+            publish,
+            event_types,
+            batch_size=OUTBOX_BATCH_SIZE,
+            poll_interval=OUTBOX_POLL_INTERVAL_SECONDS,
+            max_attempts=OUTBOX_MAX_ATTEMPTS,
+        )
+
+    @property
+    def write_coalescer(self) -> Optional[CoalescingTaskRepository]:
+        """Get the task write coalescer, if enabled."""
+        return self._write_coalescer
+
+    async def shutdown(self) -> None:
+        """Flush buffered writes before the database engine is disposed."""
+        if self._write_coalescer is not None:
+            await self._write_coalescer.aclose()
 
     @property
     def database_engine(self):
         """Get the database engine."""
         return self._engine
 
-    def health_check(self) -> dict[str, str]:
+    async def health_check(self) -> dict[str, str]:
         """Perform infrastructure health checks."""
         try:
-            # Test database connection by getting a session
-            with next(self.get_database_session()):
-                pass  # Just test the connection
+            # Test database connection with a trivial round trip
+            async with self._engine.connect() as connection:
+                await connection.execute(text("SELECT 1"))
             return {"database": "healthy"}
         except Exception as e:
             return {"database": f"unhealthy: {str(e)}"}
@@ -0,0 +1,10 @@
+"""Transactional outbox.
+
+Domain events are stored in the ``outbox_message`` table in the same
+transaction as the change that raised them, then delivered in the background.
+"""
+
+from .dispatcher import OutboxDispatcher
+from .models import OutboxMessage
+
+__all__ = ["OutboxDispatcher", "OutboxMessage"]
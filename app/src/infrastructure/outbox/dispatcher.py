@@ -0,0 +1,171 @@
+"""Background delivery of outbox messages."""
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+from typing import Awaitable, Callable, Dict, Iterable, List, Optional, Type
+
+from pydantic import BaseModel
+from sqlalchemy import delete, func
+from sqlmodel import col, select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.src.core.mediator.abstractions import INotification
+from app.src.core.mediator.logger import logger
+from app.src.infrastructure.database.context import session_scope
+from app.src.infrastructure.outbox.models import OutboxMessage
+
+# Delay before retry n is RETRY_BASE_DELAY * 2 ** (n - 1), capped
+RETRY_BASE_DELAY = timedelta(seconds=1)
+RETRY_MAX_DELAY = timedelta(minutes=5)
+
+
+class OutboxDispatcher:
+    """
+    Drains the outbox in batches and publishes each event.
+
+    Every batch is claimed in its own transaction with ``SELECT ... FOR UPDATE
+    SKIP LOCKED``, so any number of dispatchers, in one or many processes, can
+    run against the same table without delivering a message twice at the same
+    time. Delivered messages are deleted in the same transaction; failed ones
+    are rescheduled with exponential backoff and parked after
+    ``max_attempts``. Delivery is at least once: a crash between publishing
+    and committing redelivers the batch.
+
+    Each event is published inside its own session scope, so notification
+    handlers can use repositories as request handlers do.
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], AsyncSession],
+        publish: Callable[[INotification], Awaitable[None]],
+        event_types: Iterable[Type[BaseModel]],
+        batch_size: int = 100,
+        poll_interval: float = 1.0,
+        max_attempts: int = 10,
+    ):
+        """Initialize the dispatcher.
+
+        Args:
+            session_factory (Callable[[], AsyncSession]): Opens sessions for
+                claiming batches and for the handlers.
+            publish (Callable[[INotification], Awaitable[None]]): Delivers one
+                event, typically ``Mediator.publish``.
+            event_types (Iterable[Type[BaseModel]]): Event classes that may
+                appear in the outbox, looked up by class name.
+            batch_size (int): Most messages claimed per transaction.
+            poll_interval (float): Seconds to wait after a partial batch.
+            max_attempts (int): Delivery attempts before a message is parked.
+        """
+        self._session_factory = session_factory
+        self._publish = publish
+        self._event_types: Dict[str, Type[BaseModel]] = {
+            event_type.__name__: event_type for event_type in event_types
+        }
+        self._batch_size = batch_size
+        self._poll_interval = poll_interval
+        self._max_attempts = max_attempts
+        self._task: Optional["asyncio.Task[None]"] = None
+
+    def start(self) -> None:
+        """Start dispatching in a background task."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self.run())
+
+    async def stop(self) -> None:
+        """Stop dispatching; an unfinished batch is rolled back and retried."""
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def run(self) -> None:
+        """Dispatch batches until cancelled, pausing when the outbox is drained."""
+        while True:
+            try:
+                handled = await self.dispatch_batch()
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception("Outbox dispatch failed")
+                handled = 0
+            if handled < self._batch_size:
+                await asyncio.sleep(self._poll_interval)
+
+    async def dispatch_batch(self) -> int:
+        """Claim, publish and settle one batch; return the number of messages."""
+        async with self._session_factory() as session:
+            statement = (
+                select(OutboxMessage)
+                .where(col(OutboxMessage.available_at) <= func.now())
+                .order_by(col(OutboxMessage.available_at), col(OutboxMessage.id))
+                .limit(self._batch_size)
+                .with_for_update(skip_locked=True)
+            )
+            messages = list((await session.exec(statement)).all())
+            if not messages:
+                await session.rollback()
+                return 0
+
+            delivered: List[OutboxMessage] = []
+            for message in messages:
+                try:
+                    await self._deliver(message)
+                except Exception as e:
+                    self._reschedule(message, e)
+                else:
+                    delivered.append(message)
+
+            if delivered:
+                await session.exec(  # type: ignore[call-overload]
+                    delete(OutboxMessage).where(
+                        col(OutboxMessage.id).in_([m.id for m in delivered])
+                    )
+                )
+                for message in delivered:
+                    session.expunge(message)
+            await session.commit()
+        logger.debug(
+            "Outbox batch dispatched",
+            claimed=len(messages),
+            delivered=len(delivered),
+        )
+        return len(messages)
+
+    async def _deliver(self, message: OutboxMessage) -> None:
+        """Rebuild the event of a message and publish it."""
+        event_type = self._event_types.get(message.event_type)
+        if event_type is None:
+            raise LookupError(f"Unknown event type {message.event_type!r}")
+        event = event_type.model_validate(message.payload)
+        async with session_scope(self._session_factory):
+            await self._publish(event)  # type: ignore[arg-type]
+
+    def _reschedule(self, message: OutboxMessage, error: Exception) -> None:
+        """Record a failed attempt and schedule the next one, or park the message."""
+        message.attempts += 1
+        message.last_error = repr(error)
+        if message.attempts >= self._max_attempts:
+            message.available_at = None
+            logger.error(
+                "Outbox message parked after repeated failures",
+                message_id=str(message.id),
+                event_type=message.event_type,
+                attempts=message.attempts,
+                error=message.last_error,
+            )
+            return
+        delay = min(RETRY_BASE_DELAY * 2 ** (message.attempts - 1), RETRY_MAX_DELAY)
+        message.available_at = datetime.now(timezone.utc) + delay
+        logger.warning(
+            "Outbox message delivery failed",
+            message_id=str(message.id),
+            event_type=message.event_type,
+            attempts=message.attempts,
+            retry_in_seconds=delay.total_seconds(),
+            error=message.last_error,
+        )
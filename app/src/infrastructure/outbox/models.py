@@ -0,0 +1,61 @@
+"""Transactional outbox table."""
+
+import uuid
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional
+
+from pydantic import BaseModel
+from sqlalchemy import DateTime, Index, text
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlmodel import Field, SQLModel  # type: ignore[misc]
+
+from app.src.core.mediator.abstractions import INotification
+from app.src.core.utils import generate_uuid7
+
+
+def _utcnow() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+class OutboxMessage(SQLModel, table=True):
+    """A domain event waiting to be delivered.
+
+    Rows are written in the same transaction as the change that raised the
+    event and deleted once delivered. ``available_at`` is the earliest time
+    of the next delivery attempt; messages that used up their attempts are
+    parked with ``available_at`` set to NULL and keep their ``last_error``.
+    """
+
+    __tablename__ = "outbox_message"  # type: ignore[assignment]
+    __table_args__ = (
+        # Dispatch order of deliverable messages; parked ones are left out
+        Index(
+            "ix_outbox_message_available_at_id",
+            "available_at",
+            "id",
+            postgresql_where=text("available_at IS NOT NULL"),
+        ),
+    )
+
+    id: uuid.UUID = Field(default_factory=generate_uuid7, primary_key=True)
+    event_type: str
+    payload: Dict[str, Any] = Field(sa_type=JSONB)  # type: ignore[call-overload]
+    created_at: datetime = Field(
+        default_factory=_utcnow,
+        sa_type=DateTime(timezone=True),  # type: ignore[call-overload]
+    )
+    available_at: Optional[datetime] = Field(
+        default_factory=_utcnow,
+        sa_type=DateTime(timezone=True),  # type: ignore[call-overload]
+    )
+    attempts: int = Field(default=0)
+    last_error: Optional[str] = Field(default=None)
+
+    @classmethod
+    def from_event(cls, event: INotification) -> "OutboxMessage":
+        """Serialize a Pydantic event, keyed by its class name."""
+        if not isinstance(event, BaseModel):
+            raise TypeError(f"{type(event).__name__} is not a Pydantic model")
+        return cls(
+            event_type=type(event).__name__, payload=event.model_dump(mode="json")
+        )
@@ -4,6 +4,12 @@ Contains concrete implementations of repository interfaces using
 specific infrastructure technologies like SQLModel, MongoDB, etc.
 """
 
+from .cached_task_repository import CachedTaskRepository
+from .coalescing_task_repository import CoalescingTaskRepository
 from .task_repository import SQLModelTaskRepository
 
-__all__ = ["SQLModelTaskRepository"]
+__all__ = [
+    "CachedTaskRepository",
+    "CoalescingTaskRepository",
+    "SQLModelTaskRepository",
+]
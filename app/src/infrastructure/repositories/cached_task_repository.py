@@ -0,0 +1,169 @@
+"""Caching decorator for task repositories.
+
+Serves ``get_by_id`` from an in-memory LRU/TTL cache and delegates everything
+else to the wrapped repository.
+"""
+
+import uuid
+from datetime import datetime
+from typing import Any, AsyncIterator, Dict, List, Optional, Sequence, Tuple
+
+from sqlalchemy.orm import make_transient_to_detached
+
+from app.src.core.mediator.abstractions import INotification
+from app.src.core.utils.cache import TTLCache
+from app.src.domain.aggregates.entities.task import Task
+from app.src.domain.aggregates.value_objects.task_filter import TaskFilter
+from app.src.domain.repositories.abstractions import ITaskRepository
+
+
+class CachedTaskRepository(ITaskRepository):
+    """
+    Read-through cache in front of another ``ITaskRepository``.
+
+    The cache stores column snapshots rather than ORM instances, so every hit
+    returns a fresh detached ``Task`` that callers may modify and pass to
+    ``update`` without affecting other requests. Entries are invalidated on
+    ``update`` and ``delete``.
+
+    A miss that races with a write could fill the cache with the row it read
+    before the write. Every key with a fill in flight therefore has a write
+    generation, bumped by ``update`` and ``delete``; a fill whose generation
+    changed while it was loading is returned but not cached.
+
+    The cache is local to the worker process: writes made through another
+    process become visible here once the entry expires.
+    """
+
+    def __init__(self, inner: ITaskRepository, cache: TTLCache[Dict[str, Any]]):
+        """Initialize the decorator with the wrapped repository and cache."""
+        self._inner = inner
+        self._cache = cache
+        # Write generation and number of in-flight fills, per key being filled
+        self._generations: Dict[uuid.UUID, int] = {}
+        self._fills: Dict[uuid.UUID, int] = {}
+
+    @property
+    def cache(self) -> TTLCache[Dict[str, Any]]:
+        """The underlying cache, e.g. for reading its statistics."""
+        return self._cache
+
+    async def create(self, task: Task, events: Sequence[INotification] = ()) -> Task:
+        """Create a new task, storing ``events`` in the outbox atomically with it."""
+        return await self._inner.create(task, events)
+
+    async def create_many(
+        self, tasks: Sequence[Task], events: Sequence[INotification] = ()
+    ) -> List[Task]:
+        """Create many tasks and store ``events`` in the outbox, in one transaction."""
+        return await self._inner.create_many(tasks, events)
+
+    async def copy_many(
+        self, tasks: Sequence[Task], events: Sequence[INotification] = ()
+    ) -> int:
+        """Bulk-load tasks and their outbox ``events`` as one atomic batch."""
+        return await self._inner.copy_many(tasks, events)
+
+    async def get_by_id(self, task_id: uuid.UUID) -> Optional[Task]:
+        """Get a task by its ID, from the cache when possible."""
+        snapshot = self._cache.get(task_id)
+        if snapshot is not None:
+            return _restore(snapshot)
+        generation = self._generations.setdefault(task_id, 0)
+        self._fills[task_id] = self._fills.get(task_id, 0) + 1
+        try:
+            task = await self._inner.get_by_id(task_id)
+        finally:
+            stale = self._generations[task_id] != generation
+            self._end_fill(task_id)
+        if task is not None and not stale:
+            self._cache.set(task_id, _snapshot(task))
+        return task
+
+    async def get_all(self, skip: int = 0, limit: int = 100) -> List[Task]:
+        """Get all tasks with pagination."""
+        return await self._inner.get_all(skip, limit)
+
+    async def get_page(
+        self,
+        limit: int,
+        after: Optional[Tuple[datetime, uuid.UUID]] = None,
+        filters: Optional[TaskFilter] = None,
+    ) -> List[Task]:
+        """Get up to ``limit`` matching tasks ordered by (created_at, id), after a key."""
+        return await self._inner.get_page(limit, after, filters)
+
+    def stream(
+        self, filters: Optional[TaskFilter] = None, batch_size: int = 1000
+    ) -> AsyncIterator[Task]:
+        """Iterate over all matching tasks ordered by (created_at, id)."""
+        return self._inner.stream(filters, batch_size)
+
+    async def count(self, filters: Optional[TaskFilter] = None) -> int:
+        """Count the tasks matching ``filters``."""
+        return await self._inner.count(filters)
+
+    async def update(self, task: Task) -> Task:
+        """Update an existing task and drop its cache entry."""
+        self._invalidate(task.id)
+        try:
+            return await self._inner.update(task)
+        finally:
+            self._invalidate(task.id)
+
+    async def delete(self, task_id: uuid.UUID) -> bool:
+        """Delete a task by its ID and drop its cache entry."""
+        self._invalidate(task_id)
+        try:
+            return await self._inner.delete(task_id)
+        finally:
+            self._invalidate(task_id)
+
+    async def get_by_title(self, title: str) -> List[Task]:
+        """Get tasks by title (search functionality)."""
+        return await self._inner.get_by_title(title)
+
+    async def search(self, text: str, limit: int = 20) -> List[Tuple[Task, float]]:
+        """Search tasks by title, returning (task, relevance) best match first."""
+        return await self._inner.search(text, limit)
+
+    async def get_completed_tasks(self, limit: int = 100) -> List[Task]:
+        """Get up to ``limit`` completed tasks, oldest first."""
+        return await self._inner.get_completed_tasks(limit)
+
+    async def get_pending_tasks(self, limit: int = 100) -> List[Task]:
+        """Get up to ``limit`` pending tasks, oldest first."""
+        return await self._inner.get_pending_tasks(limit)
+
+    def _invalidate(self, task_id: uuid.UUID) -> None:
+        """Drop the cache entry and mark in-flight fills of it as stale."""
+        self._cache.invalidate(task_id)
+        if task_id in self._generations:
+            self._generations[task_id] += 1
+
+    def _end_fill(self, task_id: uuid.UUID) -> None:
+        """Forget the generation of a key once its last fill is done."""
+        fills = self._fills.pop(task_id) - 1
+        if fills:
+            self._fills[task_id] = fills
+        else:
+            del self._generations[task_id]
+
+
+_COLUMNS = tuple(column.name for column in Task.__table__.columns)  # type: ignore[attr-defined]
+
+
+def _snapshot(task: Task) -> Dict[str, Any]:
+    """Copy the column values of a loaded task."""
+    return {name: getattr(task, name) for name in _COLUMNS}
+
+
+def _restore(snapshot: Dict[str, Any]) -> Task:
+    """Build a detached task from a snapshot.
+
+    The instance is marked as persistent-but-detached so that passing it to
+    ``update`` issues an UPDATE rather than an INSERT.
+    """
+    task = Task(**snapshot)
+    make_transient_to_detached(task)
+    return task
@@ -0,0 +1,287 @@
+"""Write-coalescing decorator for task repositories.
+
+Merges concurrent ``create`` calls into one multi-row INSERT and one commit
+(group commit) and delegates everything else to the wrapped repository.
+"""
+
+import asyncio
+import uuid
+from datetime import datetime
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+)
+
+from sqlalchemy.exc import DataError, IntegrityError
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.src.core.mediator.abstractions import INotification
+from app.src.core.mediator.deadline import no_deadline
+from app.src.core.mediator.logger import logger
+from app.src.domain.aggregates.entities.task import Task
+from app.src.domain.aggregates.value_objects.task_filter import TaskFilter
+from app.src.domain.repositories.abstractions import ITaskRepository
+from app.src.infrastructure.database.context import session_scope
+
+_PendingCreate = Tuple[Task, Sequence[INotification], "asyncio.Future[Task]"]
+
+# Errors caused by the data of some row, which retrying the rows apart isolates
+_ROW_ERRORS = (IntegrityError, DataError)
+
+
+def _fail_unresolved(batch: List[_PendingCreate], error: BaseException) -> None:
+    """Fail the callers of ``batch`` whose task was neither written nor failed."""
+    for _, _, future in batch:
+        if not future.done():
+            future.set_exception(error)
+
+
+class CoalescingTaskRepository(ITaskRepository):
+    """
+    Group-commit decorator in front of another ``ITaskRepository``.
+
+    ``create`` does not write immediately. The task is queued and the call
+    waits until the batch is flushed, which happens ``max_delay`` seconds
+    after the first task of the batch arrived or as soon as ``max_batch_size``
+    tasks are queued, whichever comes first. A batch is written with the
+    inner repository's ``create_many`` in its own session, so concurrent
+    creates share one INSERT and one COMMIT instead of paying a commit each.
+
+    Every caller gets back its own task. If the batch is rejected because of
+    its data (``IntegrityError`` or ``DataError``), its tasks are retried one
+    by one so that only the callers whose rows are at fault see an error; the
+    retries get ``fallback_timeout`` seconds in total, after which the
+    remaining callers fail. Any other error, e.g. a lost connection, fails
+    every caller of the batch at once rather than repeating it for each row.
+    The write is committed independently of the caller's request session,
+    exactly as ``create`` commits on its own.
+
+    Call ``aclose`` on shutdown to flush queued creates and wait for batches
+    in flight; afterwards ``create`` writes directly.
+    """
+
+    def __init__(
+        self,
+        inner: ITaskRepository,
+        session_factory: Callable[[], AsyncSession],
+        max_batch_size: int = 100,
+        max_delay: float = 0.002,
+        fallback_timeout: float = 5.0,
+    ):
+        """Initialize the decorator.
+
+        Args:
+            inner (ITaskRepository): The repository performing the writes; it
+                must resolve its session through the session context.
+            session_factory (Callable[[], AsyncSession]): Opens the session
+                each batch is written in.
+            max_batch_size (int): Flush as soon as this many creates are queued.
+            max_delay (float): Seconds a create may wait for others to join.
+            fallback_timeout (float): Seconds allowed for retrying the rows of
+                a rejected batch one by one.
+        """
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size must be at least 1")
+        if max_delay < 0:
+            raise ValueError("max_delay must not be negative")
+        if fallback_timeout <= 0:
+            raise ValueError("fallback_timeout must be positive")
+        self._inner = inner
+        self._session_factory = session_factory
+        self._max_batch_size = max_batch_size
+        self._max_delay = max_delay
+        self._fallback_timeout = fallback_timeout
+        self._pending: List[_PendingCreate] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._flushes: Set["asyncio.Task[None]"] = set()
+        self._closed = False
+        self._batches = 0
+        self._rows = 0
+        self._fallbacks = 0
+        self._failures = 0
+
+    async def create(self, task: Task, events: Sequence[INotification] = ()) -> Task:
+        """Queue a task for the next batch and wait until it is committed."""
+        if self._closed:
+            async with session_scope(self._session_factory):
+                return await self._inner.create(task, events)
+
+        loop = asyncio.get_running_loop()
+        future: "asyncio.Future[Task]" = loop.create_future()
+        self._pending.append((task, events, future))
+        if len(self._pending) >= self._max_batch_size:
+            self._start_flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self._max_delay, self._start_flush)
+        # A cancelled caller does not withdraw its row from the batch
+        return await asyncio.shield(future)
+
+    async def aclose(self) -> None:
+        """Flush queued creates and wait for all batches in flight."""
+        self._closed = True
+        self._start_flush()
+        if self._flushes:
+            await asyncio.gather(*self._flushes, return_exceptions=True)
+
+    def stats(self) -> Dict[str, Any]:
+        """Return batch counters, e.g. for monitoring the coalescing ratio."""
+        return {
+            "batches": self._batches,
+            "rows": self._rows,
+            "pending": len(self._pending),
+            "fallbacks": self._fallbacks,
+            "failures": self._failures,
+            "average_batch_size": self._rows / self._batches if self._batches else 0.0,
+        }
+
+    def _start_flush(self) -> None:
+        """Hand the queued creates to a background flush."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch, self._pending = self._pending, []
+        if not batch:
+            return
+        # The batch serves several requests; none of their deadlines applies
+        with no_deadline():
+            flush = asyncio.get_running_loop().create_task(self._flush(batch))
+        self._flushes.add(flush)
+        flush.add_done_callback(self._flushes.discard)
+
+    async def _flush(self, batch: List[_PendingCreate]) -> None:
+        """Write a batch in one transaction and resolve its callers."""
+        try:
+            await self._write_batch(batch)
+        finally:
+            # Cancelled or failed unexpectedly: callers wait on shielded
+            # futures, so every unresolved one must fail rather than hang
+            interrupted = RuntimeError("Coalesced task insert was interrupted")
+            _fail_unresolved(batch, interrupted)
+
+    async def _write_batch(self, batch: List[_PendingCreate]) -> None:
+        """Insert a batch, falling back to one transaction per task."""
+        tasks = [task for task, _, _ in batch]
+        events = [event for _, task_events, _ in batch for event in task_events]
+        try:
+            async with session_scope(self._session_factory):
+                await self._inner.create_many(tasks, events)
+        except _ROW_ERRORS:
+            self._fallbacks += 1
+            logger.warning(
+                "Coalesced task insert rejected, retrying rows one by one",
+                batch_size=len(batch),
+                exc_info=True,
+            )
+            try:
+                async with asyncio.timeout(self._fallback_timeout):
+                    await self._create_one_by_one(batch)
+            except Exception as e:
+                self._fail_batch(batch, e)
+            return
+        except Exception as e:
+            self._fail_batch(batch, e)
+            return
+
+        self._batches += 1
+        self._rows += len(batch)
+        for task, _, future in batch:
+            if not future.done():
+                future.set_result(task)
+
+    async def _create_one_by_one(self, batch: List[_PendingCreate]) -> None:
+        """Write each task of a rejected batch on its own, resolving each caller.
+
+        Only the caller of a row rejected for its data fails; any other error
+        stops the retries and is raised.
+        """
+        for task, events, future in batch:
+            try:
+                async with session_scope(self._session_factory):
+                    created = await self._inner.create(task, events)
+            except _ROW_ERRORS as e:
+                if not future.done():
+                    future.set_exception(e)
+            else:
+                if not future.done():
+                    future.set_result(created)
+
+    def _fail_batch(self, batch: List[_PendingCreate], error: Exception) -> None:
+        """Fail every unresolved caller of ``batch`` with ``error``."""
+        self._failures += 1
+        logger.warning(
+            "Coalesced task insert failed",
+            batch_size=len(batch),
+            error=type(error).__name__,
+            exc_info=error,
+        )
+        _fail_unresolved(batch, error)
+
+    async def create_many(
+        self, tasks: Sequence[Task], events: Sequence[INotification] = ()
+    ) -> List[Task]:
+        """Create many tasks and store ``events`` in the outbox, in one transaction."""
+        return await self._inner.create_many(tasks, events)
+
+    async def copy_many(
+        self, tasks: Sequence[Task], events: Sequence[INotification] = ()
+    ) -> int:
+        """Bulk-load tasks and their outbox ``events`` as one atomic batch."""
+        return await self._inner.copy_many(tasks, events)
+
+    async def get_by_id(self, task_id: uuid.UUID) -> Optional[Task]:
+        """Get a task by its ID."""
+        return await self._inner.get_by_id(task_id)
+
+    async def get_all(self, skip: int = 0, limit: int = 100) -> List[Task]:
+        """Get all tasks with pagination."""
+        return await self._inner.get_all(skip, limit)
+
+    async def get_page(
+        self,
+        limit: int,
+        after: Optional[Tuple[datetime, uuid.UUID]] = None,
+        filters: Optional[TaskFilter] = None,
+    ) -> List[Task]:
+        """Get up to ``limit`` matching tasks ordered by (created_at, id), after a key."""
+        return await self._inner.get_page(limit, after, filters)
+
+    def stream(
+        self, filters: Optional[TaskFilter] = None, batch_size: int = 1000
+    ) -> AsyncIterator[Task]:
+        """Iterate over all matching tasks ordered by (created_at, id)."""
+        return self._inner.stream(filters, batch_size)
+
+    async def count(self, filters: Optional[TaskFilter] = None) -> int:
+        """Count the tasks matching ``filters``."""
+        return await self._inner.count(filters)
+
+    async def update(self, task: Task) -> Task:
+        """Update an existing task."""
+        return await self._inner.update(task)
+
+    async def delete(self, task_id: uuid.UUID) -> bool:
+        """Delete a task by its ID."""
+        return await self._inner.delete(task_id)
+
+    async def get_by_title(self, title: str) -> List[Task]:
+        """Get tasks by title (search functionality)."""
+        return await self._inner.get_by_title(title)
+
+    async def search(self, text: str, limit: int = 20) -> List[Tuple[Task, float]]:
+        """Search tasks by title, returning (task, relevance) best match first."""
+        return await self._inner.search(text, limit)
+
+    async def get_completed_tasks(self, limit: int = 100) -> List[Task]:
+        """Get up to ``limit`` completed tasks, oldest first."""
+        return await self._inner.get_completed_tasks(limit)
+
+    async def get_pending_tasks(self, limit: int = 100) -> List[Task]:
+        """Get up to ``limit`` pending tasks, oldest first."""
+        return await self._inner.get_pending_tasks(limit)
@@ -4,12 +4,48 @@ This module contains concrete implementations of repository interfaces
 using SQLModel/SQLAlchemy for data persistence.
 """
 
-from typing import List, Optional
+import json
+import uuid
+from datetime import datetime
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+)
 
-from sqlmodel import Session, col, select
+from sqlalchemy import func, not_, or_, tuple_
+from sqlmodel import col, insert, select
+from sqlmodel.sql.expression import SelectOfScalar
+from sqlmodel.ext.asyncio.session import AsyncSession
 
+from app.src.core.mediator.abstractions import INotification
 from app.src.domain.aggregates.entities.task import Task
+from app.src.domain.aggregates.value_objects.task_filter import TaskFilter
 from app.src.domain.repositories.abstractions import ITaskRepository
+from app.src.infrastructure.database.context import get_current_session
+from app.src.infrastructure.outbox.models import OutboxMessage
+
+_T = TypeVar("_T")
+
+_TABLE_NAME: str = Task.__table__.name  # type: ignore[attr-defined]
+_COLUMNS = tuple(column.name for column in Task.__table__.columns)  # type: ignore[attr-defined]
+_OUTBOX_TABLE_NAME: str = OutboxMessage.__table__.name  # type: ignore[attr-defined]
+_OUTBOX_COLUMNS = tuple(
+    column.name for column in OutboxMessage.__table__.columns  # type: ignore[attr-defined]
+)
+
+
+def _outbox_record(message: OutboxMessage) -> Tuple[Any, ...]:
+    """Row of ``message`` for ``COPY``; asyncpg takes JSONB values as text."""
+    return tuple(
+        json.dumps(message.payload) if name == "payload" else getattr(message, name)
+        for name in _OUTBOX_COLUMNS
+    )
 
 
 class SQLModelTaskRepository(ITaskRepository):
@@ -17,45 +53,201 @@ class SQLModelTaskRepository(ITaskRepository):
     SQLModel-based implementation of the task repository.
 
     Implements the ITaskRepository interface using SQLModel/SQLAlchemy
-    for database operations.
+    for database operations. All I/O goes through an ``AsyncSession`` so
+    concurrent requests overlap their database round trips instead of
+    blocking the event loop.
+
+    The repository is built once per application; the session is resolved
+    on each call from ``session_provider`` (the request-scoped session by
+    default).
+
+    Domain events passed to the write methods are stored in the outbox in
+    the same transaction. With ``publish_event``, they are handed to it once
+    the transaction has committed instead: delivery is then best effort, and
+    events are lost if the process stops before they are delivered.
     """
 
-    def __init__(self, session: Session):
-        """Initialize the repository with a database session."""
-        self._session = session
+    def __init__(
+        self,
+        session_provider: Callable[[], AsyncSession] = get_current_session,
+        publish_event: Optional[Callable[[INotification], Any]] = None,
+    ):
+        """Initialize the repository with a session provider.
+
+        Args:
+            session_provider (Callable[[], AsyncSession]): Resolves the session
+                of the current unit of work.
+            publish_event (Optional[Callable[[INotification], Any]]): Publishes
+                a committed event; events are stored in the outbox when unset.
+        """
+        self._session_provider = session_provider
+        self._publish_event = publish_event
+
+    @property
+    def _session(self) -> AsyncSession:
+        """Session for the current unit of work."""
+        return self._session_provider()
 
-    async def create(self, task: Task) -> Task:
-        """Create a new task."""
+    async def create(self, task: Task, events: Sequence[INotification] = ()) -> Task:
+        """Create a new task, storing ``events`` in the outbox atomically with it."""
         self._session.add(task)
-        self._session.commit()
-        self._session.refresh(task)
+        if self._publish_event is None:
+            self._session.add_all(OutboxMessage.from_event(event) for event in events)
+        await self._session.commit()
+        self._publish_committed(events)
+        await self._session.refresh(task)
         return task
 
-    async def get_by_id(self, task_id: str) -> Optional[Task]:
+    async def create_many(
+        self, tasks: Sequence[Task], events: Sequence[INotification] = ()
+    ) -> List[Task]:
+        """Create many tasks and store ``events`` in the outbox, in one transaction.
+
+        Rows are sent as one executemany INSERT per table, which SQLAlchemy
+        batches into multi-row VALUES statements, followed by a single commit.
+        IDs and timestamps are generated client-side, so no rows are read back.
+        """
+        if not tasks:
+            return []
+        # Every row carries the full column list and NULLs are rendered, so the
+        # ORM sends all rows as one batch instead of grouping them by key set.
+        session = self._session
+        rows = [{name: getattr(task, name) for name in _COLUMNS} for task in tasks]
+        statement = insert(Task).execution_options(render_nulls=True)
+        await session.exec(statement, params=rows)
+        if events and self._publish_event is None:
+            messages = [OutboxMessage.from_event(event) for event in events]
+            await session.exec(
+                insert(OutboxMessage).execution_options(render_nulls=True),
+                params=[
+                    {name: getattr(message, name) for name in _OUTBOX_COLUMNS}
+                    for message in messages
+                ],
+            )
+        await session.commit()
+        self._publish_committed(events)
+        return list(tasks)
+
+    async def copy_many(
+        self, tasks: Sequence[Task], events: Sequence[INotification] = ()
+    ) -> int:
+        """Bulk-load tasks and their outbox ``events`` as one atomic batch.
+
+        Uses PostgreSQL ``COPY`` through the asyncpg driver connection, which
+        is much faster than INSERT for large batches, for both tables in one
+        transaction, and commits. Falls back to ``create_many`` on drivers
+        without COPY support. Returns the number of tasks loaded.
+        """
+        if not tasks:
+            return 0
+        session = self._session
+        connection = await session.connection()
+        raw_connection = await connection.get_raw_connection()
+        driver_connection = raw_connection.driver_connection
+        if not hasattr(driver_connection, "copy_records_to_table"):
+            return len(await self.create_many(tasks, events))
+
+        records = [tuple(getattr(task, name) for name in _COLUMNS) for task in tasks]
+        await driver_connection.copy_records_to_table(
+            _TABLE_NAME, records=records, columns=_COLUMNS
+        )
+        if events and self._publish_event is None:
+            await driver_connection.copy_records_to_table(
+                _OUTBOX_TABLE_NAME,
+                records=[
+                    _outbox_record(OutboxMessage.from_event(event)) for event in events
+                ],
+                columns=_OUTBOX_COLUMNS,
+            )
+        await session.commit()
+        self._publish_committed(events)
+        return len(records)
+
+    def _publish_committed(self, events: Sequence[INotification]) -> None:
+        """Hand committed events to ``publish_event``, when not in the outbox."""
+        if self._publish_event is not None:
+            for event in events:
+                self._publish_event(event)
+
+    async def get_by_id(self, task_id: uuid.UUID) -> Optional[Task]:
         """Get a task by its ID."""
         statement = select(Task).where(Task.id == task_id)
-        result = self._session.exec(statement)
+        result = await self._session.exec(statement)
         return result.first()
 
     async def get_all(self, skip: int = 0, limit: int = 100) -> List[Task]:
         """Get all tasks with pagination."""
         statement = select(Task).offset(skip).limit(limit)
-        result = self._session.exec(statement)
+        result = await self._session.exec(statement)
+        return list(result.all())
+
+    async def get_page(
+        self,
+        limit: int,
+        after: Optional[Tuple[datetime, uuid.UUID]] = None,
+        filters: Optional[TaskFilter] = None,
+    ) -> List[Task]:
+        """Get up to ``limit`` matching tasks ordered by (created_at, id), after a key.
+
+        Uses a keyset predicate on the composite ``(created_at, id)`` index,
+        so every page costs the same regardless of how deep it is.
+        """
+        statement = select(Task).order_by(col(Task.created_at), col(Task.id))
+        if filters is not None:
+            statement = _apply_filters(statement, filters)
+        if after is not None:
+            statement = statement.where(
+                tuple_(col(Task.created_at), col(Task.id)) > tuple_(*after)
+            )
+        result = await self._session.exec(statement.limit(limit))
         return list(result.all())
 
+    async def stream(
+        self, filters: Optional[TaskFilter] = None, batch_size: int = 1000
+    ) -> AsyncIterator[Task]:
+        """Iterate over all matching tasks ordered by (created_at, id).
+
+        Reads through a server-side cursor, ``batch_size`` rows per fetch, so
+        memory use stays constant and the first rows arrive immediately.
+        """
+        session = self._session
+        statement = select(Task).order_by(col(Task.created_at), col(Task.id))
+        if filters is not None:
+            statement = _apply_filters(statement, filters)
+        result = await session.stream_scalars(
+            statement.execution_options(yield_per=batch_size)
+        )
+        try:
+            async for task in result:
+                yield task
+        finally:
+            await result.close()
+
+    async def count(self, filters: Optional[TaskFilter] = None) -> int:
+        """Count the tasks matching ``filters``.
+
+        Status and priority filters are answered from the
+        ``(completed, priority)`` and pending-only partial indexes.
+        """
+        statement = select(func.count()).select_from(Task)
+        if filters is not None:
+            statement = _apply_filters(statement, filters)
+        result = await self._session.exec(statement)
+        return result.one()
+
     async def update(self, task: Task) -> Task:
         """Update an existing task."""
         self._session.add(task)
-        self._session.commit()
-        self._session.refresh(task)
+        await self._session.commit()
+        await self._session.refresh(task)
         return task
 
-    async def delete(self, task_id: str) -> bool:
+    async def delete(self, task_id: uuid.UUID) -> bool:
         """Delete a task by its ID."""
         task = await self.get_by_id(task_id)
         if task:
-            self._session.delete(task)
-            self._session.commit()
+            await self._session.delete(task)
+            await self._session.commit()
             return True
         return False
 
@@ -64,17 +256,59 @@ class SQLModelTaskRepository(ITaskRepository):
         statement = select(Task).where(
             col(Task.title).like(f"%{title}%")  # pylint: disable=no-member
         )
-        result = self._session.exec(statement)
+        result = await self._session.exec(statement)
         return list(result.all())
 
-    async def get_completed_tasks(self) -> List[Task]:
-        """Get all completed tasks."""
-        statement = select(Task).where(Task.completed is True)
-        result = self._session.exec(statement)
-        return list(result.all())
+    async def search(self, text: str, limit: int = 20) -> List[Tuple[Task, float]]:
+        """Search tasks by title, returning (task, relevance) best match first.
 
-    async def get_pending_tasks(self) -> List[Task]:
-        """Get all pending tasks."""
-        statement = select(Task).where(Task.completed is False)
-        result = self._session.exec(statement)
-        return list(result.all())
+        Matches titles containing ``text`` or sharing enough trigrams with it
+        (word similarity) and ranks them by word similarity. Both predicates
+        are operators of the ``gin_trgm_ops`` class behind the
+        ``ix_task_title_trgm`` GIN index; ``benchmarks/title_search`` prints
+        the plan to check that the planner uses it.
+        """
+        title = col(Task.title)
+        pattern = "%" + _escape_like(text) + "%"
+        score = func.word_similarity(text, title).label("score")
+        statement = (
+            select(Task, score)
+            .where(or_(title.op("%>")(text), title.ilike(pattern, escape="\\")))
+            .order_by(score.desc(), col(Task.id))
+            .limit(limit)
+        )
+        result = await self._session.exec(statement)
+        return [(task, float(rank)) for task, rank in result.all()]
+
+    async def get_completed_tasks(self, limit: int = 100) -> List[Task]:
+        """Get up to ``limit`` completed tasks, oldest first."""
+        return await self.get_page(limit, filters=TaskFilter(completed=True))
+
+    async def get_pending_tasks(self, limit: int = 100) -> List[Task]:
+        """Get up to ``limit`` pending tasks, oldest first."""
+        return await self.get_page(limit, filters=TaskFilter(completed=False))
+
+
+def _apply_filters(
+    statement: SelectOfScalar[_T], filters: TaskFilter
+) -> SelectOfScalar[_T]:
+    """Add a SQL predicate to ``statement`` for every criterion that is set."""
+    if filters.completed is not None:
+        # Rendered as a literal predicate (not a bound parameter) so the planner
+        # can match the "NOT completed" partial index.
+        completed = col(Task.completed)
+        statement = statement.where(completed if filters.completed else not_(completed))
+    if filters.min_priority is not None:
+        statement = statement.where(col(Task.priority) >= filters.min_priority)
+    if filters.max_priority is not None:
+        statement = statement.where(col(Task.priority) <= filters.max_priority)
+    if filters.created_after is not None:
+        statement = statement.where(col(Task.created_at) >= filters.created_after)
+    if filters.created_before is not None:
+        statement = statement.where(col(Task.created_at) < filters.created_before)
+    return statement
+
+
+def _escape_like(value: str) -> str:
+    """Escape LIKE wildcards so ``value`` is matched literally."""
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
@@ -1,14 +1,119 @@
 """Task API routes."""
 
-from app.src.application.tasks.commands import TaskCreateCommand
+import uuid
+from typing import Annotated, Literal, Optional
+
+from app.src.application.tasks.commands import (
+    TaskBulkCreateCommand,
+    TaskBulkCreateResult,
+    TaskCreateCommand,
+    TaskImportCommand,
+    TaskImportResult,
+)
+from app.src.application.tasks.queries import (
+    TaskCount,
+    TaskCountQuery,
+    TaskExportQuery,
+    TaskGetQuery,
+    TaskListQuery,
+    TaskPage,
+    TaskSearchQuery,
+    TaskSearchResults,
+)
+from app.src.domain.aggregates.entities.task import TaskRead
+from app.src.presentation.api.tasks.serializers import tasks_to_csv, tasks_to_ndjson
 from app.src.presentation.dependencies import TaskMediatorDep
-from fastapi import APIRouter, status
+from fastapi import APIRouter, HTTPException, Query, Request, status
+from fastapi.responses import StreamingResponse
 
 router = APIRouter(prefix="/api/tasks", tags=["Tasks"])
 
 
+@router.get("", response_model=TaskPage)
+async def list_tasks(
+    *, query: Annotated[TaskListQuery, Query()], mediator: TaskMediatorDep
+) -> TaskPage:
+    """List tasks matching the filters, ordered by creation time, by cursor."""
+    result = await mediator.send(query)
+    return result
+
+
+@router.get("/count", response_model=TaskCount)
+async def count_tasks(
+    *, query: Annotated[TaskCountQuery, Query()], mediator: TaskMediatorDep
+) -> TaskCount:
+    """Count tasks matching the filters."""
+    result = await mediator.send(query)
+    return result
+
+
+@router.get(
+    "/export",
+    response_class=StreamingResponse,
+    responses={
+        200: {"content": {"application/x-ndjson": {}, "text/csv": {}}},
+    },
+)
+async def export_tasks(
+    *, query: Annotated[TaskExportQuery, Query()], mediator: TaskMediatorDep
+) -> StreamingResponse:
+    """Stream all tasks matching the filters as NDJSON or CSV."""
+    tasks = await mediator.send(query)
+    if query.format == "csv":
+        return StreamingResponse(
+            tasks_to_csv(tasks),
+            media_type="text/csv",
+            headers={"Content-Disposition": 'attachment; filename="tasks.csv"'},
+        )
+    return StreamingResponse(tasks_to_ndjson(tasks), media_type="application/x-ndjson")
+
+
+@router.get("/search", response_model=TaskSearchResults)
+async def search_tasks(
+    *, query: Annotated[TaskSearchQuery, Query()], mediator: TaskMediatorDep
+) -> TaskSearchResults:
+    """Search tasks by title, best match first."""
+    result = await mediator.send(query)
+    return result
+
+
 @router.post("/", response_model=str, status_code=status.HTTP_201_CREATED)
 async def create_task(*, task: TaskCreateCommand, mediator: TaskMediatorDep) -> str:
     """Create a new task."""
     result = await mediator.send(task)
     return result
+
+
+@router.post(
+    "/bulk", response_model=TaskBulkCreateResult, status_code=status.HTTP_201_CREATED
+)
+async def create_tasks_bulk(
+    *, command: TaskBulkCreateCommand, mediator: TaskMediatorDep
+) -> TaskBulkCreateResult:
+    """Create many tasks in one transaction, reporting invalid items per index."""
+    result = await mediator.send(command)
+    return result
+
+
+@router.post("/import", response_model=TaskImportResult)
+async def import_tasks(
+    *,
+    request: Request,
+    mediator: TaskMediatorDep,
+    format: Literal["ndjson", "csv"] = "ndjson",
+    batch_size: Annotated[Optional[int], Query(ge=1, le=50_000)] = None,
+) -> TaskImportResult:
+    """Import tasks from a streamed NDJSON or CSV request body in batches."""
+    options = {"batch_size": batch_size} if batch_size is not None else {}
+    command = TaskImportCommand(source=request.stream(), format=format, **options)
+    result = await mediator.send(command)
+    return result
+
+
+@router.get("/{task_id}", response_model=TaskRead)
+async def get_task(*, task_id: uuid.UUID, mediator: TaskMediatorDep) -> TaskRead:
+    """Get a task by its ID."""
+    result = await mediator.send(TaskGetQuery(task_id=task_id))
+    if result is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Task not found")
+    return result
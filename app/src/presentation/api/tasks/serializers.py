@@ -0,0 +1,42 @@
+"""Streaming serializers for task exports."""
+
+import csv
+import io
+from typing import AsyncIterator
+
+from app.src.domain.aggregates.entities.task import Task, TaskRead
+
+# Bytes buffered before a chunk is sent to the client
+CHUNK_SIZE = 64 * 1024
+
+TASK_EXPORT_FIELDS = list(TaskRead.model_fields)
+
+
+async def tasks_to_ndjson(tasks: AsyncIterator[Task]) -> AsyncIterator[bytes]:
+    """Serialize tasks as newline-delimited JSON, one object per line."""
+    buffer = bytearray()
+    async for task in tasks:
+        read_model = TaskRead.model_validate(task, from_attributes=True)
+        buffer += read_model.model_dump_json().encode()
+        buffer += b"\n"
+        if len(buffer) >= CHUNK_SIZE:
+            yield bytes(buffer)
+            buffer.clear()
+    if buffer:
+        yield bytes(buffer)
+
+
+async def tasks_to_csv(tasks: AsyncIterator[Task]) -> AsyncIterator[bytes]:
+    """Serialize tasks as CSV with a header row."""
+    text = io.StringIO()
+    writer = csv.writer(text)
+    writer.writerow(TASK_EXPORT_FIELDS)
+    async for task in tasks:
+        row = TaskRead.model_validate(task, from_attributes=True).model_dump(mode="json")
+        writer.writerow([row[field] for field in TASK_EXPORT_FIELDS])
+        if text.tell() >= CHUNK_SIZE:
+            yield text.getvalue().encode()
+            text.seek(0)
+            text.truncate()
+    if text.tell():
+        yield text.getvalue().encode()
@@ -13,15 +13,16 @@ from fastapi import Depends
 
 def get_task_mediator(
     container: ContainerDep,
-    session: SessionDep,
+    _session: SessionDep,
 ) -> Mediator:
     """
-    Get a mediator configured for task operations.
+    Get the mediator configured for task operations.
 
-    This function follows the Factory pattern to create a mediator
-    with all task-related dependencies properly injected.
+    The mediator and its handlers are built once at startup. Depending on
+    ``SessionDep`` opens the request-scoped session that the shared
+    repositories resolve for the duration of the request.
     """
-    return container.create_mediator(session)
+    return container.mediator
 
 
 # Type alias for dependency injection in task-related endpoints
@@ -0,0 +1,148 @@
+"""HTTP middleware for the presentation layer."""
+
+from time import perf_counter
+from typing import Any, Awaitable, Callable, MutableMapping
+
+from app.src.core.config.config import SQL_DEBUG_HEADERS
+from app.src.core.mediator.deadline import deadline_scope
+from app.src.core.metrics.registry import MetricsRegistry, metrics_registry
+from app.src.infrastructure.database.instrumentation import query_stats_scope
+
+Scope = MutableMapping[str, Any]
+Message = MutableMapping[str, Any]
+Receive = Callable[[], Awaitable[Message]]
+Send = Callable[[Message], Awaitable[None]]
+ASGIApp = Callable[[Scope, Receive, Send], Awaitable[None]]
+
+
+class MetricsMiddleware:
+    """
+    Records HTTP request timings per route.
+
+    Records ``http_request_duration_seconds`` (histogram) and
+    ``http_requests_total`` (counter) labelled by method, route template and
+    status code, plus ``http_requests_in_flight``. Routes are labelled by
+    their path template (e.g. ``/api/tasks/{task_id}``) so label cardinality
+    stays bounded; requests that match no route are labelled ``unmatched``.
+    Durations cover the whole response, including streamed bodies.
+
+    Implemented as plain ASGI middleware, so streaming responses pass through
+    untouched.
+    """
+
+    def __init__(self, app: ASGIApp, registry: MetricsRegistry = metrics_registry):
+        self.app = app
+        self._duration = registry.histogram(
+            "http_request_duration_seconds",
+            "Time spent serving HTTP requests.",
+            ("method", "route", "status"),
+        )
+        self._requests = registry.counter(
+            "http_requests_total",
+            "HTTP requests served.",
+            ("method", "route", "status"),
+        )
+        self._in_flight = registry.gauge(
+            "http_requests_in_flight", "HTTP requests currently being served."
+        ).labels()
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status = 500
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        self._in_flight.inc()
+        start = perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            elapsed = perf_counter() - start
+            self._in_flight.dec()
+            # The router stores the matched route in the (shared) scope
+            route = scope.get("route")
+            labels = (
+                scope["method"],
+                getattr(route, "path", "unmatched"),
+                str(status),
+            )
+            self._duration.labels(*labels).observe(elapsed)
+            self._requests.labels(*labels).inc()
+
+
+class QueryStatsMiddleware:
+    """
+    Attributes SQL statements to the HTTP request that ran them.
+
+    Opens a query stats scope per request, so slow-query and N+1 log entries
+    name the route. With ``debug_headers`` the statement count and database
+    time are returned in ``X-DB-Query-Count`` and ``X-DB-Time-Ms``; headers
+    are sent before a streamed body, so for streaming responses they only
+    cover the statements run up to that point.
+    """
+
+    def __init__(self, app: ASGIApp, debug_headers: bool = SQL_DEBUG_HEADERS):
+        self.app = app
+        self._debug_headers = debug_headers
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        with query_stats_scope(f"{scope['method']} {scope['path']}") as stats:
+            if not self._debug_headers:
+                await self.app(scope, receive, send)
+                return
+
+            async def send_with_stats(message: Message) -> None:
+                if message["type"] == "http.response.start":
+                    message["headers"] = [
+                        *message.get("headers", ()),
+                        (b"x-db-query-count", str(stats.count).encode()),
+                        (b"x-db-time-ms", f"{stats.duration * 1000:.2f}".encode()),
+                    ]
+                await send(message)
+
+            await self.app(scope, receive, send_with_stats)
+
+
+class DeadlineMiddleware:
+    """
+    Binds the deadline a client asks for to the request.
+
+    A positive ``X-Request-Timeout-Ms`` header sets the request deadline that
+    many milliseconds from now. The deadline bounds the PostgreSQL statements
+    of the request and can only shorten the time budget ``DeadlineBehavior``
+    gives each mediator request. Malformed values are ignored.
+    """
+
+    header = b"x-request-timeout-ms"
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        timeout = None
+        for name, value in scope["headers"]:
+            if name == self.header:
+                try:
+                    milliseconds = float(value)
+                except ValueError:
+                    break
+                if 0 < milliseconds < float("inf"):
+                    timeout = milliseconds / 1000
+                break
+        with deadline_scope(timeout):
+            await self.app(scope, receive, send)
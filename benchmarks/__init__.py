@@ -0,0 +1,6 @@
+"""Microbenchmarks for the Task Management API.
+
+Run a benchmark module directly from the repository root, e.g.::
+
+    python -m benchmarks.pipeline_overhead
+"""
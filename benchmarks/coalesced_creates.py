@@ -0,0 +1,89 @@
+"""Task creation throughput: one commit per create versus group commit.
+
+Runs ``--requests`` task creations with ``--concurrency`` callers in flight on
+the configured database (``DATABASE_URL``), first through
+``SQLModelTaskRepository.create`` with a session per call (as a request does),
+then through ``CoalescingTaskRepository``, and prints creates per second and
+the resulting batch sizes. The created rows are deleted afterwards.
+
+Usage:
+    python -m benchmarks.coalesced_creates [--requests N] [--concurrency N]
+"""
+
+import argparse
+import asyncio
+import time
+from typing import Awaitable, Callable
+
+from sqlmodel import col, delete
+
+from app.src.domain.aggregates.entities.task import Task
+from app.src.infrastructure.database.config import async_engine, async_session_factory
+from app.src.infrastructure.database.context import session_scope
+from app.src.infrastructure.repositories import (
+    CoalescingTaskRepository,
+    SQLModelTaskRepository,
+)
+
+TITLE_PREFIX = "benchmark coalesced create"
+
+
+async def run(
+    create: Callable[[Task], Awaitable[Task]], requests: int, concurrency: int
+) -> float:
+    """Run ``requests`` creations with bounded concurrency; return creates/s."""
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def one(number: int) -> None:
+        async with semaphore:
+            await create(Task(title=f"{TITLE_PREFIX} {number}"))
+
+    start = time.perf_counter()
+    await asyncio.gather(*(one(number) for number in range(requests)))
+    return requests / (time.perf_counter() - start)
+
+
+async def main(requests: int, concurrency: int, window_ms: float) -> None:
+    """Time both write paths and print the comparison."""
+    repository = SQLModelTaskRepository()
+    coalescer = CoalescingTaskRepository(
+        repository,
+        async_session_factory,
+        max_batch_size=concurrency,
+        max_delay=window_ms / 1000,
+    )
+
+    async def create_directly(task: Task) -> Task:
+        async with session_scope(async_session_factory):
+            return await repository.create(task)
+
+    try:
+        direct = await run(create_directly, requests, concurrency)
+        coalesced = await run(coalescer.create, requests, concurrency)
+        await coalescer.aclose()
+    finally:
+        async with async_session_factory() as session:
+            await session.exec(  # type: ignore[call-overload]
+                delete(Task).where(col(Task.title).startswith(TITLE_PREFIX))
+            )
+            await session.commit()
+        await async_engine.dispose()
+
+    stats = coalescer.stats()
+    print(f"{requests} creates, {concurrency} concurrent\n")
+    print(f"{'mode':<10} {'creates/s':>10}")
+    print(f"{'direct':<10} {direct:>10.0f}")
+    print(f"{'coalesced':<10} {coalesced:>10.0f}   ({coalesced / direct:.1f}x)")
+    print(
+        f"\n{stats['batches']} batches, average size "
+        f"{stats['average_batch_size']:.1f}, {stats['fallbacks']} fallbacks"
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=5_000)
+    parser.add_argument("--concurrency", type=int, default=100)
+    parser.add_argument("--window-ms", type=float, default=2.0)
+    arguments = parser.parse_args()
+    asyncio.run(main(arguments.requests, arguments.concurrency, arguments.window_ms))
@@ -0,0 +1,114 @@
+"""Per-send overhead of MediatorWithPipeline versus pipeline depth.
+
+Compares the precompiled pipeline against the previous implementation, which
+rebuilt the behavior chain (one closure plus one lambda per behavior) on every
+``send``. Handlers and behaviors do no work, so the numbers are pure dispatch
+overhead.
+
+Usage:
+    python -m benchmarks.pipeline_overhead [--iterations N]
+"""
+
+import argparse
+import asyncio
+import time
+from typing import Any, Callable
+
+from app.src.core.mediator.abstractions import IRequest, IRequestHandler
+from app.src.core.mediator.behaviors import IPipelineBehavior, MediatorWithPipeline
+
+DEPTHS = (0, 1, 2, 4, 8, 16)
+
+
+class PingRequest(IRequest[int]):
+    """Request with no payload."""
+
+
+class PingHandler(IRequestHandler[PingRequest, int]):
+    """Handler returning a constant."""
+
+    async def handle(self, request: PingRequest) -> int:
+        return 1
+
+
+class PassThroughBehavior(IPipelineBehavior):
+    """Behavior that only forwards to the next link."""
+
+    async def handle(self, request: Any, next_handler: Callable[..., Any]) -> Any:
+        return await next_handler()
+
+
+class SkippedBehavior(PassThroughBehavior):
+    """Behavior restricted to a request type that is never sent."""
+
+    request_types = (int,)
+
+
+class LegacyMediatorWithPipeline(MediatorWithPipeline):
+    """Previous behavior: rebuild the chain on every send."""
+
+    async def send(self, request: IRequest[Any]) -> Any:
+        handler = self._request_handlers.get(type(request))
+        if not handler:
+            raise ValueError(f"No handler registered for {type(request)}")
+
+        async def invoke_handler():
+            return await handler.handle(request)
+
+        pipeline = invoke_handler
+        for behavior in reversed(self._pipeline):
+            pipeline = self._wrap_behavior(behavior, request, pipeline)
+        return await pipeline()
+
+    @staticmethod
+    def _wrap_behavior(
+        behavior: IPipelineBehavior, request: Any, next_handler: Callable[[], Any]
+    ) -> Callable[[], Any]:
+        return lambda: behavior.handle(request, next_handler)
+
+
+def build(mediator_type: type, depth: int, skipped: int = 0) -> MediatorWithPipeline:
+    """Create a mediator with ``depth`` active and ``skipped`` inactive behaviors."""
+    mediator = mediator_type()
+    mediator.register_request_handler(PingRequest, PingHandler())
+    for _ in range(depth):
+        mediator.add_behavior(PassThroughBehavior())
+    for _ in range(skipped):
+        mediator.add_behavior(SkippedBehavior())
+    return mediator
+
+
+async def measure(mediator: MediatorWithPipeline, iterations: int) -> float:
+    """Return the mean time per send in microseconds."""
+    request = PingRequest()
+    for _ in range(min(iterations, 1000)):
+        await mediator.send(request)
+    start = time.perf_counter()
+    for _ in range(iterations):
+        await mediator.send(request)
+    return (time.perf_counter() - start) / iterations * 1e6
+
+
+async def main(iterations: int) -> None:
+    """Print a table of per-send overhead for each pipeline depth."""
+    print(f"{'depth':>5} {'legacy us':>10} {'compiled us':>12} {'speedup':>8}")
+    for depth in DEPTHS:
+        legacy = await measure(build(LegacyMediatorWithPipeline, depth), iterations)
+        compiled = await measure(build(MediatorWithPipeline, depth), iterations)
+        print(f"{depth:>5} {legacy:>10.2f} {compiled:>12.2f} {legacy / compiled:>7.2f}x")
+
+    depth = 4
+    legacy = await measure(
+        build(LegacyMediatorWithPipeline, depth, skipped=depth), iterations
+    )
+    compiled = await measure(build(MediatorWithPipeline, depth, skipped=depth), iterations)
+    print(
+        f"\n{depth} active + {depth} non-applicable behaviors: "
+        f"legacy {legacy:.2f} us, compiled {compiled:.2f} us"
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=50_000)
+    asyncio.run(main(parser.parse_args().iterations))
@@ -0,0 +1,624 @@
+"""Benchmark suite with JSON results for comparing commits.
+
+Times the mediator (``Mediator.send``, ``MediatorWithPipeline.send`` at
+several pipeline depths, ``Mediator.publish`` fan-out, exception handling),
+request validation (``Validator.validate``, ``PydanticValidationBehavior``),
+log calls and the ``SQLModelTaskRepository`` operations. Repository cases
+run against the configured PostgreSQL database (``DATABASE_URL``), one
+session scope per operation as in a request, and delete the rows they
+create; skip them with ``--no-db``.
+
+Each case runs ``--rounds`` rounds of a fixed number of operations after a
+warm-up round; the JSON report holds the per-operation time of every round
+(in microseconds) with its minimum, median and mean, plus the commit, Python
+version and platform. ``--compare`` prints the change in median against an
+earlier report and exits with status 1 if any case slowed down by more than
+``--threshold`` percent.
+
+Usage:
+    python -m benchmarks.suite [--output PATH] [--filter SUBSTRING] [--no-db]
+        [--rounds N] [--scale FACTOR] [--compare BASELINE] [--threshold PCT]
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import (
+    Any,
+    AsyncContextManager,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Optional,
+)
+
+# Log only warnings from the code under test: the cases time the code, not
+# the rendering of its debug and info records (the logging cases configure
+# their own loggers). Must be set before the application modules load.
+os.environ.setdefault("LOG_LEVEL", "warning")
+
+import structlog
+from pydantic import BaseModel
+from sqlalchemy.exc import OperationalError, SQLAlchemyError
+from sqlmodel import col, delete
+
+from app.src.application.tasks.commands.task_create import TaskCreateCommand
+from app.src.core.mediator.abstractions import (
+    INotification,
+    INotificationHandler,
+    IRequest,
+    IRequestHandler,
+)
+from app.src.core.mediator.behaviors import (
+    ExceptionHandlingBehavior,
+    MediatorWithPipeline,
+    PydanticValidationBehavior,
+)
+from app.src.core.mediator.exceptions import (
+    ExceptionHandlerRegistry,
+    IExceptionHandler,
+)
+from app.src.core.mediator.logger import (
+    QueueLogger,
+    QueueLogSink,
+    add_timestamp,
+    hand_off,
+)
+from app.src.core.mediator.mediator import Mediator, PublishStrategy
+from app.src.core.mediator.validation import Validator
+from app.src.domain.aggregates.entities.task import Task
+from app.src.infrastructure.database.config import async_engine, async_session_factory
+from app.src.infrastructure.database.context import session_scope
+from app.src.infrastructure.repositories import SQLModelTaskRepository
+from benchmarks.pipeline_overhead import PingHandler, PingRequest, build
+
+RESULTS_DIR = Path(__file__).parent / "results"
+
+Operation = Callable[[], Awaitable[Any]]
+
+
+class Case:
+    """A named benchmark.
+
+    ``setup`` is an async context manager factory, called with the number of
+    operations that will run (warm-up included), yielding the operation to
+    time; everything it does before and after the yield is excluded from the
+    measurement.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        setup: Callable[[int], AsyncContextManager[Operation]],
+        iterations: int,
+        needs_db: bool = False,
+    ):
+        self.name = name
+        self.setup = setup
+        self.iterations = iterations
+        self.needs_db = needs_db
+
+
+CASES: List[Case] = []
+
+
+def case(
+    name: str, iterations: int, needs_db: bool = False
+) -> Callable[[Callable[[int], AsyncIterator[Operation]]], Callable[..., Any]]:
+    """Register an async generator yielding an operation as a benchmark."""
+
+    def register(
+        function: Callable[[int], AsyncIterator[Operation]],
+    ) -> Callable[..., Any]:
+        CASES.append(Case(name, asynccontextmanager(function), iterations, needs_db))
+        return function
+
+    return register
+
+
+# Mediator ---------------------------------------------------------------------
+
+
+@case("mediator.send", iterations=50_000)
+async def mediator_send(operations: int) -> AsyncIterator[Operation]:
+    mediator = Mediator()
+    mediator.register_request_handler(PingRequest, PingHandler())
+    request = PingRequest()
+    yield lambda: mediator.send(request)
+
+
+def _pipeline_case(depth: int) -> None:
+    @case(f"pipeline.send[depth={depth}]", iterations=50_000)
+    async def pipeline_send(operations: int) -> AsyncIterator[Operation]:
+        mediator = build(MediatorWithPipeline, depth)
+        mediator.freeze()
+        request = PingRequest()
+        yield lambda: mediator.send(request)
+
+
+for _depth in (0, 1, 4, 16):
+    _pipeline_case(_depth)
+
+
+class PingNotification(INotification):
+    """Notification with no payload."""
+
+
+class NoopNotificationHandler(INotificationHandler[PingNotification]):
+    """Handler that does nothing."""
+
+    async def handle(self, notification: PingNotification) -> None:
+        return None
+
+
+def _publish_case(handlers: int, strategy: PublishStrategy) -> None:
+    @case(f"mediator.publish[{strategy.value},handlers={handlers}]", iterations=20_000)
+    async def publish(operations: int) -> AsyncIterator[Operation]:
+        mediator = Mediator()
+        for _ in range(handlers):
+            mediator.register_notification_handler(
+                PingNotification, NoopNotificationHandler()
+            )
+        mediator.configure_publish(PingNotification, strategy)
+        mediator.freeze()
+        notification = PingNotification()
+        yield lambda: mediator.publish(notification)
+
+
+for _handlers in (1, 4, 16):
+    for _strategy in PublishStrategy:
+        _publish_case(_handlers, _strategy)
+
+
+class FailingHandler(IRequestHandler[PingRequest, int]):
+    """Handler failing with a subclass of the registered exception type."""
+
+    async def handle(self, request: PingRequest) -> int:
+        raise OperationalError("SELECT 1", {}, ConnectionError("server closed"))
+
+
+class ErrorResponseHandler(IExceptionHandler):
+    """Exception handler returning a constant."""
+
+    def handle(self, exception: Exception, request: Any) -> Any:
+        return -1
+
+
+@case("pipeline.send[exception_handling]", iterations=20_000)
+async def exception_handling(operations: int) -> AsyncIterator[Operation]:
+    registry = ExceptionHandlerRegistry()
+    registry.register(SQLAlchemyError, ErrorResponseHandler())
+    mediator = MediatorWithPipeline()
+    mediator.register_request_handler(PingRequest, FailingHandler())
+    mediator.add_behavior(ExceptionHandlingBehavior(registry))
+    mediator.freeze()
+    request = PingRequest()
+    yield lambda: mediator.send(request)
+
+
+# Validation -------------------------------------------------------------------
+
+
+class SampleRequest:
+    """Plain request object with the fields of a task."""
+
+    def __init__(self) -> None:
+        self.title = "Write the benchmark suite"
+        self.description = "Measure before optimizing"
+        self.priority = 3
+        self.completed = False
+
+
+def sample_validator(rules: int) -> Validator:
+    """Build a validator with ``rules`` passing rules over four fields."""
+    validator = Validator()
+    checks = (
+        ("title", lambda value: bool(value) and len(value) <= 200),
+        ("description", lambda value: value is None or len(value) <= 2000),
+        ("priority", lambda value: 1 <= value <= 5),
+        ("completed", lambda value: isinstance(value, bool)),
+    )
+    for number in range(rules):
+        field, predicate = checks[number % len(checks)]
+        validator.rule_for(field).must(predicate).with_message(f"Invalid {field}")
+    return validator
+
+
+def _validator_case(rules: int) -> None:
+    @case(f"validator.validate[rules={rules}]", iterations=50_000)
+    async def validate(operations: int) -> AsyncIterator[Operation]:
+        validator = sample_validator(rules)
+        request = SampleRequest()
+
+        async def operation() -> Any:
+            return validator.validate(request)
+
+        yield operation
+
+
+for _rules in (1, 4, 16):
+    _validator_case(_rules)
+
+
+@case("validator.validate_many[1000]", iterations=200)
+async def validate_many(operations: int) -> AsyncIterator[Operation]:
+    validator = sample_validator(4)
+    requests = [SampleRequest() for _ in range(1000)]
+    for request in requests[::100]:
+        request.title = ""
+
+    async def operation() -> Any:
+        return validator.validate_many(requests)
+
+    yield operation
+
+
+class ValidatedCreateHandler(IRequestHandler[Any, str]):
+    """Handler standing in for task creation."""
+
+    async def handle(self, request: Any) -> str:
+        return request.title
+
+
+def _pydantic_validation_case(name: str, command: Any, **options: Any) -> None:
+    @case(f"pipeline.send[pydantic_validation,{name}]", iterations=20_000)
+    async def pydantic_validation(operations: int) -> AsyncIterator[Operation]:
+        mediator = MediatorWithPipeline()
+        mediator.register_request_handler(type(command), ValidatedCreateHandler())
+        mediator.add_behavior(PydanticValidationBehavior(**options))
+        mediator.freeze()
+        yield lambda: mediator.send(command)
+
+
+class UntrackedTaskCreateCommand(BaseModel, IRequest[str]):
+    """``TaskCreateCommand`` as a plain model, revalidated on every send."""
+
+    title: str
+    description: Optional[str] = None
+    priority: Optional[int] = 1
+    completed: Optional[bool] = False
+
+
+_COMMAND_FIELDS = {"title": "Validate me", "description": "x" * 100}
+# Validated on construction: passes through
+_pydantic_validation_case("validated", TaskCreateCommand(**_COMMAND_FIELDS))
+# Built without validation: revalidated
+_pydantic_validation_case(
+    "constructed", TaskCreateCommand.model_construct(**_COMMAND_FIELDS)
+)
+# Not a ValidatedModel, as every request was before: revalidated
+_pydantic_validation_case("untracked", UntrackedTaskCreateCommand(**_COMMAND_FIELDS))
+_pydantic_validation_case(
+    "strict",
+    TaskCreateCommand(**_COMMAND_FIELDS),
+    strict_types=[TaskCreateCommand],
+)
+
+
+# Logging ----------------------------------------------------------------------
+
+
+@case("logging.info[sync_render]", iterations=20_000)
+async def logging_sync_render(operations: int) -> AsyncIterator[Operation]:
+    # Previous configuration: ISO timestamp, JSON rendering and a write per call
+    with open(os.devnull, "w") as stream:
+        log = structlog.wrap_logger(
+            structlog.WriteLogger(stream),
+            processors=[
+                structlog.processors.add_log_level,
+                structlog.processors.TimeStamper(fmt="iso"),
+                structlog.processors.JSONRenderer(),
+            ],
+            wrapper_class=structlog.make_filtering_bound_logger(logging.DEBUG),
+        )
+
+        async def operation() -> Any:
+            log.info("Task created", task_id="0190d6b1", title="Benchmark")
+
+        yield operation
+
+
+@case("logging.info[queued]", iterations=20_000)
+async def logging_queued(operations: int) -> AsyncIterator[Operation]:
+    with open(os.devnull, "w") as stream:
+        sink = QueueLogSink(stream, max_queue_size=operations)
+        sink.start()
+        log = structlog.wrap_logger(
+            QueueLogger(sink),
+            processors=[
+                structlog.processors.add_log_level,
+                add_timestamp,
+                structlog.processors.format_exc_info,
+                hand_off,
+            ],
+            wrapper_class=structlog.make_filtering_bound_logger(logging.DEBUG),
+        )
+
+        async def operation() -> Any:
+            log.info("Task created", task_id="0190d6b1", title="Benchmark")
+
+        yield operation
+        sink.close()
+
+
+# Repository -------------------------------------------------------------------
+
+TITLE_PREFIX = "benchmark suite"
+
+
+@asynccontextmanager
+async def _repository() -> AsyncIterator[SQLModelTaskRepository]:
+    """Yield a repository; delete the rows created by the suite afterwards."""
+    try:
+        yield SQLModelTaskRepository()
+    finally:
+        async with async_session_factory() as session:
+            await session.exec(  # type: ignore[call-overload]
+                delete(Task).where(col(Task.title).startswith(TITLE_PREFIX))
+            )
+            await session.commit()
+
+
+async def _seed(repository: SQLModelTaskRepository, count: int) -> List[Task]:
+    """Insert ``count`` tasks and return them."""
+    tasks = [Task(title=f"{TITLE_PREFIX} seed {n}") for n in range(count)]
+    async with _scope():
+        return await repository.create_many(tasks)
+
+
+def _scope() -> AsyncContextManager[Any]:
+    """Open a request-like session scope."""
+    return session_scope(async_session_factory)
+
+
+@case("repository.create", iterations=500, needs_db=True)
+async def repository_create(operations: int) -> AsyncIterator[Operation]:
+    async with _repository() as repository:
+
+        async def operation() -> Any:
+            async with _scope():
+                return await repository.create(Task(title=f"{TITLE_PREFIX} create"))
+
+        yield operation
+
+
+@case("repository.create_many[100]", iterations=50, needs_db=True)
+async def repository_create_many(operations: int) -> AsyncIterator[Operation]:
+    async with _repository() as repository:
+
+        async def operation() -> Any:
+            tasks = [Task(title=f"{TITLE_PREFIX} create_many") for _ in range(100)]
+            async with _scope():
+                return await repository.create_many(tasks)
+
+        yield operation
+
+
+@case("repository.get_by_id", iterations=1000, needs_db=True)
+async def repository_get_by_id(operations: int) -> AsyncIterator[Operation]:
+    async with _repository() as repository:
+        task_id = (await _seed(repository, 1))[0].id
+
+        async def operation() -> Any:
+            async with _scope():
+                return await repository.get_by_id(task_id)
+
+        yield operation
+
+
+@case("repository.get_page[50]", iterations=500, needs_db=True)
+async def repository_get_page(operations: int) -> AsyncIterator[Operation]:
+    async with _repository() as repository:
+        await _seed(repository, 200)
+
+        async def operation() -> Any:
+            async with _scope():
+                return await repository.get_page(limit=50)
+
+        yield operation
+
+
+@case("repository.count", iterations=500, needs_db=True)
+async def repository_count(operations: int) -> AsyncIterator[Operation]:
+    async with _repository() as repository:
+        await _seed(repository, 200)
+
+        async def operation() -> Any:
+            async with _scope():
+                return await repository.count()
+
+        yield operation
+
+
+@case("repository.update", iterations=500, needs_db=True)
+async def repository_update(operations: int) -> AsyncIterator[Operation]:
+    async with _repository() as repository:
+        task_id = (await _seed(repository, 1))[0].id
+
+        async def operation() -> Any:
+            # Loaded in the same session, as an update handler would
+            async with _scope():
+                task = await repository.get_by_id(task_id)
+                task.priority = task.priority % 5 + 1
+                return await repository.update(task)
+
+        yield operation
+
+
+@case("repository.delete", iterations=500, needs_db=True)
+async def repository_delete(operations: int) -> AsyncIterator[Operation]:
+    async with _repository() as repository:
+        ids = iter([task.id for task in await _seed(repository, operations)])
+
+        async def operation() -> Any:
+            async with _scope():
+                return await repository.delete(next(ids))
+
+        yield operation
+
+
+# Runner -----------------------------------------------------------------------
+
+
+def warmup_iterations(iterations: int) -> int:
+    """Number of untimed operations run before the first round."""
+    return max(1, iterations // 10)
+
+
+async def measure(
+    operation: Operation, iterations: int, rounds: int
+) -> Dict[str, Any]:
+    """Time ``rounds`` rounds of ``iterations`` operations after a warm-up.
+
+    Returns:
+        Dict[str, Any]: Microseconds per operation for every round, with
+        their minimum, median and mean.
+    """
+    for _ in range(warmup_iterations(iterations)):
+        await operation()
+    samples: List[float] = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        for _ in range(iterations):
+            await operation()
+        samples.append((time.perf_counter() - start) / iterations * 1e6)
+    return {
+        "iterations": iterations,
+        "rounds_us": [round(sample, 3) for sample in samples],
+        "min_us": round(min(samples), 3),
+        "median_us": round(statistics.median(samples), 3),
+        "mean_us": round(statistics.fmean(samples), 3),
+    }
+
+
+async def run_cases(
+    cases: List[Case], rounds: int, scale: float
+) -> Dict[str, Dict[str, Any]]:
+    """Run ``cases`` in order and print one line per case."""
+    results: Dict[str, Dict[str, Any]] = {}
+    try:
+        for benchmark in cases:
+            iterations = max(1, int(benchmark.iterations * scale))
+            operations = warmup_iterations(iterations) + iterations * rounds
+            async with benchmark.setup(operations) as operation:
+                result = await measure(operation, iterations, rounds)
+            results[benchmark.name] = result
+            print(
+                f"{benchmark.name:<45} {result['median_us']:>12.2f} us"
+                f"  (min {result['min_us']:.2f})"
+            )
+    finally:
+        if any(benchmark.needs_db for benchmark in cases):
+            await async_engine.dispose()
+    return results
+
+
+def compare(
+    results: Dict[str, Dict[str, Any]],
+    baseline: Dict[str, Dict[str, Any]],
+    threshold: float,
+) -> List[str]:
+    """Print median changes against ``baseline``; return the regressed cases."""
+    regressions: List[str] = []
+    print(f"\n{'case':<45} {'baseline us':>12} {'current us':>12} {'change':>8}")
+    for name, result in results.items():
+        previous = baseline.get(name)
+        if previous is None:
+            print(f"{name:<45} {'-':>12} {result['median_us']:>12.2f} {'new':>8}")
+            continue
+        change = (result["median_us"] / previous["median_us"] - 1) * 100
+        flag = ""
+        if change > threshold:
+            regressions.append(name)
+            flag = "  regression"
+        print(
+            f"{name:<45} {previous['median_us']:>12.2f} "
+            f"{result['median_us']:>12.2f} {change:>+7.1f}%{flag}"
+        )
+    return regressions
+
+
+def git_revision() -> Optional[str]:
+    """Return the current commit, suffixed with ``-dirty`` for local changes."""
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+        dirty = subprocess.run(
+            ["git", "status", "--porcelain", "--untracked-files=no"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return f"{commit}-dirty" if dirty else commit
+
+
+def main() -> int:
+    """Run the suite, write the JSON report and optionally compare it."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--output", type=Path, help="JSON report path")
+    parser.add_argument("--filter", default="", help="Run cases containing this")
+    parser.add_argument("--no-db", action="store_true", help="Skip database cases")
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument(
+        "--scale", type=float, default=1.0, help="Multiply iteration counts"
+    )
+    parser.add_argument("--compare", type=Path, help="Baseline JSON report")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=10.0,
+        help="Percent slowdown of the median reported as a regression",
+    )
+    args = parser.parse_args()
+
+    cases = [
+        benchmark
+        for benchmark in CASES
+        if args.filter in benchmark.name and not (args.no_db and benchmark.needs_db)
+    ]
+    revision = git_revision()
+    results = asyncio.run(run_cases(cases, args.rounds, args.scale))
+
+    report = {
+        "revision": revision,
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "rounds": args.rounds,
+        "results": results,
+    }
+    output = args.output or RESULTS_DIR / f"{revision or 'unknown'}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(report, indent=2) + "\n")
+    print(f"\nResults written to {output}")
+
+    if args.compare is not None:
+        baseline = json.loads(args.compare.read_text())
+        print(f"Baseline: {args.compare} (revision {baseline.get('revision')})")
+        regressions = compare(results, baseline["results"], args.threshold)
+        if regressions:
+            print(f"\n{len(regressions)} case(s) slower by more than {args.threshold}%")
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,147 @@
+"""Title search latency: unindexed LIKE scan versus trigram search.
+
+Generates a dataset inside a transaction on the configured database
+(``DATABASE_URL``), times the old ``title LIKE '%x%'`` query with index scans
+disabled (a sequential scan, as before the trigram index existed) against
+``SQLModelTaskRepository.search``, then rolls everything back. It ends with
+the ``EXPLAIN ANALYZE`` plan of one ``search`` call and reports whether the
+plan uses ``ix_task_title_trgm``. The database needs the ``pg_trgm``
+extension and the trigram index (``migrations/0003_task_indexes.sql``).
+
+Usage:
+    python -m benchmarks.title_search [--rows N] [--queries N]
+"""
+
+import argparse
+import asyncio
+import random
+import string
+import time
+from typing import Any, Awaitable, Callable, List, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncConnection
+from sqlmodel import col, select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.src.domain.aggregates.entities.task import Task
+from app.src.infrastructure.database.config import async_engine
+from app.src.infrastructure.repositories.task_repository import SQLModelTaskRepository
+
+SEED = 7
+BATCH_SIZE = 5_000
+TRIGRAM_INDEX = "ix_task_title_trgm"
+
+
+def make_vocabulary(size: int, rng: random.Random) -> List[str]:
+    """Return ``size`` pseudo-words of 4 to 10 letters."""
+    return [
+        "".join(rng.choices(string.ascii_lowercase, k=rng.randint(4, 10)))
+        for _ in range(size)
+    ]
+
+
+async def timed(call: Callable[[], Awaitable[object]], repeats: int = 5) -> float:
+    """Return the best wall time of ``call`` in milliseconds."""
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        await call()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+async def explain(
+    connection: AsyncConnection, call: Callable[[], Awaitable[object]]
+) -> List[str]:
+    """Return the ``EXPLAIN ANALYZE`` plan of the last statement ``call`` runs."""
+    captured: List[Tuple[str, Any]] = []
+
+    def capture(*args: Any) -> None:
+        # before_cursor_execute(conn, cursor, statement, parameters, ...)
+        captured.append((args[2], args[3]))
+
+    event.listen(connection.sync_connection, "before_cursor_execute", capture)
+    try:
+        await call()
+    finally:
+        event.remove(connection.sync_connection, "before_cursor_execute", capture)
+    statement, parameters = captured[-1]
+    result = await connection.exec_driver_sql(
+        f"EXPLAIN (ANALYZE, BUFFERS) {statement}", parameters
+    )
+    return [line for (line,) in result.all()]
+
+
+async def main(rows: int, queries: int) -> None:
+    """Populate the dataset and print per-query timings."""
+    rng = random.Random(SEED)
+    vocabulary = make_vocabulary(2_000, rng)
+
+    async with async_engine.connect() as connection:
+        installed = await connection.exec_driver_sql(
+            "SELECT 1 FROM pg_extension WHERE extname = 'pg_trgm'"
+        )
+        if installed.first() is None:
+            raise SystemExit(
+                "pg_trgm is not installed; apply migrations/0003_task_indexes.sql"
+            )
+        transaction = await connection.begin()
+        session = AsyncSession(bind=connection, join_transaction_mode="create_savepoint")
+        repository = SQLModelTaskRepository(lambda: session)
+        try:
+            for offset in range(0, rows, BATCH_SIZE):
+                await repository.create_many(
+                    [
+                        Task(title=" ".join(rng.sample(vocabulary, rng.randint(3, 6))))
+                        for _ in range(min(BATCH_SIZE, rows - offset))
+                    ]
+                )
+            await connection.exec_driver_sql("ANALYZE task")
+            print(f"dataset: {rows} generated rows\n")
+            print(f"{'term':<12} {'LIKE scan ms':>13} {'trigram ms':>11} {'speedup':>8}")
+
+            for term in rng.sample(vocabulary, queries):
+                fragment = term[1:-1]
+
+                async def like_scan() -> object:
+                    statement = (
+                        select(Task)
+                        .where(col(Task.title).like(f"%{fragment}%"))
+                        .limit(20)
+                    )
+                    return (await session.exec(statement)).all()
+
+                async def trigram_search() -> object:
+                    return await repository.search(fragment, limit=20)
+
+                await connection.exec_driver_sql("SET LOCAL enable_bitmapscan = off")
+                await connection.exec_driver_sql("SET LOCAL enable_indexscan = off")
+                scan_ms = await timed(like_scan)
+                await connection.exec_driver_sql("RESET enable_bitmapscan")
+                await connection.exec_driver_sql("RESET enable_indexscan")
+                search_ms = await timed(trigram_search)
+                print(
+                    f"{fragment:<12} {scan_ms:>13.2f} {search_ms:>11.2f} "
+                    f"{scan_ms / search_ms:>7.1f}x"
+                )
+
+            plan = await explain(
+                connection, lambda: repository.search(fragment, limit=20)
+            )
+            print(f"\nplan of search({fragment!r}):")
+            print("\n".join(plan))
+            used = any(TRIGRAM_INDEX in line for line in plan)
+            print(f"\n{TRIGRAM_INDEX} used: {'yes' if used else 'NO'}")
+        finally:
+            await session.close()
+            await transaction.rollback()
+    await async_engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=200_000)
+    parser.add_argument("--queries", type=int, default=5)
+    arguments = parser.parse_args()
+    asyncio.run(main(arguments.rows, arguments.queries))
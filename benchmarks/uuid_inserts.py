@@ -0,0 +1,120 @@
+"""Insert throughput: random uuid4 text keys versus time-ordered uuid7 keys.
+
+Creates two scratch tables inside a transaction on the configured database
+(``DATABASE_URL``): one keyed like the old task table (uuid4 strings in a
+varchar primary key, plus the duplicate index on ``id``) and one keyed like the
+current table (uuid7 values in a native ``uuid`` primary key). Both also carry
+the ``(created_at, id)`` pagination index. Rows are inserted in batches and the
+insert rate and final index sizes are printed, then everything is rolled back.
+
+Usage:
+    python -m benchmarks.uuid_inserts [--rows N] [--batch-size N]
+"""
+
+import argparse
+import asyncio
+import time
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List
+
+from app.src.core.utils import generate_uuid, generate_uuid7
+from app.src.infrastructure.database.config import async_engine
+
+VARIANTS: Dict[str, Dict[str, Any]] = {
+    "uuid4 varchar": {
+        "id_type": "varchar",
+        "generate": generate_uuid,
+        "extra_indexes": ["CREATE INDEX {table}_id ON {table} (id)"],
+    },
+    "uuid7 uuid": {
+        "id_type": "uuid",
+        "generate": generate_uuid7,
+        "extra_indexes": [],
+    },
+}
+
+
+async def run_variant(
+    connection: Any,
+    table: str,
+    id_type: str,
+    generate: Callable[[], Any],
+    extra_indexes: List[str],
+    rows: int,
+    batch_size: int,
+) -> Dict[str, float]:
+    """Insert ``rows`` rows into a fresh table and return rate and index sizes."""
+    await connection.execute(
+        f"CREATE TABLE {table} ("
+        f"id {id_type} PRIMARY KEY, "
+        "title varchar NOT NULL, "
+        "created_at timestamptz NOT NULL)"
+    )
+    await connection.execute(
+        f"CREATE INDEX {table}_created_at_id ON {table} (created_at, id)"
+    )
+    for statement in extra_indexes:
+        await connection.execute(statement.format(table=table))
+
+    insert = f"INSERT INTO {table} (id, title, created_at) VALUES ($1, $2, $3)"
+    start = time.perf_counter()
+    for offset in range(0, rows, batch_size):
+        await connection.executemany(
+            insert,
+            [
+                (generate(), f"task {offset + i}", datetime.now(timezone.utc))
+                for i in range(min(batch_size, rows - offset))
+            ],
+        )
+    elapsed = time.perf_counter() - start
+
+    index_bytes = await connection.fetchval(
+        "SELECT coalesce(sum(pg_relation_size(indexrelid)), 0) "
+        "FROM pg_index WHERE indrelid = $1::regclass",
+        table,
+    )
+    primary_key_bytes = await connection.fetchval(
+        "SELECT pg_relation_size($1::regclass)", f"{table}_pkey"
+    )
+    return {
+        "rows_per_second": rows / elapsed,
+        "primary_key_mb": primary_key_bytes / 2**20,
+        "all_indexes_mb": index_bytes / 2**20,
+    }
+
+
+async def main(rows: int, batch_size: int) -> None:
+    """Run every variant and print insert rates and index sizes."""
+    async with async_engine.connect() as connection:
+        transaction = await connection.begin()
+        # Issue a statement so the driver-level transaction is open before the
+        # raw asyncpg connection is used directly.
+        await connection.exec_driver_sql("SELECT 1")
+        raw_connection = await connection.get_raw_connection()
+        driver_connection = raw_connection.driver_connection
+        try:
+            print(f"dataset: {rows} rows per variant, batches of {batch_size}\n")
+            print(f"{'keys':<14} {'rows/s':>10} {'pkey MB':>9} {'indexes MB':>11}")
+            for number, (name, variant) in enumerate(VARIANTS.items()):
+                result = await run_variant(
+                    driver_connection,
+                    f"bench_uuid_{number}",
+                    rows=rows,
+                    batch_size=batch_size,
+                    **variant,
+                )
+                print(
+                    f"{name:<14} {result['rows_per_second']:>10.0f} "
+                    f"{result['primary_key_mb']:>9.1f} {result['all_indexes_mb']:>11.1f}"
+                )
+        finally:
+            await transaction.rollback()
+    await async_engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=500_000)
+    parser.add_argument("--batch-size", type=int, default=1_000)
+    arguments = parser.parse_args()
+    asyncio.run(main(arguments.rows, arguments.batch_size))
@@ -0,0 +1,101 @@
+"""Fluent validation: interpreted rules versus compiled validators.
+
+Compares the previous ``Validator.validate``, which walked the rules with a
+``getattr`` per rule and built a ``ValidationErrorDetail`` per failure, with
+the compiled validator, for valid and invalid requests and for a batch of
+requests through ``validate_many``.
+
+Usage:
+    python -m benchmarks.validator_compile [--iterations N]
+"""
+
+import argparse
+import time
+from typing import Any, Callable, Dict, List
+
+from app.src.core.mediator.validation import ValidationErrorDetail, Validator
+from benchmarks.suite import SampleRequest, sample_validator
+
+RULE_COUNTS = (1, 4, 16)
+BATCH_SIZE = 1000
+
+
+class LegacyValidator(Validator):
+    """Previous behavior: interpret the rules on every call."""
+
+    def validate(self, instance: Any) -> List[Dict[str, str]]:
+        errors: List[ValidationErrorDetail] = []
+        for rule in self._rules:
+            errors.extend(rule.validate(instance))
+        return [e.to_dict() for e in errors]
+
+
+def build(rules: int, legacy: bool) -> Validator:
+    """Create the sample validator with ``rules`` rules."""
+    validator = sample_validator(rules)
+    if legacy:
+        validator.__class__ = LegacyValidator
+    return validator
+
+
+def measure(function: Callable[[], Any], iterations: int) -> float:
+    """Return the mean time per call in microseconds."""
+    for _ in range(min(iterations, 1000)):
+        function()
+    start = time.perf_counter()
+    for _ in range(iterations):
+        function()
+    return (time.perf_counter() - start) / iterations * 1e6
+
+
+def main(iterations: int) -> None:
+    """Print per-call times of both implementations."""
+    valid = SampleRequest()
+    invalid = SampleRequest()
+    invalid.title = ""
+    invalid.priority = 9
+
+    print(
+        f"{'rules':>5} {'request':>8} {'legacy us':>10} "
+        f"{'compiled us':>12} {'speedup':>8}"
+    )
+    for rules in RULE_COUNTS:
+        for label, request in (("valid", valid), ("invalid", invalid)):
+            legacy = build(rules, legacy=True)
+            compiled = build(rules, legacy=False)
+            before = measure(lambda: legacy.validate(request), iterations)
+            after = measure(lambda: compiled.validate(request), iterations)
+            print(
+                f"{rules:>5} {label:>8} {before:>10.2f} {after:>12.2f} "
+                f"{before / after:>7.2f}x"
+            )
+
+    # Mostly valid batch, as in a bulk import
+    batch = [valid] * BATCH_SIZE
+    batch[::100] = [invalid] * len(batch[::100])
+    legacy = build(4, legacy=True)
+    compiled = build(4, legacy=False)
+
+    def loop() -> Dict[int, List[Dict[str, str]]]:
+        invalid_items = {}
+        for index, item in enumerate(batch):
+            errors = legacy.validate(item)
+            if errors:
+                invalid_items[index] = errors
+        return invalid_items
+
+    assert loop() == compiled.validate_many(batch)
+    batches = max(1, iterations // BATCH_SIZE)
+    before = measure(loop, batches)
+    after = measure(lambda: compiled.validate_many(batch), batches)
+    print(
+        f"\nvalidate_many, {BATCH_SIZE} requests (1% invalid), 4 rules: "
+        f"legacy loop {before:.0f} us, compiled {after:.0f} us "
+        f"({before / after:.2f}x)"
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=100_000)
+    main(parser.parse_args().iterations)
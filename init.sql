@@ -8,4 +8,6 @@
 GRANT ALL PRIVILEGES ON DATABASE taskdb TO taskuser;
 
 -- Create extensions if needed
--- CREATE EXTENSION IF NOT EXISTS "uuid-ossp";
\ No newline at end of file
+-- CREATE EXTENSION IF NOT EXISTS "uuid-ossp";
+-- Trigram matching, used by the task title search index
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
\ No newline at end of file
@@ -0,0 +1,13 @@
+-- Store task timestamps as timestamptz.
+--
+-- The asyncpg driver refuses timezone-aware datetimes for
+-- "timestamp without time zone" columns. Existing values were written in UTC,
+-- so they are reinterpreted as such.
+
+BEGIN;
+
+ALTER TABLE task
+    ALTER COLUMN created_at TYPE timestamptz USING created_at AT TIME ZONE 'UTC',
+    ALTER COLUMN updated_at TYPE timestamptz USING updated_at AT TIME ZONE 'UTC';
+
+COMMIT;
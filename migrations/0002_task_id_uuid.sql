@@ -0,0 +1,19 @@
+-- Store task IDs as native uuid.
+--
+-- IDs were 36-character strings in a varchar primary key. The uuid type takes
+-- 16 bytes and compares as binary; together with the time-ordered version 7
+-- IDs the application now generates, new rows append to the right edge of the
+-- primary key index. Existing version 4 IDs are converted in place and keep
+-- their value. Indexes on id, including ix_task_created_at_id, are rebuilt by
+-- the type change.
+--
+-- ix_task_id duplicated the primary key index and is dropped.
+
+BEGIN;
+
+DROP INDEX IF EXISTS ix_task_id;
+
+ALTER TABLE task
+    ALTER COLUMN id TYPE uuid USING id::uuid;
+
+COMMIT;
@@ -0,0 +1,32 @@
+-- Add the task indexes introduced with listing, filtering and title search.
+--
+-- The application only creates tables that do not exist yet, together with
+-- their indexes; it no longer adds indexes to an existing task table at
+-- startup. A plain CREATE INDEX there locked the table against writes for the
+-- whole build and raced between workers starting at the same time.
+--
+-- CREATE INDEX CONCURRENTLY builds each index without blocking writes. It
+-- cannot run inside a transaction block, so this file has no BEGIN/COMMIT; run
+-- it with psql in its default autocommit mode. A build that fails leaves an
+-- INVALID index behind: drop it and run the file again.
+--
+-- ix_task_title_trgm needs the pg_trgm extension from PostgreSQL contrib.
+
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+-- Keyset pagination ordered on (created_at, id)
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_task_created_at_id
+    ON task (created_at, id);
+
+-- Status and priority filters, e.g. counts per (completed, priority)
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_task_completed_priority
+    ON task (completed, priority);
+
+-- Pending tasks by priority
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_task_pending_priority_created_at
+    ON task (priority, created_at)
+    WHERE NOT completed;
+
+-- Substring and similarity search on titles
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_task_title_trgm
+    ON task USING gin (title gin_trgm_ops);